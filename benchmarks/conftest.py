@@ -0,0 +1,195 @@
+"""Fixtures for the cover benchmarks.
+
+The benchmarks run the real cover classes against stand-ins for the Home Assistant instance and the
+pyRFXtrx devices and transport, so nothing is written to a serial port and no event loop other than
+the benchmark's own is needed. Home Assistant and pytest-benchmark must be installed, see
+requirements.txt.
+"""
+import asyncio
+import json
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+BASELINES_FILE = os.path.join(os.path.dirname(__file__), "baselines.json")
+
+
+def pytest_addoption(parser):
+    parser.addoption("--update-baselines", action="store_true", default=False,
+                     help="Write the results of this run to benchmarks/baselines.json")
+    parser.addoption("--require-baselines", action="store_true", default=False,
+                     help="Fail results that have no stored baseline instead of only reporting them")
+
+
+class FakeTransport:
+    """Transport that keeps count of what would have been written."""
+
+    def __init__(self):
+        self.frames = 0
+        self.bytes = 0
+
+    def send(self, data):
+        self.frames += 1
+        self.bytes += len(data)
+
+
+class FakeDevice:
+    """Stand-in for a pyRFXtrx device."""
+
+    def __init__(self, packettype, subtype, id_string):
+        self.packettype = packettype
+        self.subtype = subtype
+        self.id_string = id_string
+        self.type_string = "Fake"
+        self.cmndseqnbr = 0
+
+    def send_command(self, transport, command):
+        self.cmndseqnbr = (self.cmndseqnbr + 1) % 256
+        transport.send(bytes((0x0C, self.packettype, self.subtype, self.cmndseqnbr,
+                              0x00, 0x00, 0x00, 0x00, command, 0x00, 0x00, 0x00, 0x00)))
+
+
+class FakeEvent:
+    """Stand-in for a pyRFXtrx receive event."""
+
+    def __init__(self, device, rssi):
+        self.device = device
+        self.data = bytearray(13)
+        self.values = {"Rssi numeric": rssi}
+
+
+class _Bus:
+    def async_fire(self, event_type, event_data=None):
+        pass
+
+
+class _Services:
+    def __init__(self):
+        self.services = {}
+
+    def async_register(self, domain, service, service_func, schema=None):
+        self.services[(domain, service)] = service_func
+
+    def async_remove(self, domain, service):
+        self.services.pop((domain, service), None)
+
+
+class _Config:
+    latitude = 51.5
+    longitude = -0.1
+
+    def path(self, *path):
+        # Nothing is stored between runs, so the journal always starts empty
+        return os.path.join(os.path.dirname(__file__), ".storage_absent", *path)
+
+
+class FakeHass:
+    """Just enough of Home Assistant for the covers and the parts shared by them."""
+
+    def __init__(self, loop):
+        self.loop = loop
+        self.bus = _Bus()
+        self.services = _Services()
+        self.config = _Config()
+        self.data = {}
+
+    def async_add_executor_job(self, target, *args):
+        future = self.loop.create_future()
+        future.set_result(target(*args))
+        return future
+
+    def async_create_task(self, target):
+        return self.loop.create_task(target)
+
+    def add_job(self, target, *args):
+        self.loop.call_soon_threadsafe(self.loop.create_task, target(*args))
+
+
+class VirtualClock:
+    """Wall clock and sleep that advance instantly."""
+
+    def __init__(self):
+        self.now = 1_600_000_000.0
+        self._sleep = asyncio.sleep
+
+    def time(self):
+        return self.now
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, delay, result=None):
+        self.now += delay
+        await self._sleep(0)
+        return result
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture
+def hass(loop, monkeypatch):
+    from custom_components.rfxtrx import DATA_CLEANUP_CALLBACKS, DATA_RFXOBJECT, DOMAIN
+    from custom_components.rfxtrx.ext.cover import async_setup_cover_support
+    from custom_components.rfxtrx.ext.journal import MotionJournal
+
+    # Keep journal records in memory rather than scheduling writes to storage
+    monkeypatch.setattr(MotionJournal, "_append",
+                        lambda journal, unique_id, record: journal._appended.append((unique_id, record)))
+
+    hass = FakeHass(loop)
+    transport = FakeTransport()
+    rfx_object = type("RfxObject", (), {"transport": transport})()
+    hass.data[DOMAIN] = {DATA_CLEANUP_CALLBACKS: [], DATA_RFXOBJECT: rfx_object}
+    loop.run_until_complete(async_setup_cover_support(hass, {}))
+    hass.transport = transport
+    yield hass
+    for cleanup in hass.data[DOMAIN][DATA_CLEANUP_CALLBACKS]:
+        cleanup()
+
+
+@pytest.fixture
+def virtual_clock(monkeypatch):
+    from custom_components.rfxtrx.ext import abs_tilting_cover, transmitter
+
+    clock = VirtualClock()
+    monkeypatch.setattr(asyncio, "sleep", clock.sleep)
+    monkeypatch.setattr(abs_tilting_cover, "time", clock)
+    monkeypatch.setattr(transmitter, "time", clock)
+    return clock
+
+
+@pytest.fixture(scope="session")
+def baselines(request):
+    """Compare results with the stored baselines, or record them with --update-baselines."""
+    update = request.config.getoption("--update-baselines")
+    require = request.config.getoption("--require-baselines")
+    stored = {}
+    if os.path.exists(BASELINES_FILE):
+        with open(BASELINES_FILE) as file:
+            stored = json.load(file)
+    results = {}
+
+    def check(name, value, tolerance):
+        results[name] = value
+        if update:
+            return
+        if name not in stored:
+            assert not require, f"{name} has no baseline, record one with --update-baselines"
+            return
+        assert value <= stored[name] * (1 + tolerance), \
+            f"{name} regressed: {value:.6g} against baseline {stored[name]:.6g}"
+
+    yield check
+
+    if update:
+        stored.update(results)
+        with open(BASELINES_FILE, "w") as file:
+            json.dump(stored, file, indent=2, sort_keys=True)
+            file.write("\n")
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""Emulator of an RFXtrx transceiver on a pseudo-terminal.
+
+The emulator opens a pseudo-terminal and speaks the RFXtrx binary protocol on it, so the rfxtrx
+integration, pyRFXtrx's serial framing and its receive thread can all be exercised without
+hardware. It answers the status and start receiver commands, acknowledges each transmitted frame
+once the frame has been on air for as long as a real transceiver would take, and sends received
+packets injected by the caller. Only the standard library is needed:
+
+    python3 benchmarks/rfxtrx_emulator.py --link /tmp/rfxtrx
+
+Point the rfxtrx integration at /tmp/rfxtrx as a serial device. Lines of hex typed on stdin, such
+as 0919130400A1DB010000, are sent as received packets, and --inject with --interval sends packets
+repeatedly for load tests. A summary of the frames transmitted is printed on exit.
+"""
+import argparse
+import collections
+import os
+import pty
+import queue
+import select
+import sys
+import threading
+import time
+import tty
+
+# Seconds on air for one frame of each packet type, as AIRTIME_SEC in custom_components/rfxtrx/ext/const.py
+AIRTIME_SEC = {
+    0x19: 0.09,
+    0x1A: 0.16
+}
+DEF_AIRTIME_SEC = 0.1
+
+PACKET_TYPE_INTERFACE_CONTROL = 0x00
+PACKET_TYPE_INTERFACE_MESSAGE = 0x01
+PACKET_TYPE_TRANSMITTER_MESSAGE = 0x02
+SUBTYPE_INTERFACE_RESPONSE = 0x00
+SUBTYPE_START_RESPONSE = 0x07
+SUBTYPE_TRANSMITTER_RESPONSE = 0x01
+TRANSMITTER_ACK = 0x00
+
+CMD_RESET = 0x00
+CMD_STATUS = 0x02
+CMD_START = 0x07
+
+# Status of an RFXtrx433XL on 433.92MHz with the protocols used by the covers enabled
+STATUS_BODY = bytes([0x53, 0x1E, 0x00, 0x00, 0x0C, 0x00, 0x03, 0x00, 0x01, 0x03, 0x1C,
+                     0x00, 0x00, 0x00, 0x00, 0x00])
+START_BODY = b"Copyright RFXCOM"
+
+
+def split_packets(buffer):
+    """Remove and return the complete packets at the start of a buffer."""
+    packets = []
+    while buffer and len(buffer) >= buffer[0] + 1:
+        size = buffer[0] + 1
+        if buffer[0]:
+            packets.append(bytes(buffer[:size]))
+        del buffer[:size]
+    return packets
+
+
+def interface_response(subtype, seq, command, body):
+    """Return the response of the interface to a control command."""
+    data = bytes([PACKET_TYPE_INTERFACE_MESSAGE, subtype, seq, command]) + body
+    return bytes([len(data)]) + data
+
+
+# A reader thread splits what is written to the pseudo-terminal into packets. Control commands are
+# answered straight away, and frames to transmit are queued for a transmitter thread that holds each
+# on air for its airtime before acknowledging it, so a burst of commands is acknowledged at the rate
+# a real transceiver manages. Injected packets are written between acknowledgements.
+class RfxtrxEmulator:
+    """An RFXtrx on a pseudo-terminal."""
+
+    def __init__(self, airtime_scale=1.0):
+        self._master, self._slave = pty.openpty()
+        tty.setraw(self._slave)
+        self.path = os.ttyname(self._slave)
+        self._airtimeScale = airtime_scale
+        self._frames = queue.Queue()
+        self._writeLock = threading.Lock()
+        self._threads = []
+        self._running = False
+        self.started = threading.Event()
+        self.transmitted = collections.Counter()
+        self.airtime = 0.0
+
+    def start(self):
+        """Start answering on the pseudo-terminal."""
+        self._running = True
+        for target in (self._read, self._transmit):
+            thread = threading.Thread(target=target, name="rfxtrx-emulator", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self):
+        """Stop answering and close the pseudo-terminal."""
+        self._running = False
+        self._frames.put(None)
+        for thread in self._threads:
+            thread.join()
+        os.close(self._master)
+        os.close(self._slave)
+
+    def inject(self, packet):
+        """Send a packet as though the transceiver had received it over the air."""
+        if isinstance(packet, str):
+            packet = bytes.fromhex(packet)
+        self._write(packet)
+
+    def summary(self):
+        """Describe the frames transmitted so far."""
+        lines = ["%d frames, %.2f seconds on air" % (sum(self.transmitted.values()), self.airtime)]
+        for packettype, count in sorted(self.transmitted.items()):
+            lines.append("  type 0x%02x: %d" % (packettype, count))
+        return "\n".join(lines)
+
+    def _write(self, data):
+        with self._writeLock:
+            os.write(self._master, data)
+
+    def _read(self):
+        buffer = bytearray()
+        while self._running:
+            ready, _, _ = select.select([self._master], [], [], 0.2)
+            if not ready:
+                continue
+            try:
+                buffer.extend(os.read(self._master, 1024))
+            except OSError:
+                continue
+            for packet in split_packets(buffer):
+                self._packet(packet)
+
+    def _packet(self, packet):
+        if len(packet) < 5 or packet[1] != PACKET_TYPE_INTERFACE_CONTROL:
+            self._frames.put(packet)
+        elif packet[4] == CMD_START:
+            self._write(interface_response(SUBTYPE_START_RESPONSE, packet[3], CMD_START, START_BODY))
+            self.started.set()
+        elif packet[4] != CMD_RESET:
+            # Status, and the mode changes which are answered with the status
+            self._write(interface_response(SUBTYPE_INTERFACE_RESPONSE, packet[3], packet[4],
+                                           STATUS_BODY))
+
+    def _transmit(self):
+        while True:
+            packet = self._frames.get()
+            if packet is None:
+                return
+            airtime = AIRTIME_SEC.get(packet[1], DEF_AIRTIME_SEC) * self._airtimeScale
+            time.sleep(airtime)
+            self.transmitted[packet[1]] += 1
+            self.airtime += airtime
+            self._write(bytes([0x04, PACKET_TYPE_TRANSMITTER_MESSAGE, SUBTYPE_TRANSMITTER_RESPONSE,
+                               packet[3], TRANSMITTER_ACK]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RFXtrx emulator on a pseudo-terminal")
+    parser.add_argument("--link", help="Symbolic link to create to the pseudo-terminal")
+    parser.add_argument("--airtime-scale", type=float, default=1.0,
+                        help="Multiplier for the airtime of each frame, 0 to acknowledge at once")
+    parser.add_argument("--inject", action="append", default=[],
+                        help="Received packet in hex to send, repeatable")
+    parser.add_argument("--interval", type=float,
+                        help="Send the --inject packets every this many seconds rather than once")
+    args = parser.parse_args()
+
+    emulator = RfxtrxEmulator(args.airtime_scale)
+    emulator.start()
+    if args.link:
+        if os.path.lexists(args.link):
+            os.remove(args.link)
+        os.symlink(emulator.path, args.link)
+    print("RFXtrx emulator on " + (args.link or emulator.path), flush=True)
+
+    def inject_repeatedly():
+        while True:
+            for packet in args.inject:
+                emulator.inject(packet)
+            time.sleep(args.interval)
+
+    try:
+        if args.interval:
+            threading.Thread(target=inject_repeatedly, daemon=True).start()
+        elif args.inject:
+            emulator.started.wait()
+            for packet in args.inject:
+                emulator.inject(packet)
+        for line in sys.stdin:
+            if line.strip():
+                emulator.inject(line.strip())
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if args.link:
+            os.remove(args.link)
+        emulator.stop()
+        print(emulator.summary())
+
+
+if __name__ == "__main__":
+    main()
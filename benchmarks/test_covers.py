@@ -0,0 +1,171 @@
+"""Benchmarks for cover setup, event dispatch, state reads and motion planning at scale."""
+import asyncio
+import gc
+import tracemalloc
+import pytest
+
+pytest.importorskip("homeassistant")
+pytest.importorskip("pytest_benchmark")
+
+from homeassistant.components.rfxtrx import CONF_SIGNAL_REPETITIONS  # noqa: E402
+from homeassistant.components.rfxtrx.const import (  # noqa: E402
+    CONF_VENETIAN_BLIND_MODE,
+    CONST_VENETIAN_BLIND_MODE_EU
+)
+from custom_components.rfxtrx.ext import create_cover_entity  # noqa: E402
+from custom_components.rfxtrx.ext.const import (  # noqa: E402
+    DEVICE_PACKET_SUBTYPE_BLINDST19,
+    DEVICE_PACKET_TYPE_BLINDS1,
+    DEVICE_PACKET_TYPE_RFY
+)
+from conftest import FakeDevice, FakeEvent  # noqa: E402
+
+COVER_COUNTS = [100, 500, 2000]
+
+# Packets dispatched per round of the event benchmark
+PACKETS = 200
+
+# Covers moving at once in the planning benchmark
+MOVING_COVERS = 16
+
+# How far a result may exceed its stored baseline before the benchmark fails
+TIME_TOLERANCE = 0.5
+MEMORY_TOLERANCE = 0.1
+
+
+def _device_id(device):
+    return (f"{device.packettype:x}", f"{device.subtype:x}", device.id_string)
+
+
+def _make_devices(count):
+    """Return an even mix of Louvolite Vogue and Somfy venetian devices."""
+    devices = []
+    for index in range(count):
+        if index % 2:
+            device = FakeDevice(DEVICE_PACKET_TYPE_RFY, 0x00, f"{index:06x}")
+            info = {CONF_SIGNAL_REPETITIONS: 1,
+                    CONF_VENETIAN_BLIND_MODE: CONST_VENETIAN_BLIND_MODE_EU}
+        else:
+            device = FakeDevice(DEVICE_PACKET_TYPE_BLINDS1,
+                                DEVICE_PACKET_SUBTYPE_BLINDST19, f"{index:06x}")
+            info = {CONF_SIGNAL_REPETITIONS: 1}
+        devices.append((device, info))
+    return devices
+
+
+def _read_state(entity):
+    """Read the properties Home Assistant reads each time an entity writes its state."""
+    return (entity.available, entity.state, entity.name, entity.icon, entity.device_class,
+            entity.supported_features, entity.assumed_state, entity.state_attributes,
+            entity.device_state_attributes)
+
+
+def _attach(entity, hass, index):
+    """Give an entity the settled starting state it would have after being added to hass."""
+    entity.hass = hass
+    entity.entity_id = f"cover.bench_{index}"
+    entity.async_write_ha_state = lambda: _read_state(entity)
+    entity._init_state()
+    entity._tilt_step = entity._blindMidSteps
+    entity._lastCommandTime = 0
+
+
+def _create_covers(hass, devices):
+    covers = []
+    for index, (device, info) in enumerate(devices):
+        entity = create_cover_entity(device, _device_id(device), info)
+        _attach(entity, hass, index)
+        covers.append(entity)
+    return covers
+
+
+@pytest.mark.parametrize("count", COVER_COUNTS)
+def test_setup(benchmark, baselines, hass, count):
+    """Time to create and attach covers."""
+    devices = _make_devices(count)
+    benchmark(_create_covers, hass, devices)
+    baselines(f"setup_per_cover[{count}]",
+              benchmark.stats.stats.mean / count, TIME_TOLERANCE)
+
+
+@pytest.mark.parametrize("count", COVER_COUNTS)
+def test_handle_event(benchmark, baselines, hass, count):
+    """Cost of fanning a received packet out to every cover, as the dispatcher does."""
+    devices = _make_devices(count)
+    covers = _create_covers(hass, devices)
+    step = max(count // PACKETS, 1)
+    events = [(FakeEvent(device, index % 16), _device_id(device))
+              for index, (device, _) in enumerate(devices[::step])]
+
+    def dispatch():
+        for event, device_id in events:
+            for cover in covers:
+                cover._handle_event(event, device_id)
+
+    benchmark(dispatch)
+    baselines(f"handle_event_per_packet[{count}]",
+              benchmark.stats.stats.mean / len(events), TIME_TOLERANCE)
+
+
+@pytest.mark.parametrize("count", COVER_COUNTS)
+def test_state_read(benchmark, baselines, hass, count):
+    """Cost of the property reads behind each async_write_ha_state."""
+    covers = _create_covers(hass, _make_devices(count))
+
+    def read():
+        for cover in covers:
+            _read_state(cover)
+
+    benchmark(read)
+    baselines(f"state_read_per_cover[{count}]",
+              benchmark.stats.stats.mean / count, TIME_TOLERANCE)
+
+
+@pytest.mark.parametrize("count", COVER_COUNTS)
+def test_plan_and_execute(benchmark, baselines, hass, loop, virtual_clock, count):
+    """Time to plan and send a close, tilt, mid and open cycle for every cover on a virtual clock."""
+    covers = _create_covers(hass, _make_devices(count))
+
+    async def cycle(cover):
+        await cover.async_close_cover()
+        await cover.async_set_cover_tilt_position(tilt_position=25)
+        await cover.async_set_cover_tilt_position(tilt_position=50)
+        await cover.async_open_cover()
+
+    async def run_all():
+        # Keep within the transmit queue, as a real burst of this size would be refused
+        limit = asyncio.Semaphore(MOVING_COVERS)
+
+        async def limited(cover):
+            async with limit:
+                await cycle(cover)
+
+        await asyncio.gather(*(limited(cover) for cover in covers))
+
+    def run():
+        loop.run_until_complete(run_all())
+
+    benchmark.pedantic(run, rounds=5, iterations=1)
+    benchmark.extra_info["frames"] = hass.transport.frames
+    baselines(f"plan_and_execute_per_cover[{count}]",
+              benchmark.stats.stats.mean / count, TIME_TOLERANCE)
+
+
+@pytest.mark.parametrize("count", COVER_COUNTS)
+def test_memory_per_cover(benchmark, baselines, hass, count):
+    """Memory held by each cover once created."""
+    devices = _make_devices(count)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        covers = _create_covers(hass, devices)
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    per_cover = (after - before) / len(covers)
+    benchmark.extra_info["bytes_per_cover"] = per_cover
+    benchmark.pedantic(lambda: None, rounds=1, iterations=1)
+    baselines(f"bytes_per_cover[{count}]", per_cover, MEMORY_TOLERANCE)
@@ -0,0 +1,123 @@
+"""End-to-end load test of the covers through pyRFXtrx and the RFXtrx emulator."""
+import asyncio
+import threading
+import time
+import pytest
+
+pytest.importorskip("homeassistant")
+pytest.importorskip("pytest_benchmark")
+RFXtrx = pytest.importorskip("RFXtrx")
+
+from homeassistant.components.rfxtrx import (  # noqa: E402
+    CONF_SIGNAL_REPETITIONS,
+    get_device_id,
+    get_rfx_object
+)
+from homeassistant.components.rfxtrx.const import (  # noqa: E402
+    CONF_VENETIAN_BLIND_MODE,
+    CONST_VENETIAN_BLIND_MODE_EU
+)
+from custom_components.rfxtrx import DOMAIN  # noqa: E402
+from custom_components.rfxtrx.ext import create_cover_entity  # noqa: E402
+from custom_components.rfxtrx.ext.const import DATA_ROUTER  # noqa: E402
+from custom_components.rfxtrx.ext.router import PRIMARY_TRANSCEIVER  # noqa: E402
+from rfxtrx_emulator import RfxtrxEmulator  # noqa: E402
+from test_covers import MOVING_COVERS, TIME_TOLERANCE, _attach  # noqa: E402
+
+COVER_COUNTS = [100, 500]
+
+# Received packets injected while the covers are moving, half Vogue and half Somfy remote presses
+INJECTED_PACKETS = 100
+
+# Longest wait for the transceiver to be started or for injected packets to arrive
+CONNECT_TIMEOUT_SEC = 10
+
+
+def _event_code(index):
+    """Return the event code of a Somfy venetian blind for odd indexes, otherwise a Vogue blind."""
+    if index % 2:
+        return f"0c1a0000{index:06x}0100000000"
+    return f"0919130000{index:06x}010000"
+
+
+def _create_covers(hass, count):
+    covers = []
+    for index in range(count):
+        device = get_rfx_object(_event_code(index)).device
+        info = {CONF_SIGNAL_REPETITIONS: 1}
+        if index % 2:
+            info[CONF_VENETIAN_BLIND_MODE] = CONST_VENETIAN_BLIND_MODE_EU
+        entity = create_cover_entity(device, get_device_id(device), info)
+        _attach(entity, hass, index)
+        covers.append(entity)
+    return covers
+
+
+@pytest.fixture
+def emulator():
+    emulator = RfxtrxEmulator(airtime_scale=0)
+    emulator.start()
+    yield emulator
+    emulator.stop()
+
+
+@pytest.mark.parametrize("count", COVER_COUNTS)
+def test_end_to_end(benchmark, baselines, hass, loop, virtual_clock, emulator, count):
+    """Close and open every cover through the serial framing, executor and receive thread."""
+    covers = []
+    received = []
+    all_received = threading.Event()
+
+    # Received packets are handed to every cover on the loop, as the dispatcher does
+    def dispatch(event):
+        device_id = get_device_id(event.device)
+        for cover in covers:
+            cover._handle_event(event, device_id)
+        received.append(event)
+        if len(received) == INJECTED_PACKETS:
+            all_received.set()
+
+    def event_callback(event):
+        if isinstance(event, RFXtrx.ControlEvent):
+            loop.call_soon_threadsafe(dispatch, event)
+
+    rfx = RFXtrx.Connect(emulator.path, event_callback, transport_protocol=RFXtrx.PySerialTransport)
+    assert emulator.started.wait(CONNECT_TIMEOUT_SEC)
+
+    # Writes go through an executor thread as they do in Home Assistant
+    hass.async_add_executor_job = lambda target, *args: loop.run_in_executor(None, target, *args)
+    hass.data[DOMAIN][DATA_ROUTER].add_transport(PRIMARY_TRANSCEIVER, rfx.transport)
+    covers.extend(_create_covers(hass, count))
+
+    async def run_all():
+        limit = asyncio.Semaphore(MOVING_COVERS)
+
+        async def cycle(cover):
+            async with limit:
+                await cover.async_close_cover()
+                await cover.async_open_cover()
+
+        await asyncio.gather(*(cycle(cover) for cover in covers))
+
+    def run():
+        received.clear()
+        all_received.clear()
+        for index in range(INJECTED_PACKETS):
+            emulator.inject(_event_code(index))
+        loop.run_until_complete(run_all())
+        deadline = time.monotonic() + CONNECT_TIMEOUT_SEC
+        while not all_received.is_set() and time.monotonic() < deadline:
+            loop.run_until_complete(asyncio.sleep(0))
+        assert all_received.is_set()
+
+    try:
+        started = time.perf_counter()
+        benchmark.pedantic(run, rounds=3, iterations=1)
+        benchmark.extra_info["frames"] = sum(emulator.transmitted.values())
+        benchmark.extra_info["seconds"] = time.perf_counter() - started
+    finally:
+        rfx.close_connection()
+
+    assert sum(emulator.transmitted.values()) >= 2 * count
+    baselines(f"end_to_end_per_cover[{count}]",
+              benchmark.stats.stats.mean / count, TIME_TOLERANCE)
@@ -0,0 +1,102 @@
+"""Timing of the STOP frames ending Somfy tilts sent by many blinds at once, in real time."""
+import asyncio
+import time
+import pytest
+
+pytest.importorskip("homeassistant")
+pytest.importorskip("pytest_benchmark")
+
+from homeassistant.components.rfxtrx import CONF_SIGNAL_REPETITIONS  # noqa: E402
+from homeassistant.components.rfxtrx.const import (  # noqa: E402
+    CONF_VENETIAN_BLIND_MODE,
+    CONST_VENETIAN_BLIND_MODE_EU
+)
+from custom_components.rfxtrx import DOMAIN  # noqa: E402
+from custom_components.rfxtrx.ext import create_cover_entity  # noqa: E402
+from custom_components.rfxtrx.ext.const import (  # noqa: E402
+    AIRTIME_SEC,
+    DATA_ROUTER,
+    DEVICE_PACKET_TYPE_RFY
+)
+from custom_components.rfxtrx.ext.transmitter import airtime  # noqa: E402
+from conftest import FakeDevice  # noqa: E402
+from test_covers import _attach, _device_id  # noqa: E402
+
+TILTING_COVERS = [4, 8]
+REPETITIONS = [1, 3]
+
+CMD_SOMFY_STOP = 0x00
+
+
+class _AddressedDevice(FakeDevice):
+    """Fake device whose frames carry its address, so they can be told apart on air."""
+
+    def send_command(self, transport, command):
+        address = int(self.id_string, 16)
+        transport.send(bytes((0x0C, self.packettype, self.subtype, 0x00, (address >> 16) & 0xFF,
+                              (address >> 8) & 0xFF, address & 0xFF, 0x00, command,
+                              0x00, 0x00, 0x00, 0x00)))
+
+
+class _RecordingTransport:
+    """Transport that records when each write was made."""
+
+    def __init__(self):
+        self.writes = []
+
+    def send(self, data):
+        self.writes.append((time.monotonic(), bytes(data)))
+
+
+def _on_air(writes):
+    """Return the start on air and the frame of every packet written, one after another."""
+    busy = 0
+    packets = []
+    for written, data in writes:
+        index = 0
+        while index < len(data):
+            packet = data[index:index + data[index] + 1]
+            start = max(written, busy)
+            busy = start + airtime(packet)
+            packets.append((start, packet))
+            index += len(packet)
+    return packets
+
+
+@pytest.mark.parametrize("repetitions", REPETITIONS)
+@pytest.mark.parametrize("count", TILTING_COVERS)
+def test_concurrent_tilt_stops(benchmark, hass, loop, count, repetitions):
+    """Every blind tilted together should stop after its tilt time, however many share the air."""
+    transport = _RecordingTransport()
+    covers = []
+    for index in range(count):
+        device = _AddressedDevice(DEVICE_PACKET_TYPE_RFY, 0x00, f"{index:06x}")
+        info = {CONF_SIGNAL_REPETITIONS: repetitions,
+                CONF_VENETIAN_BLIND_MODE: CONST_VENETIAN_BLIND_MODE_EU}
+        cover = create_cover_entity(device, _device_id(device), info)
+        _attach(cover, hass, index)
+        covers.append(cover)
+    hass.data[DOMAIN][DATA_ROUTER].route(None).transport = transport
+
+    # The timed DOWN then STOP that tilts a Somfy blind from closed to its first position
+    def run():
+        transport.writes.clear()
+        loop.run_until_complete(asyncio.gather(
+            *(cover._async_send_sequence([(cover._somfy_down_command(), 0),
+                                          (CMD_SOMFY_STOP, cover._tiltPos1Sec)])
+              for cover in covers)))
+
+    benchmark.pedantic(run, rounds=1, iterations=1)
+
+    # Each repetition goes on air in turn, and the motor acts on the first of each command it hears
+    heard = {}
+    for start, packet in _on_air(transport.writes):
+        heard.setdefault(packet[4:7], {}).setdefault(packet[8], start)
+    errors = []
+    for cover in covers:
+        commands = heard[bytes.fromhex(cover._device.id_string)]
+        errors.append(abs(commands[CMD_SOMFY_STOP] - commands[cover._somfy_down_command()] -
+                          cover._tiltPos1Sec))
+
+    benchmark.extra_info["max_stop_error"] = max(errors)
+    assert max(errors) < AIRTIME_SEC[DEVICE_PACKET_TYPE_RFY]
@@ -11,17 +11,25 @@ from homeassistant.components.rfxtrx.switch import supported as switch_supported
 from homeassistant.const import (
     CONF_COMMAND_OFF,
     CONF_COMMAND_ON,
-    CONF_DEVICE_ID
+    CONF_DEVICE_ID,
+    CONF_DEVICES
 )
 from homeassistant.core import callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.device_registry import (
+    async_entries_for_config_entry,
+    async_get_registry as async_get_device_registry
+)
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.components.rfxtrx import (
     CONF_DATA_BITS,
     CONF_SIGNAL_REPETITIONS,
     get_device_id,
+    get_rfx_object,
     DOMAIN
 )
 from homeassistant.components.rfxtrx.const import (
+    CONF_AUTOMATIC_ADD,
     CONF_DATA_BITS,
     CONF_FIRE_EVENT,
     CONF_OFF_DELAY,
@@ -36,13 +44,35 @@ from homeassistant.components.rfxtrx.const import (
 from homeassistant.components.rfxtrx.config_flow import (
     none_or_int,
 )
+from .ext.const import (
+    CONF_COVER_GROUPS,
+    CONF_DISCOVER_COVERS,
+    CONF_DISCOVERY_SIGHTINGS,
+    DEF_DISCOVER_COVERS,
+    DEF_DISCOVERY_SIGHTINGS
+)
 from .ext.config_flow import(
+    apply_bulk_options,
+    bulk_options_schema,
+    device_driver,
+    parse_bulk_import,
     update_data_schema,
     update_device_options
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+CONF_MODE = "mode"
+CONF_DRIVER = "driver"
+CONF_BULK_DEVICES = "devices"
+CONF_IMPORT_DATA = "import_data"
+CONF_GROUP_NAME = "group_name"
+
+MODE_SINGLE = "single"
+MODE_BULK = "bulk"
+MODE_GROUP = "group"
+MODE_DISCOVERY = "discovery"
+
 
 class OptionsFlow(OldOptionsFlow):
     """Handle Rfxtrx options."""
@@ -51,6 +81,206 @@ class OptionsFlow(OldOptionsFlow):
         """Initialize rfxtrx options flow."""
         _LOGGER.info("Called __init__ on local OptionsFlow")
         super().__init__(config_entry)
+        self._bulk_event_codes = None
+
+    #
+    # Home Assistant's automatic add writes a device to the entry the first time it is heard, which
+    # would add a noisy cover before discovery has counted its sightings. The two options are kept
+    # exclusive whichever step writes them: the one just turned on turns the other off.
+    #
+    @callback
+    def update_config_data(self, global_options=None, devices=None):
+        """Write the entry, keeping automatic add and cover discovery from both being on."""
+        if global_options:
+            global_options = dict(global_options)
+            if global_options.get(CONF_DISCOVER_COVERS):
+                global_options[CONF_AUTOMATIC_ADD] = False
+            elif global_options.get(CONF_AUTOMATIC_ADD):
+                global_options[CONF_DISCOVER_COVERS] = False
+        super().update_config_data(global_options=global_options, devices=devices)
+
+    async def async_step_init(self, user_input=None):
+        """Choose between configuring one device and configuring many."""
+        if user_input is not None:
+            if user_input[CONF_MODE] == MODE_BULK:
+                return await self.async_step_bulk_select()
+            if user_input[CONF_MODE] == MODE_GROUP:
+                return await self.async_step_cover_group()
+            if user_input[CONF_MODE] == MODE_DISCOVERY:
+                return await self.async_step_cover_discovery()
+            return await self.async_step_prompt_options()
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_MODE, default=MODE_SINGLE): vol.In(
+                        [MODE_SINGLE, MODE_BULK, MODE_GROUP, MODE_DISCOVERY]),
+                }
+            ),
+        )
+
+    #
+    # Bulk editing applies the same options to many covers and writes the config entry once, so
+    # tuning a house full of blinds costs one entry write and one reload rather than one per blind.
+    # Devices are picked by hand or by driver, or their options are imported as YAML or CSV.
+    #
+    async def async_step_bulk_select(self, user_input=None):
+        """Select the devices to configure together, or import their options."""
+        _LOGGER.info("Called async_step_bulk_select function")
+
+        errors = {}
+        devices = self._config_entry.data[CONF_DEVICES]
+        device_objects = {}
+        for event_code in devices:
+            device_object = get_rfx_object(event_code)
+            if device_driver(device_object, devices[event_code]) is not None:
+                device_objects[event_code] = device_object
+
+        if user_input is not None:
+            if user_input.get(CONF_IMPORT_DATA):
+                try:
+                    updates = parse_bulk_import(
+                        user_input[CONF_IMPORT_DATA], device_objects, devices)
+                except vol.Invalid as err:
+                    _LOGGER.warning("Unable to import device options: %s", err)
+                    errors[CONF_IMPORT_DATA] = "invalid_import"
+                else:
+                    if updates:
+                        self.update_config_data(devices=updates)
+                    return self.async_create_entry(title="", data={})
+            else:
+                selected = user_input.get(CONF_BULK_DEVICES)
+                if not selected and user_input.get(CONF_DRIVER):
+                    selected = [event_code for event_code, device_object in device_objects.items()
+                                if device_driver(device_object, devices[event_code]) == user_input[CONF_DRIVER]]
+
+                if not selected:
+                    errors["base"] = "no_devices_selected"
+                elif len({device_driver(device_objects[event_code], devices[event_code])
+                          for event_code in selected}) > 1:
+                    errors[CONF_BULK_DEVICES] = "mixed_drivers"
+                else:
+                    self._bulk_event_codes = selected
+                    return await self.async_step_bulk_options()
+
+        names = await self._async_device_names(device_objects)
+        drivers = sorted({device_driver(device_object, devices[event_code])
+                         for event_code, device_object in device_objects.items()})
+
+        return self.async_show_form(
+            step_id="bulk_select",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(CONF_DRIVER): vol.In(drivers),
+                    vol.Optional(CONF_BULK_DEVICES): cv.multi_select(names),
+                    vol.Optional(CONF_IMPORT_DATA): str,
+                }
+            ),
+            errors=errors,
+        )
+
+    async def async_step_bulk_options(self, user_input=None):
+        """Set options on all of the selected devices. Blank fields are left as they are."""
+        _LOGGER.info("Called async_step_bulk_options function")
+
+        devices = self._config_entry.data[CONF_DEVICES]
+
+        if user_input is not None:
+            updates = {
+                event_code: apply_bulk_options(devices[event_code], user_input)
+                for event_code in self._bulk_event_codes
+            }
+            self.update_config_data(devices=updates)
+            return self.async_create_entry(title="", data={})
+
+        event_code = self._bulk_event_codes[0]
+        device_object = get_rfx_object(event_code)
+
+        return self.async_show_form(
+            step_id="bulk_options",
+            data_schema=vol.Schema(bulk_options_schema(device_object, devices[event_code])),
+            description_placeholders={"count": str(len(self._bulk_event_codes))},
+        )
+
+    #
+    # A cover group is saved as its name and the event codes of its members. Saving a group with no
+    # covers selected removes it.
+    #
+    async def async_step_cover_group(self, user_input=None):
+        """Create, change or remove a group of covers."""
+        _LOGGER.info("Called async_step_cover_group function")
+
+        devices = self._config_entry.data[CONF_DEVICES]
+        groups = dict(self._config_entry.data.get(CONF_COVER_GROUPS, {}))
+
+        if user_input is not None:
+            if user_input.get(CONF_BULK_DEVICES):
+                groups[user_input[CONF_GROUP_NAME]] = user_input[CONF_BULK_DEVICES]
+            else:
+                groups.pop(user_input[CONF_GROUP_NAME], None)
+            self.update_config_data(global_options={CONF_COVER_GROUPS: groups})
+            return self.async_create_entry(title="", data={})
+
+        event_codes = [event_code for event_code in devices
+                       if device_driver(get_rfx_object(event_code), devices[event_code]) is not None]
+        names = await self._async_device_names(event_codes)
+
+        return self.async_show_form(
+            step_id="cover_group",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_GROUP_NAME): str,
+                    vol.Optional(CONF_BULK_DEVICES): cv.multi_select(names),
+                }
+            ),
+            description_placeholders={"groups": ", ".join(sorted(groups)) or "none"},
+        )
+
+    async def async_step_cover_discovery(self, user_input=None):
+        """Turn discovery of covers heard repeatedly on or off."""
+        _LOGGER.info("Called async_step_cover_discovery function")
+
+        if user_input is not None:
+            self.update_config_data(global_options={
+                CONF_DISCOVER_COVERS: user_input[CONF_DISCOVER_COVERS],
+                CONF_DISCOVERY_SIGHTINGS: user_input[CONF_DISCOVERY_SIGHTINGS]
+            })
+            return self.async_create_entry(title="", data={})
+
+        data = self._config_entry.data
+        return self.async_show_form(
+            step_id="cover_discovery",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_DISCOVER_COVERS,
+                        default=data.get(CONF_DISCOVER_COVERS, DEF_DISCOVER_COVERS),
+                    ): bool,
+                    vol.Optional(
+                        CONF_DISCOVERY_SIGHTINGS,
+                        default=data.get(CONF_DISCOVERY_SIGHTINGS, DEF_DISCOVERY_SIGHTINGS),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                }
+            ),
+        )
+
+    async def _async_device_names(self, event_codes):
+        """Name each device from the registry, matching registry entries to event codes in one pass."""
+        devices = self._config_entry.data[CONF_DEVICES]
+        device_ids = {
+            tuple(devices[event_code].get(CONF_DEVICE_ID) or ()): event_code
+            for event_code in event_codes
+        }
+        device_registry = await async_get_device_registry(self.hass)
+        names = {}
+        for entry in async_entries_for_config_entry(device_registry, self._config_entry.entry_id):
+            event_code = device_ids.get(next(iter(entry.identifiers))[1:])
+            if event_code is not None:
+                names[event_code] = entry.name_by_user if entry.name_by_user else entry.name
+        for event_code in event_codes:
+            names.setdefault(event_code, event_code)
+        return names
 
     async def async_step_set_device_options(self, user_input=None):
         """Manage device options."""
@@ -11,5 +11,5 @@ async def async_setup_entry(
     async_add_entities,
 ):
     """Set up config entry."""
-    _LOGGER.info("Called overridden async_setup_entry")
+    _LOGGER.debug("Called overridden async_setup_entry")
     await new_async_setup_entry(hass, config_entry, async_add_entities)
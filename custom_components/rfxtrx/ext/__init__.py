@@ -1,5 +1,6 @@
 import logging
 import voluptuous as vol
+import homeassistant.helpers.config_validation as cv
 from homeassistant.components.rfxtrx.cover import RfxtrxCover
 from homeassistant.components.rfxtrx import CONF_SIGNAL_REPETITIONS
 from homeassistant.helpers import entity_platform
@@ -16,18 +17,53 @@ from homeassistant.components.rfxtrx.const import (
 )
 from .louvolite_vogue_blind import LouvoliteVogueBlind
 from .somfy_venetian_blind import SomfyVenetianBlind
+from .timed_roller_cover import TimedRollerCover
 from .const import (
     DEVICE_PACKET_TYPE_RFY,
     DEVICE_PACKET_TYPE_BLINDS1,
+    DEVICE_PACKET_SUBTYPE_BLINDST18,
     DEVICE_PACKET_SUBTYPE_BLINDST19,
+    ATTR_ARRIVE_AT,
     ATTR_AUTO_REPEAT,
+    ATTR_SNAPSHOT,
+    ATTR_FACADE_AZIMUTH,
+    ATTR_HYSTERESIS,
+    ATTR_SLAT_RATIO,
+    ATTR_OPERATION,
+    ATTR_WAIT_FOR_COMPLETION,
+    ATTR_DRY_RUN,
+    ATTR_TIMEOUT,
+    DEF_SNAPSHOT,
+    DEF_SUN_HYSTERESIS,
+    DEF_SLAT_RATIO,
+    DEF_MOTION_TIMEOUT,
     SVC_UPDATE_POSITION,
     SVC_INCREASE_TILT,
-    SVC_DECREASE_TILT
+    SVC_DECREASE_TILT,
+    SVC_SNAPSHOT_STATE,
+    SVC_RESTORE_STATE,
+    SVC_DUMP_FLIGHT_RECORDER,
+    SVC_ENABLE_SUN_TRACKING,
+    SVC_DISABLE_SUN_TRACKING,
+    SVC_MOVE_COVER,
+    SVC_WAIT_FOR_MOTION,
+    SVC_SET_POSITION_AND_TILT,
+    SVC_SCHEDULE_ARRIVAL
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Cover operations that can be run through the move_cover service
+MOVE_OPERATIONS = [
+    "open_cover",
+    "close_cover",
+    "set_cover_position",
+    "open_cover_tilt",
+    "close_cover_tilt",
+    "set_cover_tilt_position",
+    "set_cover_position_and_tilt"
+]
+
 
 async def async_define_sync_services():
     platform = entity_platform.current_platform.get()
@@ -43,7 +79,7 @@ async def async_define_sync_services():
             )
         },
         "async_update_cover_position",
-        [SUPPORT_SET_POSITION | SUPPORT_SET_TILT_POSITION],
+        [SUPPORT_SET_POSITION],
     )
 
     platform.async_register_entity_service(
@@ -64,24 +100,137 @@ async def async_define_sync_services():
         [SUPPORT_SET_TILT_POSITION],
     )
 
+    platform.async_register_entity_service(
+        SVC_SNAPSHOT_STATE,
+        {
+            vol.Optional(ATTR_SNAPSHOT, default=DEF_SNAPSHOT): cv.string
+        },
+        "async_snapshot_cover_state",
+        [SUPPORT_SET_TILT_POSITION],
+    )
+
+    platform.async_register_entity_service(
+        SVC_RESTORE_STATE,
+        {
+            vol.Optional(ATTR_SNAPSHOT, default=DEF_SNAPSHOT): cv.string
+        },
+        "async_restore_cover_state",
+        [SUPPORT_SET_TILT_POSITION],
+    )
+
+    platform.async_register_entity_service(
+        SVC_DUMP_FLIGHT_RECORDER,
+        {},
+        "async_dump_flight_recorder",
+        [SUPPORT_SET_POSITION],
+    )
+
+    platform.async_register_entity_service(
+        SVC_ENABLE_SUN_TRACKING,
+        {
+            vol.Required(ATTR_FACADE_AZIMUTH): vol.All(
+                vol.Coerce(float), vol.Range(min=0, max=360)
+            ),
+            vol.Optional(ATTR_HYSTERESIS, default=DEF_SUN_HYSTERESIS): vol.All(
+                vol.Coerce(float), vol.Range(min=0)
+            ),
+            vol.Optional(ATTR_SLAT_RATIO, default=DEF_SLAT_RATIO): vol.All(
+                vol.Coerce(float), vol.Range(min=0.1, max=2)
+            )
+        },
+        "async_enable_sun_tracking",
+        [SUPPORT_SET_TILT_POSITION],
+    )
+
+    platform.async_register_entity_service(
+        SVC_DISABLE_SUN_TRACKING,
+        {},
+        "async_disable_sun_tracking",
+        [SUPPORT_SET_TILT_POSITION],
+    )
+
+    platform.async_register_entity_service(
+        SVC_SET_POSITION_AND_TILT,
+        {
+            vol.Required(ATTR_POSITION): vol.All(
+                vol.Coerce(int), vol.Range(min=0, max=100)
+            ),
+            vol.Required(ATTR_TILT_POSITION): vol.All(
+                vol.Coerce(int), vol.Range(min=0, max=100)
+            )
+        },
+        "async_set_cover_position_and_tilt",
+        [SUPPORT_SET_POSITION | SUPPORT_SET_TILT_POSITION],
+    )
+
+    platform.async_register_entity_service(
+        SVC_MOVE_COVER,
+        {
+            vol.Required(ATTR_OPERATION): vol.In(MOVE_OPERATIONS),
+            vol.Optional(ATTR_POSITION): vol.All(
+                vol.Coerce(int), vol.Range(min=0, max=100)
+            ),
+            vol.Optional(ATTR_TILT_POSITION): vol.All(
+                vol.Coerce(int), vol.Range(min=0, max=100)
+            ),
+            vol.Optional(ATTR_WAIT_FOR_COMPLETION, default=True): bool,
+            vol.Optional(ATTR_DRY_RUN, default=False): bool
+        },
+        "async_move_cover",
+        [SUPPORT_SET_POSITION],
+    )
+
+    platform.async_register_entity_service(
+        SVC_SCHEDULE_ARRIVAL,
+        {
+            vol.Required(ATTR_OPERATION): vol.In(MOVE_OPERATIONS),
+            vol.Required(ATTR_ARRIVE_AT): vol.Any(cv.time, cv.datetime),
+            vol.Optional(ATTR_POSITION): vol.All(
+                vol.Coerce(int), vol.Range(min=0, max=100)
+            ),
+            vol.Optional(ATTR_TILT_POSITION): vol.All(
+                vol.Coerce(int), vol.Range(min=0, max=100)
+            )
+        },
+        "async_schedule_cover_arrival",
+        [SUPPORT_SET_POSITION],
+    )
+
+    platform.async_register_entity_service(
+        SVC_WAIT_FOR_MOTION,
+        {
+            vol.Optional(ATTR_TIMEOUT, default=DEF_MOTION_TIMEOUT): vol.All(
+                vol.Coerce(float), vol.Range(min=0)
+            )
+        },
+        "async_wait_for_cover_motion",
+        [SUPPORT_SET_POSITION],
+    )
+
 
 def create_cover_entity(device, device_id, entity_info, event=None):
     """Create a cover entitity of any of our supported types"""
-    _LOGGER.info("Device ID " + str(device_id))
-    _LOGGER.info("Info " + str(entity_info))
+    _LOGGER.debug("Device ID %s info %s", device_id, entity_info)
 
     if int(device_id[0], 16) == DEVICE_PACKET_TYPE_BLINDS1 and int(device_id[1], 16) == DEVICE_PACKET_SUBTYPE_BLINDST19:
-        _LOGGER.info(
+        _LOGGER.debug(
             "Detected a Louvolite Vogue vertical blind - let's go stateful!")
         return LouvoliteVogueBlind(device, device_id, entity_info)
+    elif int(device_id[0], 16) == DEVICE_PACKET_TYPE_BLINDS1 and int(device_id[1], 16) <= DEVICE_PACKET_SUBTYPE_BLINDST18:
+        _LOGGER.debug(
+            "Detected a Blinds T0-T18 roller - positioning by time")
+        return TimedRollerCover(device, device_id, entity_info)
     elif int(device_id[0], 16) == DEVICE_PACKET_TYPE_RFY:
         venetian_blind_mode = entity_info.get(CONF_VENETIAN_BLIND_MODE)
         if venetian_blind_mode in (CONST_VENETIAN_BLIND_MODE_US, CONST_VENETIAN_BLIND_MODE_EU):
-            _LOGGER.info(
+            _LOGGER.debug(
                 "Detected a Somfy RFY venetian blind - let's go stateful!")
             return SomfyVenetianBlind(device, device_id, entity_info)
+        _LOGGER.debug(
+            "Detected a Somfy RFY roller - positioning by time")
+        return TimedRollerCover(device, device_id, entity_info)
 
-    _LOGGER.info("Created default RFXTRX cover " + device_id[2][0:2])
+    _LOGGER.debug("Created default RFXTRX cover %s", device_id[2][0:2])
     return RfxtrxCover(device, device_id,
                        signal_repetitions=entity_info[CONF_SIGNAL_REPETITIONS],
                        venetian_blind_mode=entity_info.get(CONF_VENETIAN_BLIND_MODE))
@@ -1,6 +1,8 @@
 """Light support for switch entities."""
 import logging
 import asyncio
+import copy
+import functools
 import time
 from typing import (
     Any,
@@ -9,7 +11,10 @@ from typing import (
     Sequence,
     cast
 )
-from .. import RfxtrxCommandEntity
+from .. import (
+    DOMAIN,
+    RfxtrxCommandEntity
+)
 from homeassistant.components.cover import (
     DEVICE_CLASS_BLIND,
     SUPPORT_CLOSE,
@@ -31,7 +36,66 @@ from homeassistant.const import (
     STATE_OPENING
 )
 from homeassistant.core import callback
-from .const import ATTR_AUTO_REPEAT
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util import dt as dt_util
+from .flight_recorder import (
+    EVENT_COMMAND,
+    EVENT_FAILED,
+    EVENT_IGNORED,
+    EVENT_SERVICE,
+    EVENT_STATE,
+    EVENT_WAIT,
+    FlightRecorder
+)
+from .arrival import next_arrival
+from .cover_group import member_contribution
+from .motion_plan import MotionPlan
+from .router import PRIMARY_TRANSCEIVER
+from .transmitter import airtime
+from .journal import (
+    RECORD_DEADLINE,
+    RECORD_TARGET_LIFT,
+    RECORD_TARGET_STATE,
+    RECORD_TARGET_TILT
+)
+from .const import (
+    ATTR_ARRIVE_AT,
+    ATTR_AUTO_REPEAT,
+    ATTR_DRY_RUN,
+    ATTR_SNAPSHOT,
+    ATTR_FACADE_AZIMUTH,
+    ATTR_HYSTERESIS,
+    ATTR_MOTION_ETA,
+    ATTR_OPERATION,
+    ATTR_SLAT_RATIO,
+    ATTR_TIMEOUT,
+    ATTR_WAIT_FOR_COMPLETION,
+    COMBINE_WINDOW_SEC,
+    DATA_ARRIVALS,
+    DATA_COMPLETIONS,
+    DATA_COVER_SNAPSHOTS,
+    DATA_EMERGENCY,
+    DATA_JOURNAL,
+    DATA_LINK_QUALITY,
+    DATA_MOTION_STREAM,
+    DATA_ROUTER,
+    DATA_SUN_TRACKER,
+    DEF_MAX_PENDING,
+    DEF_MAX_REPETITIONS,
+    DEF_MIN_REPETITIONS,
+    DEF_MOTION_TIMEOUT,
+    DEF_SHED_POLICY,
+    DEF_SNAPSHOT,
+    DEF_SLAT_RATIO,
+    DEF_SUN_HYSTERESIS,
+    DEF_TRANSCEIVER,
+    EVENT_FLIGHT_RECORDER,
+    EVENT_MOTION_PLAN,
+    SIGNAL_TRANSCEIVER_EVENT,
+    SIGNAL_TRANSMITTER_STATE
+)
 
 # Values returned for blind position in various states
 BLIND_POS_OPEN = 100
@@ -53,9 +117,30 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_NAME = "Blinds Control"
 
 AUTO_STEP_CLICK_SEC = 2
+
+# Values taken by the move_cover service for each operation that moves to a position or tilt
+MOVE_OPERATION_ARGS = {
+    "set_cover_position": (ATTR_POSITION,),
+    "set_cover_tilt_position": (ATTR_TILT_POSITION,),
+    "set_cover_position_and_tilt": (ATTR_POSITION, ATTR_TILT_POSITION)
+}
 COMMAND_DEBOUNCE_SEC = 0.5
 
 
+# Runs a service operation as a planned motion. The operation is first run against a copy of the
+# cover that collects the commands and waits instead of sending and sleeping, which gives the time
+# the operation will take. While it runs the cover reports when it expects to finish, and anything
+# waiting on the cover is released once it has.
+def planned_operation(method):
+    """Decorate a cover operation so that it is planned, timed and reported on completion."""
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        if self._plan is not None:
+            return await method(self, *args, **kwargs)
+        return await self._async_run_planned(method, args, kwargs)
+    return wrapper
+
+
 # Represents a cover entity that has slats - either vertical or horizontal. Thios differs from a cover in that:
 # - Opening the blind tilts the slats to allow light. Not moving the blind out of the window
 # - Closing the blind requires the blind to be fully lowered into the window and the slats to be in a tilted position
@@ -68,15 +153,34 @@ COMMAND_DEBOUNCE_SEC = 0.5
 #     _syncMidPos - boolean - TRUE if we should send a "mid" position command each time we cross the mid position
 #     _blindCloseSecs - number of seconds to wait for the blind to fully close from fully open position
 #     _blindOpenSecs - number of seconds to wait for the blind to fully open from fully closed position
+#     _maxPending - number of commands for the blind that may wait to be transmitted
+#     _shedPolicy - whether a new command supersedes a waiting one or is refused when over _maxPending
+#     _transceiver - address of the transceiver used to send commands, or auto to use the one that hears the remote best
+#   Diagnostics:
+#     _recorder - ring buffer of recent service calls, commands, state changes, waits and ignored requests
+#     _plan - commands and waits collected in place of sending and sleeping, set only on the copy used for planning
+#     _groups - cover groups the cover belongs to
+#     _groupContribution - what the cover last added to the totals of its groups
 #   State:
 #     _lift_position - reported position of the blind
 #     _tilt_step - step posiotion of the tilt - related to the _tilt_step
 #     _state - what the blind is curfrently doing - STATE_OPEN/STATE_OPENING/STATE_CLOSED/STATE_CLOSING
+#     _operations - completion future of each planned operation under way, mapped to the time it should finish
+#     _pendingMove - position and tilt requested within the combine window and the future released once they are applied
+#     _operationTasks - tasks running planned operations, which an emergency retract cancels
+#     _preempted - tasks cancelled by an emergency retract, whose cancellation is not passed on to the caller
+#     _emergency - future given the time the retract command was written while an emergency retract is sending
+#     _arrival - cancels the start of the operation scheduled to arrive at a given time
 #
 class AbstractTiltingCover(RfxtrxCommandEntity, CoverEntity):
     """Representation of a RFXtrx cover supporting tilt and, optionally, lift."""
 
-    def __init__(self, device, device_id, signal_repetitions, event, midSteps, hasMid, hasLift, liftOnOpen, syncMid, openSecs, closeSecs, syncMs, repeatStepMs):
+    # Shortest time the motor needs between two commands of a sequence before it accepts the second
+    MIN_COMMAND_GAP_SEC = 0
+
+    def __init__(self, device, device_id, signal_repetitions, event, midSteps, hasMid, hasLift, liftOnOpen, syncMid, openSecs, closeSecs, syncMs, repeatStepMs,
+                 maxPending=DEF_MAX_PENDING, shedPolicy=DEF_SHED_POLICY, transceiver=DEF_TRANSCEIVER,
+                 minRepetitions=DEF_MIN_REPETITIONS, maxRepetitions=DEF_MAX_REPETITIONS):
         self._syncMidPos = syncMid
         self._hasMidCommand = hasMid
         self._hasLift = hasLift
@@ -87,40 +191,87 @@ class AbstractTiltingCover(RfxtrxCommandEntity, CoverEntity):
         self._blindSyncSecs = syncMs / 1000
         self._blindRepeatStepSecs = repeatStepMs / 1000
         self._blindMaxSteps = int(self._blindMidSteps * 2)
+        self._maxPending = maxPending
+        self._shedPolicy = shedPolicy
+        self._transceiver = transceiver
+        self._minRepetitions = minRepetitions
+        self._maxRepetitions = maxRepetitions
 
-        super().__init__(device, device_id, signal_repetitions, event)
+        self._recorder = FlightRecorder()
+        self._plan = None
+        self._groups = []
+        self._groupContribution = None
 
-        _LOGGER.info("New tilting cover config," +
-                     " signal_repetitions=" + str(signal_repetitions) +
-                     " midSteps=" + str(self._blindMidSteps) +
-                     " maxSteps=" + str(self._blindMaxSteps) +
-                     " openSecs=" + str(self._blindOpenSecs) +
-                     " closeSecs=" + str(self._blindCloseSecs) +
-                     " syncSecs=" + str(self._blindSyncSecs) +
-                     " stepSecs=" + str(self._blindRepeatStepSecs) +
-                     " hasLift=" + str(self._hasLift) +
-                     " liftOnOpen=" + str(self._liftOnOpen) +
-                     " hasMidCommand=" + str(self._hasMidCommand) +
-                     " syncMidPos=" + str(self._syncMidPos))
+        super().__init__(device, device_id, signal_repetitions, event)
 
-    async def async_added_to_hass(self):
-        """Restore device state."""
-        _LOGGER.debug("Called async_added_to_hass")
+        _LOGGER.debug("New tilting cover config, signal_repetitions=%s midSteps=%s maxSteps=%s"
+                      " openSecs=%s closeSecs=%s syncSecs=%s stepSecs=%s hasLift=%s liftOnOpen=%s"
+                      " hasMidCommand=%s syncMidPos=%s",
+                      signal_repetitions, self._blindMidSteps, self._blindMaxSteps,
+                      self._blindOpenSecs, self._blindCloseSecs, self._blindSyncSecs,
+                      self._blindRepeatStepSecs, self._hasLift, self._liftOnOpen,
+                      self._hasMidCommand, self._syncMidPos)
 
+    def _init_state(self):
+        """Set the state of a cover that has just been added, before anything is restored."""
         self._lift_position = BLIND_POS_OPEN
         self._tilt_step = 0
         self._state = STATE_OPEN
         self._autoStepActive = False
         self._autoStepDirection = 0
+        self._nudgeDelta = 0
+        self._nudgeActive = False
+        self._motion = None
+        self._lastSettled = None
+        self._operations = {}
+        self._pendingMove = None
+        self._operationTasks = set()
+        self._preempted = set()
+        self._emergency = None
+        self._arrival = None
         self._lastCommandTime = time.time()
 
+    async def async_added_to_hass(self):
+        """Restore device state."""
+        self._init_state()
+
         await super().async_added_to_hass()
 
-        if self._event is None:
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_TRANSMITTER_STATE, self.async_write_ha_state
+            )
+        )
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_TRANSCEIVER_EVENT, self._handle_event
+            )
+        )
+
+        tracker = self.hass.data[DOMAIN].get(DATA_SUN_TRACKER)
+        if tracker is not None:
+            self.async_on_remove(lambda: tracker.disable(self))
+
+        emergency = self.hass.data[DOMAIN].get(DATA_EMERGENCY)
+        if emergency is not None:
+            emergency.add(self)
+            self.async_on_remove(lambda: emergency.discard(self))
+
+        link = self.hass.data[DOMAIN].get(DATA_LINK_QUALITY)
+        if link is not None:
+            link.add(self)
+            self.async_on_remove(lambda: link.discard(self))
+
+        self.async_on_remove(self._cancel_arrival)
+        self.async_on_remove(self._leave_groups)
+
+        if self._event is None and self._recover_journal():
+            self._recorder.record(EVENT_STATE, self._state, self._lift_position,
+                                  self._tilt_step, "journal")
+        elif self._event is None:
             old_state = await self.async_get_last_state()
             if old_state is not None:
                 if 'current_tilt_position' in old_state.attributes:
-                    _LOGGER.info("State = " + str(old_state))
                     self._lift_position = old_state.attributes['current_position']
                     tilt = old_state.attributes['current_tilt_position']
                     if not(self._hasLift) or self._lift_position <= BLIND_POS_TILTED_MAX:
@@ -132,62 +283,83 @@ class AbstractTiltingCover(RfxtrxCommandEntity, CoverEntity):
                         self._lift_position = BLIND_POS_OPEN
                         self._tilt_step = self._blindMidSteps
 
-                    _LOGGER.info("Recovered state=" + str(self._state) +
-                                 " position=" + str(self._lift_position) +
-                                 " tilt=" + str(self._tilt_step))
+                    self._recorder.record(EVENT_STATE, self._state, self._lift_position,
+                                          self._tilt_step, "last state")
+                elif 'current_position' in old_state.attributes:
+                    # Covers with no tilt, such as rollers, only have their position to restore
+                    self._lift_position = old_state.attributes['current_position']
+                    self._state = STATE_CLOSED if self._lift_position <= BLIND_POS_CLOSED else STATE_OPEN
+                    self._tilt_step = 0
+
+                    self._recorder.record(EVENT_STATE, self._state, self._lift_position,
+                                          self._tilt_step, "last state")
+
+        if self._lastSettled is None:
+            self._lastSettled = self._reported_now()
+
+    # Groups keep running totals of their members' states, so each change is handed to them as the
+    # difference from what the cover last reported rather than having the groups read every member.
+    # An unavailable cover takes its contribution back until it is available again, and a removed
+    # cover takes it back for good.
+
+    @callback
+    def join_group(self, group):
+        """Report changes of state to a cover group."""
+        self._groups.append(group)
+
+    @callback
+    def async_write_ha_state(self):
+        """Write the state, passing any change on to the groups of the cover."""
+        if self._groups:
+            self._update_groups(member_contribution(self) if self.available else None)
+        super().async_write_ha_state()
+
+    @callback
+    def _leave_groups(self):
+        self._update_groups(None)
+
+    def _update_groups(self, contribution):
+        if contribution != self._groupContribution:
+            for group in self._groups:
+                group.member_changed(self._groupContribution, contribution)
+            self._groupContribution = contribution
 
     @property
     def available(self) -> bool:
-        """Return true if device is available - not sure what makes it unavailable."""
-        return True
+        """Return true if device is available - unavailable while the transmitter is saturated or failing."""
+        router = self.hass.data[DOMAIN].get(DATA_ROUTER)
+        return router is None or router.route(self._device_id, self._transceiver).available
 
     @property
     def current_cover_tilt_position(self):
         """Return the current tilt position property."""
-        if self._state == STATE_OPEN:
-            tilt = TILT_POS_OPEN
-        elif self._tilt_step == 0:
-            tilt = TILT_POS_CLOSED_MIN
-        elif self._tilt_step == self._blindMidSteps:
-            tilt = TILT_POS_OPEN
-        elif self._tilt_step >= self._blindMaxSteps:
-            tilt = TILT_POS_CLOSED_MAX
-        else:
-            tilt = self._steps_to_tilt(self._tilt_step)
-
-        _LOGGER.debug(
-            "Returned current_cover_tilt_step attribute = " + str(tilt))
-        return tilt
+        return self._reported_tilt(self._state, self._tilt_step)
 
     @property
     def current_cover_position(self):
         """Return the current cover position property."""
-        if self._lift_position == BLIND_POS_CLOSED:
-            if self._tilt_step <= 0 or self._tilt_step >= self._blindMaxSteps:
-                position = BLIND_POS_CLOSED
-            else:
-                position = BLIND_POS_TILTED_MIN
-        elif self._lift_position == BLIND_POS_OPEN:
-            position = BLIND_POS_OPEN
-        else:
-            position = BLIND_POS_STOPPED
+        return self._reported_position(self._lift_position, self._tilt_step)
 
-        _LOGGER.debug(
-            "Returned current_cover_position attribute = " + str(position))
-        return position
+    @property
+    def device_state_attributes(self):
+        """Return the state attributes, with the expected finish time of an operation under way."""
+        attributes = super().device_state_attributes
+        if self._operations:
+            attributes = dict(attributes or {})
+            attributes[ATTR_MOTION_ETA] = dt_util.utc_from_timestamp(
+                max(self._operations.values())).isoformat()
+        return attributes
 
     @property
     def is_opening(self):
         """Return the is_opening property."""
         opening = self._state == STATE_OPENING
-        _LOGGER.debug("Returned is_opening attribute = " + str(opening))
         return opening
 
     @property
     def is_closing(self):
         """Return the is_closing property."""
         closing = self._state == STATE_CLOSING
-        _LOGGER.debug("Returned is_closing attribute = " + str(closing))
         return closing
 
     @property
@@ -195,19 +367,16 @@ class AbstractTiltingCover(RfxtrxCommandEntity, CoverEntity):
         """Return the is_closed property."""
         closed = self._state == STATE_CLOSED and (
             self._tilt_step <= 0 or self._tilt_step >= self._blindMaxSteps)
-        _LOGGER.debug("Returned is_closed attribute = " + str(closed))
         return closed
 
     @property
     def device_class(self):
         """Return the device class."""
-        _LOGGER.debug("Returned device_class attribute")
         return DEVICE_CLASS_BLIND
 
     @property
     def supported_features(self):
         """Flag supported features."""
-        _LOGGER.debug("Returned supported_features attribute")
         features = SUPPORT_CLOSE | SUPPORT_OPEN | SUPPORT_STOP | SUPPORT_OPEN_TILT | SUPPORT_CLOSE_TILT | SUPPORT_STOP_TILT | SUPPORT_SET_TILT_POSITION | SUPPORT_SET_POSITION
         return features
 
@@ -226,9 +395,10 @@ class AbstractTiltingCover(RfxtrxCommandEntity, CoverEntity):
     # Requests to open the blind. In practice we do not open then blind, we will instead tilt to the
     # mid position. If the blind is in motion then is ignored.
 
+    @planned_operation
     async def async_open_cover(self, **kwargs):
         """Open the cover by selecting the mid position."""
-        _LOGGER.info("Invoked async_open_cover")
+        self._recorder.record(EVENT_SERVICE, "open_cover")
 
         if self._liftOnOpen:
             await self._async_set_cover_position(BLIND_POS_OPEN)
@@ -238,9 +408,10 @@ class AbstractTiltingCover(RfxtrxCommandEntity, CoverEntity):
     # Requests to close the blind. If the blind is in motion then is ignored. Otherwise always close the blind so
     # that we can be sure the blind is closed.
 
+    @planned_operation
     async def async_close_cover(self, **kwargs):
         """Close the cover."""
-        _LOGGER.info("Invoked async_close_cover")
+        self._recorder.record(EVENT_SERVICE, "close_cover")
 
         await self._async_set_cover_position(BLIND_POS_CLOSED)
 
@@ -249,81 +420,95 @@ class AbstractTiltingCover(RfxtrxCommandEntity, CoverEntity):
 
     async def async_stop_cover(self, **kwargs):
         """Stop the cover."""
-        _LOGGER.info("Invoked async_stop_cover")
+        self._recorder.record(EVENT_SERVICE, "stop_cover")
 
         if not self._hasLift:
-            _LOGGER.info("Blind does not lift - ignoring the request")
+            self._recorder.record(EVENT_IGNORED, "blind does not lift")
         elif self._state == STATE_CLOSING or self._state == STATE_OPENING:
-            # Stop the blind
-            _LOGGER.info("Blind is in motion - marking as partially closed")
+            # Stop the blind and mark as partially closed
             await self._async_do_stop_blind()
             await self._set_state(STATE_OPEN, BLIND_POS_STOPPED, 0)
         else:
-            _LOGGER.info("Blind is stationary - ignoring the request")
+            self._recorder.record(EVENT_IGNORED, "blind is stationary")
 
     # Requests to set the position of the blind. If the blind is in motion then is ignored. We will use this
     # to allow the blind to actually be opened. If the position is after the mid point then change into a close
     # command which will ensure the blind is closed. Otherwise set he state to OPENING and open the blind.
-    # Then after a delay and marks as OPEN if the blind is still OPENING.
+    # Then after a delay and marks as OPEN if the blind is still OPENING. A tilt requested at about the same
+    # time is combined with the position, see _async_combine_move.
 
     async def async_set_cover_position(self, **kwargs):
         """Move the cover to a specific position."""
-        _LOGGER.info("Invoked async_set_cover_position")
+        self._recorder.record(EVENT_SERVICE, "set_cover_position")
 
-        if self._ignore_bounce():
-            if ATTR_POSITION in kwargs:
-                await self._async_set_cover_position(kwargs[ATTR_POSITION])
+        if ATTR_POSITION in kwargs:
+            await self._async_combine_move(ATTR_POSITION, kwargs[ATTR_POSITION])
 
     # Request to open the blind with a tilt
 
+    @planned_operation
     async def async_open_cover_tilt(self, **kwargs):
         """Open the cover tilt."""
-        _LOGGER.info("Invoked async_open_cover_tilt")
+        self._recorder.record(EVENT_SERVICE, "open_cover_tilt")
 
         if self._hasMidCommand:
             await self._async_tilt_blind_to_mid_step()
         else:
             await self._async_set_cover_tilt_step(self._blindMidSteps)
 
+    @planned_operation
     async def async_close_cover_tilt(self, **kwargs):
         """Close the cover tilt."""
-        _LOGGER.info("Invoked async_close_cover_tilt")
+        self._recorder.record(EVENT_SERVICE, "close_cover_tilt")
 
         await self._async_set_cover_tilt_step(0)
 
     async def async_stop_cover_tilt(self, **kwargs):
         """Stop the cover."""
-        _LOGGER.info("Invoked async_stop_cover_tilt")
+        self._recorder.record(EVENT_SERVICE, "stop_cover_tilt")
 
+        self._nudgeDelta = 0
         if self._autoStepActive:
-            _LOGGER.info("Disabled auto advance of cover_tilt")
             self._autoStepDirection = 0
             self._autoStepActive = False
 
     async def async_set_cover_tilt_position(self, **kwargs):
         """Move the cover tilt to a specific position."""
-        _LOGGER.info("Invoked async_set_cover_tilt_position")
-
-        if self._blind_is_stationary() and self._ignore_bounce():
-            if ATTR_TILT_POSITION in kwargs:
-                tilt_position = kwargs[ATTR_TILT_POSITION]
-            else:
-                tilt_position = TILT_POS_OPEN
-
+        self._recorder.record(EVENT_SERVICE, "set_cover_tilt_position")
+
+        await self._async_combine_move(
+            ATTR_TILT_POSITION, kwargs.get(ATTR_TILT_POSITION, TILT_POS_OPEN))
+
+    # Moves the blind to a position and tilt as one operation. Tilting is only possible with the blind
+    # lowered, so a raised position ignores the tilt. Otherwise the blind is lowered by the mid command
+    # where it has one, or by a close, and then tilted, so reaching a lowered blind with its slats at
+    # some angle costs one lowering and one tilt. Either value may be left out to only move the other.
+
+    @planned_operation
+    async def async_set_cover_position_and_tilt(self, **kwargs):
+        """Move the cover to a specific position and tilt."""
+        self._recorder.record(EVENT_SERVICE, "set_cover_position_and_tilt")
+
+        position = kwargs.get(ATTR_POSITION)
+        tilt_position = kwargs.get(ATTR_TILT_POSITION)
+
+        if tilt_position is None or (position is not None and position >= BLIND_POS_STOPPED):
+            if position is not None and self._ignore_bounce():
+                await self._async_set_cover_position(position)
+        elif position is not None:
+            if self._blind_is_stationary() and self._ignore_bounce():
+                await self._async_restore_cover_state(
+                    STATE_CLOSED, BLIND_POS_CLOSED, self._tilt_to_steps(tilt_position))
+        elif self._blind_is_stationary() and self._ignore_bounce():
             if self._state != STATE_CLOSED or self._lift_position != BLIND_POS_CLOSED:
+                # Blind is not closed - switch to a close or mid position operation
                 if tilt_position == 0:
-                    _LOGGER.info(
-                        "Blind is not closed - switching to close operation")
                     await self._async_set_cover_tilt_step(0)
                 else:
-                    _LOGGER.info(
-                        "Blind is not closed - switching to mid position operation")
                     await self._async_tilt_blind_to_mid_step()
             else:
                 tilt = self._tilt_to_steps(tilt_position)
                 if tilt == self._blindMidSteps:
-                    _LOGGER.info(
-                        "Tilt is to mid point - switching to mid position operation")
                     await self._async_tilt_blind_to_mid_step()
                 else:
                     await self._async_set_cover_tilt_step(tilt)
@@ -332,7 +517,8 @@ class AbstractTiltingCover(RfxtrxCommandEntity, CoverEntity):
 
     async def async_update_cover_position(self, **kwargs):
         """Update the internal position."""
-        _LOGGER.info("Invoked async_update_cover_position")
+        self._recorder.record(EVENT_SERVICE, "update_cover_position")
+        tracked = (self._lift_position, self._tilt_step)
 
         if ATTR_POSITION in kwargs:
             self._lift_position = kwargs[ATTR_POSITION]
@@ -346,11 +532,17 @@ class AbstractTiltingCover(RfxtrxCommandEntity, CoverEntity):
         else:
             state = STATE_OPEN
 
+        # A correction means the blind did not do what was sent, most likely because a frame was missed
+        link = self.hass.data[DOMAIN].get(DATA_LINK_QUALITY)
+        if link is not None and (self._lift_position, self._tilt_step) != tracked:
+            link.mismatch(self._device_id)
+
         await self._set_state(state, self._lift_position, self._tilt_step)
 
+    @planned_operation
     async def async_increase_cover_tilt(self, **kwargs):
         """Increase the cover tilt step."""
-        _LOGGER.info("Invoked async_increase_cover_tilt")
+        self._recorder.record(EVENT_SERVICE, "increase_cover_tilt")
 
         repeating = kwargs[ATTR_AUTO_REPEAT] if ATTR_AUTO_REPEAT in kwargs else False
         if repeating:
@@ -358,9 +550,10 @@ class AbstractTiltingCover(RfxtrxCommandEntity, CoverEntity):
         else:
             await self._async_repeat_tilt(1)
 
+    @planned_operation
     async def async_decrease_cover_tilt(self, **kwargs):
         """Decrease the cover tilt step."""
-        _LOGGER.info("Invoked async_decrease_cover_tilt")
+        self._recorder.record(EVENT_SERVICE, "decrease_cover_tilt")
 
         repeating = kwargs[ATTR_AUTO_REPEAT] if ATTR_AUTO_REPEAT in kwargs else False
         if repeating:
@@ -368,11 +561,259 @@ class AbstractTiltingCover(RfxtrxCommandEntity, CoverEntity):
         else:
             await self._async_repeat_tilt(-1)
 
+    # Records the internal state of the blind into a named snapshot shared by all covers. A blind that is
+    # in motion has no settled state to record so is left out of the snapshot.
+
+    async def async_snapshot_cover_state(self, **kwargs):
+        """Record the internal state of the cover in a snapshot."""
+        self._recorder.record(EVENT_SERVICE, "snapshot_cover_state")
+
+        name = kwargs.get(ATTR_SNAPSHOT, DEF_SNAPSHOT)
+        snapshots = self.hass.data[DOMAIN].setdefault(DATA_COVER_SNAPSHOTS, {})
+        snapshot = snapshots.setdefault(name, {})
+
+        if self._blind_is_stationary():
+            snapshot[self._unique_id] = (
+                self._state, self._lift_position, self._tilt_step)
+        else:
+            snapshot.pop(self._unique_id, None)
+
+    # Returns the blind to the state held in a snapshot. Blinds that already match the snapshot are left
+    # alone so that restoring a scene only moves the blinds that have changed since it was recorded.
+
+    @planned_operation
+    async def async_restore_cover_state(self, **kwargs):
+        """Restore the internal state of the cover from a snapshot."""
+        self._recorder.record(EVENT_SERVICE, "restore_cover_state")
+
+        name = kwargs.get(ATTR_SNAPSHOT, DEF_SNAPSHOT)
+        snapshot = self.hass.data[DOMAIN].get(
+            DATA_COVER_SNAPSHOTS, {}).get(name, {}).get(self._unique_id)
+
+        if snapshot is None:
+            self._recorder.record(EVENT_IGNORED, "not in snapshot", name)
+        elif snapshot == (self._state, self._lift_position, self._tilt_step):
+            self._recorder.record(EVENT_IGNORED, "already matches snapshot", name)
+        elif self._blind_is_stationary():
+            await self._async_restore_cover_state(*snapshot)
+
+    # Publishes the flight recorder of the blind as an event so that recent activity can be inspected
+    # without having had logging turned up beforehand.
+
+    async def async_dump_flight_recorder(self, **kwargs):
+        """Fire an event holding the recent activity of the cover."""
+        self.hass.bus.async_fire(EVENT_FLIGHT_RECORDER, {
+            "entity_id": self.entity_id,
+            "events": self._recorder.events()
+        })
+
+    # Hands the tilt of the blind to the sun tracker, which turns the slats to block direct sun while
+    # the blind is lowered into a window facing the given azimuth.
+
+    async def async_enable_sun_tracking(self, **kwargs):
+        """Start tracking the sun with the slats of the cover."""
+        self._recorder.record(EVENT_SERVICE, "enable_sun_tracking")
+
+        self.hass.data[DOMAIN][DATA_SUN_TRACKER].enable(
+            self, kwargs[ATTR_FACADE_AZIMUTH],
+            kwargs.get(ATTR_HYSTERESIS, DEF_SUN_HYSTERESIS),
+            kwargs.get(ATTR_SLAT_RATIO, DEF_SLAT_RATIO))
+
+    async def async_disable_sun_tracking(self, **kwargs):
+        """Stop tracking the sun with the slats of the cover."""
+        self._recorder.record(EVENT_SERVICE, "disable_sun_tracking")
+
+        self.hass.data[DOMAIN][DATA_SUN_TRACKER].disable(self)
+
+    # Runs any of the cover operations on behalf of an automation. The caller may wait for the blind to
+    # settle, return as soon as the operation has started, or only plan it. A plan is fired as an event
+    # holding the commands that would be sent and when, along with the expected finish time.
+
+    async def async_move_cover(self, **kwargs):
+        """Run a cover operation, optionally without waiting for it or without transmitting."""
+        self._recorder.record(EVENT_SERVICE, "move_cover", kwargs[ATTR_OPERATION])
+        operation, args = self._move_operation(kwargs)
+
+        if kwargs.get(ATTR_DRY_RUN, False):
+            plan = await self._async_plan(operation.__wrapped__, **args)
+            self.hass.bus.async_fire(EVENT_MOTION_PLAN, {
+                "entity_id": self.entity_id,
+                "operation": kwargs[ATTR_OPERATION],
+                "duration": round(plan.duration, 2),
+                ATTR_MOTION_ETA: dt_util.utc_from_timestamp(time.time() + plan.duration).isoformat(),
+                "commands": [[offset, cmd] for offset, cmd in plan.commands]
+            })
+        elif kwargs.get(ATTR_WAIT_FOR_COMPLETION, True):
+            await operation(self, **args)
+        else:
+            self.hass.async_create_task(operation(self, **args))
+
+    # Starts an operation early enough for the blind to arrive at the time given. How long the operation
+    # takes is worked out from its plan for the blind's state when the service is called, and the start
+    # is staggered against other scheduled blinds on the same transceiver so their commands do not
+    # queue behind each other. Scheduling again replaces the previous schedule.
+
+    async def async_schedule_cover_arrival(self, **kwargs):
+        """Schedule a cover operation to finish at the time given."""
+        self._recorder.record(EVENT_SERVICE, "schedule_arrival", kwargs[ATTR_OPERATION])
+        self._cancel_arrival()
+        operation, args = self._move_operation(kwargs)
+
+        plan = await self._async_plan(operation.__wrapped__, **args)
+        transmitter = self.hass.data[DOMAIN][DATA_ROUTER].route(self._device_id, self._transceiver)
+        start = self.hass.data[DOMAIN][DATA_ARRIVALS].reserve(
+            transmitter, self, next_arrival(kwargs[ATTR_ARRIVE_AT]), plan.duration,
+            [offset for offset, _ in plan.commands])
+        if start < time.time():
+            _LOGGER.warning("%s cannot arrive in time, starting now", self.entity_id)
+
+        @callback
+        def _start(now):
+            self._arrival = None
+            self.hass.async_create_task(operation(self, **args))
+
+        self._arrival = async_track_point_in_utc_time(
+            self.hass, _start, dt_util.utc_from_timestamp(start))
+        _LOGGER.debug("%s scheduled to start %s at %s", self.entity_id, kwargs[ATTR_OPERATION],
+                      dt_util.utc_from_timestamp(start).isoformat())
+
+    @callback
+    def _cancel_arrival(self):
+        if self._arrival is not None:
+            self._arrival()
+            self._arrival = None
+        self.hass.data[DOMAIN][DATA_ARRIVALS].release(self)
+
+    # Position and tilt are run directly rather than waiting to be combined with other requests
+
+    def _move_operation(self, kwargs):
+        keys = MOVE_OPERATION_ARGS.get(kwargs[ATTR_OPERATION], ())
+        args = {key: kwargs[key] for key in keys if key in kwargs}
+        if kwargs[ATTR_OPERATION] == "set_cover_tilt_position":
+            args.setdefault(ATTR_TILT_POSITION, TILT_POS_OPEN)
+        if keys:
+            return type(self).async_set_cover_position_and_tilt, args
+        return getattr(type(self), "async_" + kwargs[ATTR_OPERATION]), args
+
+    # Home Assistant sends position and tilt as separate service calls. Each request waits briefly so
+    # that one arriving soon after is combined with it into a single position and tilt operation,
+    # rather than the second being dropped as a duplicate or running a second full cycle of its own.
+    # Nothing is combined with a raise, which ignores any tilt, with a cover that has no tilt, or with
+    # a blind in motion, which ignores both, so those start without waiting.
+    # Every caller returns, or fails, with the combined operation.
+
+    async def _async_combine_move(self, key, value):
+        if self._pendingMove is not None:
+            move, done = self._pendingMove
+            move[key] = value
+            self._recorder.record(EVENT_SERVICE, "combined", key, value)
+            await asyncio.shield(done)
+            return
+
+        move = {key: value}
+        if (key == ATTR_POSITION and value >= BLIND_POS_STOPPED) or \
+                self._reported_tilt(self._state, self._tilt_step) is None or \
+                self._state in (STATE_OPENING, STATE_CLOSING):
+            await self.async_set_cover_position_and_tilt(**move)
+            return
+
+        done = self.hass.loop.create_future()
+        self._pendingMove = (move, done)
+        try:
+            await asyncio.sleep(COMBINE_WINDOW_SEC)
+            self._pendingMove = None
+            await self.async_set_cover_position_and_tilt(**move)
+        except asyncio.CancelledError:
+            done.cancel()
+            raise
+        except Exception as err:
+            done.set_exception(err)
+            # Raised here and in any combined callers, so it is not left to be logged as unretrieved
+            done.exception()
+            raise
+        else:
+            done.set_result(None)
+        finally:
+            self._pendingMove = None
+
+    # Waits until the operations under way on the blind have finished, however they were started, so an
+    # automation can carry on as soon as the blind has settled rather than after a fixed delay.
+
+    async def async_wait_for_cover_motion(self, **kwargs):
+        """Wait for the operations under way on the cover to finish."""
+        if self._operations:
+            await asyncio.wait(list(self._operations),
+                               timeout=kwargs.get(ATTR_TIMEOUT, DEF_MOTION_TIMEOUT))
+
+    # Drops whatever the blind is doing and raises it, sending the command ahead of everything else.
+    # Operations under way are cancelled, anything queued for the blind is flushed, and the stationary
+    # and debounce checks are skipped. Returns the time the command went out, or None if it did not,
+    # leaving the blind to finish rising in the background.
+
+    async def async_emergency_retract(self):
+        """Preempt the cover and raise it at top priority."""
+        self._recorder.record(EVENT_SERVICE, "emergency_retract")
+
+        self._autoStepActive = False
+        self._autoStepDirection = 0
+        self._nudgeDelta = 0
+        if self._pendingMove is not None:
+            self._pendingMove[0].clear()
+
+        await self._async_preempt()
+
+        # Where the blind got to is no longer known
+        await self._set_state(STATE_OPEN, BLIND_POS_STOPPED, 0)
+
+        sent = self.hass.loop.create_future()
+        self._emergency = sent
+        retract = self.hass.async_create_task(self._async_retract())
+        await asyncio.wait({sent, retract}, return_when=asyncio.FIRST_COMPLETED)
+        self._emergency = None
+
+        if sent.done():
+            return sent.result()
+        if not retract.cancelled() and retract.exception() is not None:
+            _LOGGER.error("Emergency retract of %s failed: %s", self.entity_id, retract.exception())
+        return None
+
+    async def _async_preempt(self):
+        """Cancel the operations under way and drop anything queued for the blind."""
+        tasks = set(self._operationTasks)
+        for task in tasks:
+            self._preempted.add(task)
+            task.cancel()
+        # The daemon acknowledges a flush, so the retract is not sent until the queue has been dropped
+        try:
+            await self.hass.data[DOMAIN][DATA_ROUTER].route(
+                self._device_id, self._transceiver).async_flush(self._device_id)
+        except HomeAssistantError as err:
+            _LOGGER.warning("Unable to flush commands for %s: %s", self.entity_id, err)
+        if tasks:
+            await asyncio.wait(tasks)
+
+    @planned_operation
+    async def _async_retract(self):
+        await self._async_set_cover_position(BLIND_POS_OPEN)
+
     # Action functions
 
+    def _sun_trackable(self):
+        return self._state == STATE_CLOSED and self._lift_position == BLIND_POS_CLOSED
+
+    @planned_operation
+    async def _async_track_sun_step(self, tilt_step):
+        """Move the cover tilt to the step chosen by the sun tracker."""
+        self._recorder.record(EVENT_SERVICE, "sun tracking", tilt_step)
+
+        if self._sun_trackable():
+            if tilt_step == self._blindMidSteps and self._hasMidCommand:
+                await self._async_tilt_blind_to_mid_step()
+            else:
+                await self._async_set_cover_tilt_step(tilt_step)
+
     async def _async_set_cover_position(self, position):
         """Move the cover to a specific position."""
-        _LOGGER.info("Invoked _async_set_cover_position")
 
         if self._blind_is_stationary():
             if position < BLIND_POS_STOPPED:
@@ -383,22 +824,20 @@ class AbstractTiltingCover(RfxtrxCommandEntity, CoverEntity):
                     delay = self._blindSyncSecs / 2
                     self._state = STATE_CLOSING
 
-                _LOGGER.info("Closing blind with a delay...")
                 newDelay = await self._async_do_close_blind()
                 if newDelay is not None:
                     delay = newDelay
                 await self._wait_and_set_state(delay, STATE_CLOSING, STATE_CLOSED, BLIND_POS_CLOSED, 0)
             else:
-                _LOGGER.info("Opening blind with a delay...")
+                delay = self._blindOpenSecs
                 await self._set_state(STATE_OPENING, BLIND_POS_STOPPED, 0)
                 newDelay = await self._async_do_open_blind()
                 if newDelay is not None:
                     delay = newDelay
-                await self._wait_and_set_state(self._blindOpenSecs, STATE_OPENING, STATE_OPEN, BLIND_POS_OPEN, self._blindMaxSteps)
+                await self._wait_and_set_state(delay, STATE_OPENING, STATE_OPEN, BLIND_POS_OPEN, self._blindMaxSteps)
 
     async def _async_set_cover_tilt_step(self, tilt_step, syncMidPos=True):
         """Move the cover tilt to a specific step."""
-        _LOGGER.info("Invoked _async_set_cover_tilt_step")
 
         if self._blind_is_stationary():
             # If the tilt step is 0 or the blind is not already clopsed then close it
@@ -407,33 +846,25 @@ class AbstractTiltingCover(RfxtrxCommandEntity, CoverEntity):
             else:
                 steps = tilt_step - self._tilt_step
 
-                _LOGGER.info(
-                    "Tilting to required position;" +
-                    " target=" + str(tilt_step) +
-                    " from=" + str(self._tilt_step) +
-                    " steps=" + str(steps))
-
                 if steps != 0:
                     if self._syncMidPos and syncMidPos:
                         if steps < 0 and tilt_step < self._blindMidSteps and self._tilt_step > self._blindMidSteps:
+                            # Tilt crosses mid point from high - syncing mid position
                             steps = steps + \
                                 (self._tilt_step - self._blindMidSteps)
-                            _LOGGER.info(
-                                "Tilt crosses mid point from high - syncing mid position; steps remaining=" + str(steps))
                             await self._async_tilt_blind_to_mid_step()
                         elif steps > 0 and tilt_step > self._blindMidSteps and self._tilt_step < self._blindMidSteps:
+                            # Tilt crosses mid point from low - syncing mid position
                             steps = steps - \
                                 (self._blindMidSteps - self._tilt_step)
-                            _LOGGER.info(
-                                "Tilt crosses mid point from low - syncing mid position; steps remaining=" + str(steps))
                             await self._async_tilt_blind_to_mid_step()
                     self._tilt_step = await self._async_tilt_blind_to_step(steps, tilt_step)
+                    self._journal_settled()
 
                 self.async_write_ha_state()
 
     async def _async_tilt_blind_to_mid_step(self):
         """Move the cover tilt to a preset position."""
-        _LOGGER.info("Invoked _async_tilt_blind_to_mid_step")
 
         if not self._hasMidCommand:
             _LOGGER.error("Blind does not support a mid step command")
@@ -446,23 +877,56 @@ class AbstractTiltingCover(RfxtrxCommandEntity, CoverEntity):
                 self._state = STATE_OPENING
                 delay = self._blindSyncSecs
 
-            _LOGGER.info("Setting mid position")
             newDelay = await self._async_do_tilt_blind_to_mid()
             if newDelay is not None:
                 delay = newDelay
             await self._wait_and_set_state(delay, STATE_OPENING, STATE_CLOSED, BLIND_POS_CLOSED, self._blindMidSteps)
 
+    async def _async_restore_cover_state(self, state, lift, tilt):
+        """Move the cover to a recorded state using the fewest operations."""
+        if lift != BLIND_POS_CLOSED:
+            await self._async_set_cover_position(lift)
+        elif tilt <= 0:
+            await self._async_set_cover_position(BLIND_POS_CLOSED)
+        else:
+            # Tilting is only possible from closed. The mid command gets there from any position and
+            # leaves fewer steps to go, so prefer it over a full close when the blind has one
+            if self._state != STATE_CLOSED or self._lift_position != BLIND_POS_CLOSED:
+                if self._hasMidCommand:
+                    await self._async_tilt_blind_to_mid_step()
+                else:
+                    await self._async_set_cover_position(BLIND_POS_CLOSED)
+
+            if tilt == self._blindMidSteps and self._hasMidCommand:
+                if self._tilt_step != tilt:
+                    await self._async_tilt_blind_to_mid_step()
+            else:
+                await self._async_set_cover_tilt_step(tilt)
+
+    # Single steps are added to a pending delta rather than each being run as its own operation. The
+    # first press moves the blind and, while it does, further presses only add to the delta. When the
+    # move finishes the blind goes straight to the combined target, so a run of presses costs one move
+    # for the first press and one for the rest, and presses made while the blind is moving are not lost.
     async def _async_repeat_tilt(self, direction, maxSteps=0):
         if maxSteps <= 1:
             self._autoStepDirection = 0
             self._autoStepActive = False
-            newTilt = self._tilt_step + direction
-            if newTilt >= 0 and newTilt <= self._blindMaxSteps:
-                await self._async_set_cover_tilt_step(newTilt)
+            self._nudgeDelta += direction
+            if self._nudgeActive:
+                return
+
+            self._nudgeActive = True
+            try:
+                while self._nudgeDelta != 0:
+                    newTilt = min(max(self._tilt_step + self._nudgeDelta, 0),
+                                  self._blindMaxSteps)
+                    self._nudgeDelta = 0
+                    if newTilt != self._tilt_step:
+                        await self._async_set_cover_tilt_step(newTilt)
+            finally:
+                self._nudgeActive = False
         else:
             if not(self._autoStepActive) and self._autoStepDirection != direction:
-                _LOGGER.info(
-                    "Starting auto repeating tilt, direction=" + str(direction))
                 self._autoStepDirection = direction
                 self._autoStepActive = True
                 steps = maxSteps
@@ -473,51 +937,216 @@ class AbstractTiltingCover(RfxtrxCommandEntity, CoverEntity):
                         self._autoStepActive = False
                     else:
                         await self._async_set_cover_tilt_step(newTilt)
-                        _LOGGER.info("Waiting repeast secs = " +
-                                     str(self._blindRepeatStepSecs))
-                        await asyncio.sleep(self._blindRepeatStepSecs)
+                        self._recorder.record(EVENT_WAIT, self._blindRepeatStepSecs, "repeat step")
+                        await self._async_sleep(self._blindRepeatStepSecs)
                         steps = steps - 1
-                _LOGGER.info("Finished auto repeating tilt")
             else:
-                _LOGGER.info("Ignoring duplicate auto repeating tilt")
+                self._recorder.record(EVENT_IGNORED, "duplicate auto repeating tilt")
+
+    # Works out the airtime of an operation from its plan for the blind's current state, once with the
+    # configured signal repetitions and once with those chosen from the link quality. Nothing is sent.
+
+    async def async_airtime(self, **kwargs):
+        """Return the airtime an operation would take with fixed and with adaptive repetitions."""
+        operation, args = self._move_operation(kwargs)
+        plan = await self._async_plan(operation.__wrapped__, **args)
+        transmitter = self.hass.data[DOMAIN][DATA_ROUTER].route(self._device_id, self._transceiver)
+        frames = sum(airtime(transmitter.encode((self._device_id, cmd), self._device.send_command, cmd))
+                     for _, cmd in plan.commands)
+        return {
+            "entity_id": self.entity_id,
+            "repetitions_before": self.signal_repetitions,
+            "repetitions_after": self._repetitions(),
+            "airtime_before": round(frames * self.signal_repetitions, 3),
+            "airtime_after": round(frames * self._repetitions(), 3)
+        }
 
     # Helper functions
 
+    async def _async_plan(self, method, *args, **kwargs):
+        """Run an operation on a copy of the cover and return what it would have done."""
+        planner = copy.copy(self)
+        planner._plan = MotionPlan()
+        planner._recorder = FlightRecorder(1)
+        planner.async_write_ha_state = lambda: None
+        await method(planner, *args, **kwargs)
+        return planner._plan
+
+    async def _async_run_planned(self, method, args, kwargs):
+        plan = await self._async_plan(method, *args, **kwargs)
+        if not plan.commands:
+            # Nothing will move, so there is nothing to wait for
+            return await method(self, *args, **kwargs)
+
+        started = time.time()
+        future = self.hass.loop.create_future()
+        self._operations[future] = started + plan.duration
+        task = asyncio.current_task()
+        self._operationTasks.add(task)
+        self.async_write_ha_state()
+        succeeded = False
+        try:
+            result = await method(self, *args, **kwargs)
+            succeeded = True
+            link = self.hass.data[DOMAIN].get(DATA_LINK_QUALITY)
+            if link is not None:
+                link.operation(self._device_id)
+            return result
+        except asyncio.CancelledError:
+            # Cancelled by an emergency retract, which the caller does not need to hear about
+            if task not in self._preempted:
+                raise
+            self._recorder.record(EVENT_IGNORED, "preempted")
+        finally:
+            self._operationTasks.discard(task)
+            self._preempted.discard(task)
+            del self._operations[future]
+            future.set_result(succeeded)
+            self.hass.data[DOMAIN][DATA_COMPLETIONS].add(
+                self.entity_id, method.__name__.lstrip("_")[len("async_"):],
+                plan.duration, time.time() - started, succeeded)
+            self.async_write_ha_state()
+
+    async def _async_sleep(self, delay):
+        if self._plan is not None:
+            self._plan.wait(delay)
+        else:
+            await asyncio.sleep(delay)
+
     async def _set_state(self, newState, newLift, newTilt):
         self._state = newState
         self._lift_position = newLift
         self._tilt_step = newTilt
+        self._recorder.record(EVENT_STATE, newState, newLift, newTilt)
+        if not(self._state == STATE_OPENING or self._state == STATE_CLOSING):
+            self._journal_settled()
         self.async_write_ha_state()
 
     async def _wait_and_set_state(self, delay, state, newState, newLift, newTilt):
-        if delay > 0:
-            _LOGGER.info("Waiting secs = " + str(delay))
-            await asyncio.sleep(delay)
+        if self._plan is not None:
+            self._plan.wait(delay)
+        else:
+            self.hass.data[DOMAIN][DATA_JOURNAL].append_motion(
+                self._unique_id, self._state, self._lift_position, self._tilt_step,
+                newState, newLift, newTilt, time.time() + max(delay, 0))
+
+            if delay > 0:
+                self._recorder.record(EVENT_WAIT, delay, newState)
+                self._start_motion(delay, newState, newLift, newTilt)
+                try:
+                    await asyncio.sleep(delay)
+                finally:
+                    self._end_motion()
 
         # If the blind is still closing then we have finished. Otherwise assume we were interrupted
         if self._state == state:
-            _LOGGER.info("Finished blind action, setting state = " + newState)
             await self._set_state(newState, newLift, newTilt)
         else:
-            _LOGGER.info(
-                "Finished blind action, state not as expected; " + self._state)
+            self._recorder.record(EVENT_IGNORED, "interrupted", self._state)
+
+    def _journal_settled(self):
+        self._lastSettled = self._reported_now()
+        if self._plan is not None:
+            return
+        self.hass.data[DOMAIN][DATA_JOURNAL].append_settled(
+            self._unique_id, self._state, self._lift_position, self._tilt_step)
+
+    # Keep the start, end and reported positions of a timed motion so that the motion stream can
+    # estimate where the blind is part way through. The motion starts from where the blind last
+    # settled, as the state at this point already reflects the motion being under way.
+
+    def _start_motion(self, delay, newState, newLift, newTilt):
+        start = time.monotonic()
+        if self._lastSettled is None:
+            self._lastSettled = self._reported_now()
+        self._motion = (start, start + delay) + self._lastSettled + (
+            self._reported_position(newLift, newTilt), self._reported_tilt(newState, newTilt))
+        self.hass.data[DOMAIN][DATA_MOTION_STREAM].add(self)
+
+    def _end_motion(self):
+        self._motion = None
+        self.hass.data[DOMAIN][DATA_MOTION_STREAM].discard(self)
+
+    def estimated_motion(self, now):
+        """Return the estimated position and tilt position part way through a motion."""
+        start, end, fromPosition, fromTilt, toPosition, toTilt = self._motion
+        progress = min(max((now - start) / (end - start), 0), 1)
+        position = round(fromPosition + (toPosition - fromPosition) * progress)
+        if fromTilt is None or toTilt is None:
+            # Covers with no tilt report none part way through a motion either
+            return position, None
+        return position, round(fromTilt + (toTilt - fromTilt) * progress)
+
+    # Work out where the blind is from the journal written before a restart. A blind that was part way
+    # through a motion will have carried on to the end of it, so either it has arrived by now or it is
+    # left moving for whatever remains of the motion.
+
+    def _recover_journal(self):
+        record = self.hass.data[DOMAIN][DATA_JOURNAL].get(self._unique_id)
+        if record is None:
+            return False
+
+        if len(record) <= RECORD_DEADLINE:
+            self._state, self._lift_position, self._tilt_step = record
+            return True
+
+        remaining = record[RECORD_DEADLINE] - time.time()
+        if remaining <= 0:
+            self._state = record[RECORD_TARGET_STATE]
+            self._lift_position = record[RECORD_TARGET_LIFT]
+            self._tilt_step = record[RECORD_TARGET_TILT]
+        else:
+            self._state, self._lift_position, self._tilt_step = record[:RECORD_TARGET_STATE]
+            self.hass.async_create_task(self._wait_and_set_state(
+                remaining, self._state,
+                record[RECORD_TARGET_STATE], record[RECORD_TARGET_LIFT], record[RECORD_TARGET_TILT]))
+        return True
 
     def _ignore_bounce(self):
         last = self._lastCommandTime
         self._lastCommandTime = time.time()
         if (self._lastCommandTime - last) <= COMMAND_DEBOUNCE_SEC:
-            _LOGGER.info("Duplicate command - will ignore request")
+            self._recorder.record(EVENT_IGNORED, "duplicate command")
             return False
         else:
             return True
 
     def _blind_is_stationary(self):
         if self._state == STATE_OPENING or self._state == STATE_CLOSING:
-            _LOGGER.info("Blind is in motion - will ignore request")
+            self._recorder.record(EVENT_IGNORED, "blind is in motion")
             return False
         else:
             return True
 
+    def _reported_now(self):
+        return (self._reported_position(self._lift_position, self._tilt_step),
+                self._reported_tilt(self._state, self._tilt_step))
+
+    def _reported_tilt(self, state, tilt_step):
+        if state == STATE_OPEN:
+            tilt = TILT_POS_OPEN
+        elif tilt_step == 0:
+            tilt = TILT_POS_CLOSED_MIN
+        elif tilt_step == self._blindMidSteps:
+            tilt = TILT_POS_OPEN
+        elif tilt_step >= self._blindMaxSteps:
+            tilt = TILT_POS_CLOSED_MAX
+        else:
+            tilt = self._steps_to_tilt(tilt_step)
+        return tilt
+
+    def _reported_position(self, lift, tilt_step):
+        if lift == BLIND_POS_CLOSED:
+            if tilt_step <= 0 or tilt_step >= self._blindMaxSteps:
+                position = BLIND_POS_CLOSED
+            else:
+                position = BLIND_POS_TILTED_MIN
+        elif lift == BLIND_POS_OPEN:
+            position = BLIND_POS_OPEN
+        else:
+            position = BLIND_POS_STOPPED
+        return position
+
     def _tilt_to_steps(self, tilt):
         steps = min(round(tilt / 50 * self._blindMidSteps),
                     self._blindMaxSteps)
@@ -527,29 +1156,118 @@ class AbstractTiltingCover(RfxtrxCommandEntity, CoverEntity):
         tilt = min(round(steps / self._blindMidSteps * 50), 100)
         return tilt
 
+    def _repetitions(self):
+        """Return the number of times to send each frame to the blind"""
+        link = self.hass.data[DOMAIN].get(DATA_LINK_QUALITY)
+        if link is None:
+            return self.signal_repetitions
+        return link.repetitions(self._device_id, self.signal_repetitions,
+                                self._minRepetitions, self._maxRepetitions)
+
     async def _async_send_command(self, cmd):
         """Send a command to the blind"""
-        _LOGGER.info("LOW-LEVEL SENDING BLIND COMMAND - " + str(cmd))
-        await self._async_send(self._device.send_command, cmd)
+        self._recorder.record(EVENT_COMMAND, cmd)
+        if self._plan is not None:
+            self._plan.command(cmd)
+            return
+        transmitter = self.hass.data[DOMAIN][DATA_ROUTER].route(
+            self._device_id, self._transceiver)
+        priority = self._emergency is not None
+        try:
+            await transmitter.async_send((self._device_id, cmd), self._repetitions(),
+                                         self._device.send_command, cmd,
+                                         max_pending=self._maxPending, shed_policy=self._shedPolicy,
+                                         priority=priority)
+            if priority and not self._emergency.done():
+                self._emergency.set_result(time.monotonic())
+        except HomeAssistantError as err:
+            self._recorder.record(EVENT_FAILED, cmd, err)
+            # The command never went out so the blind is wherever it was before this operation. That is
+            # not recorded, so leave the blind stationary at an unknown position to force a full move next time
+            if self._state == STATE_OPENING or self._state == STATE_CLOSING:
+                await self._set_state(STATE_OPEN, BLIND_POS_STOPPED, 0)
+            raise
+
+    async def _async_send_sequence(self, steps):
+        """Send commands to the blind at offsets in seconds from the first"""
+        steps = self._spaced_steps(steps)
+        for cmd, offset in steps:
+            self._recorder.record(EVENT_COMMAND, cmd, offset)
+        if self._plan is not None:
+            for cmd, offset in steps:
+                self._plan.command(cmd, offset)
+            self._plan.wait(max(offset for _, offset in steps))
+            return
+        transmitter = self.hass.data[DOMAIN][DATA_ROUTER].route(
+            self._device_id, self._transceiver)
+        repetitions = self._repetitions()
+        frames = [(transmitter.encode((self._device_id, cmd), self._device.send_command, cmd)
+                   * repetitions, offset) for cmd, offset in steps]
+        try:
+            await transmitter.async_send_sequence(self._device_id, frames,
+                                                  max_pending=self._maxPending, shed_policy=self._shedPolicy)
+        except HomeAssistantError as err:
+            self._recorder.record(EVENT_FAILED, steps, err)
+            if self._state == STATE_OPENING or self._state == STATE_CLOSING:
+                await self._set_state(STATE_OPEN, BLIND_POS_STOPPED, 0)
+            raise
+
+    # Sends a sequence of commands while waiting out the motion started by the first of them. The
+    # later commands are already queued with the transmitter when the wait ends, so they go out as
+    # soon as the motor can take them instead of only being queued once the wait is over.
+
+    async def _async_send_pipelined(self, steps, delay, state, newState, newLift, newTilt):
+        """Send commands at offsets while waiting for the first to move the blind to a new state"""
+        if self._plan is not None:
+            await self._async_send_sequence(steps)
+            if self._state == state:
+                await self._set_state(newState, newLift, newTilt)
+            return
+
+        sending = self.hass.async_create_task(self._async_send_sequence(steps))
+        try:
+            await self._wait_and_set_state(delay, state, newState, newLift, newTilt)
+        except asyncio.CancelledError:
+            sending.cancel()
+            raise
+        await sending
+
+    def _spaced_steps(self, steps):
+        """Return steps moved later where needed to keep the driver's gap between commands"""
+        spaced = []
+        for cmd, offset in steps:
+            if spaced:
+                offset = max(offset, spaced[-1][1] + self.MIN_COMMAND_GAP_SEC)
+            spaced.append((cmd, offset))
+        return spaced
 
     # Handle updates from cover device
 
     async def async_update(self):
         """Query the switch in this light switch and determine the state."""
-        _LOGGER.debug("Invoked async_update")
 
     def _apply_event(self, event):
         """Apply command from rfxtrx."""
-        _LOGGER.debug("Invoked _apply_event")
         super()._apply_event(event)
 
+    # Packets come from the primary transceiver through the rfxtrx integration, and from additional
+    # transceivers through the router. The signal is recorded under the transceiver that heard it, and
+    # only the primary's packets change the state, so a press heard by several is applied once.
+
     @callback
-    def _handle_event(self, event, device_id):
+    def _handle_event(self, event, device_id, transceiver=PRIMARY_TRANSCEIVER):
         """Check if event applies to me and update."""
-        _LOGGER.debug("Invoked _handle_event")
         if device_id != self._device_id:
             return
 
+        rssi = event.values.get("Rssi numeric") if hasattr(event, "values") else None
+        if rssi is not None:
+            self.hass.data[DOMAIN][DATA_ROUTER].observe(
+                device_id, transceiver, rssi)
+
+        if transceiver != PRIMARY_TRANSCEIVER:
+            return
+
         self._apply_event(event)
         self.async_write_ha_state()
 
@@ -566,37 +1284,31 @@ class AbstractTiltingCover(RfxtrxCommandEntity, CoverEntity):
                 delay = await self._async_do_tilt_blind_back()
 
             if delay is not None:
-                _LOGGER.info("Delaying for " + str(delay))
-                await asyncio.sleep(delay)
+                self._recorder.record(EVENT_WAIT, delay, "step")
+                await self._async_sleep(delay)
 
         return target
 
     # Replace with action to close blind
     async def _async_do_close_blind(self):
         """Callback to close the blind"""
-        _LOGGER.info("LOW-LEVEL CLOSING BLIND")
 
     # Replace with action to open blind
     async def _async_do_open_blind(self):
         """Callback to open the blind"""
-        _LOGGER.info("LOW-LEVEL OPENING BLIND")
 
     # Replace with action to stop blind
     async def _async_do_stop_blind(self):
         """Callback to stop the blind"""
-        _LOGGER.info("LOW-LEVEL STOPPING BLIND")
 
     # Replace with action to tilt blind to mid position
     async def _async_do_tilt_blind_to_mid(self):
         """Callback to tilt the blind to mid"""
-        _LOGGER.info("LOW-LEVEL TILTING BLIND TO MID")
 
     # Replace with action to tilt blind forward one step
     async def _async_do_tilt_blind_forward(self):
         """Callback to tilt the blind forward"""
-        _LOGGER.info("LOW-LEVEL TILTING BLIND FORWARD")
 
     # Replace with action to tilt blind backward one step
     async def _async_do_tilt_blind_back(self):
         """Callback to tilt the blind backward"""
-        _LOGGER.info("LOW-LEVEL TILTING BLIND BACKWARD")
@@ -0,0 +1,73 @@
+"""Timeline of the airtime reserved by timed sequences of RFXtrx frames.
+
+Shared by the transmitter in Home Assistant and the standalone daemon, so this module only needs the
+standard library and the constants.
+"""
+try:
+    from .const import (
+        AIRTIME_SEC,
+        DEF_AIRTIME_SEC
+    )
+except ImportError:
+    # Loaded by daemon.py run as a script, outside the package
+    from const import (
+        AIRTIME_SEC,
+        DEF_AIRTIME_SEC
+    )
+
+
+def airtime(data):
+    """Return the estimated time on air of a run of packets."""
+    total = 0
+    index = 0
+    while index + 1 < len(data):
+        total += AIRTIME_SEC.get(data[index + 1], DEF_AIRTIME_SEC)
+        index += data[index] + 1
+    return total
+
+
+# Each sequence reserves the airtime of its frames at their offsets, and the whole sequence is moved
+# later until none of its frames overlaps a frame reserved by another. Once its first frame is on air
+# the rest of its reservation moves with it, and it is released when the last frame is out.
+class AirtimeTimeline:
+    """Airtime reserved by the frames of timed sequences."""
+
+    def __init__(self):
+        self._slots = []
+
+    def reserve(self, owner, spans, earliest, now):
+        """Reserve airtime for (offset, length) spans, returning the earliest start at which none overlaps."""
+        self._slots = [slot for slot in self._slots if slot[1] > now]
+        start = earliest
+        moved = True
+        while moved:
+            moved = False
+            for offset, length in spans:
+                end = self.clash(start + offset, length)
+                if end is not None:
+                    start = end - offset
+                    moved = True
+        self._slots.extend((start + offset, start + offset + length, owner)
+                           for offset, length in spans)
+        return start
+
+    def clash(self, start, length):
+        """Return the end of a reserved frame that airtime from start would overlap, or None."""
+        for slotStart, slotEnd, _ in self._slots:
+            if start < slotEnd and slotStart < start + length:
+                return slotEnd
+        return None
+
+    def shift(self, owner, delta):
+        """Move the reservation of a sequence whose first frame went on air later than planned."""
+        if delta:
+            self._slots = [(start + delta, end + delta, slotOwner) if slotOwner is owner
+                           else (start, end, slotOwner) for start, end, slotOwner in self._slots]
+
+    def release(self, owner):
+        """Drop the reservation of a sequence."""
+        self._slots = [slot for slot in self._slots if slot[2] is not owner]
+
+    def clear(self):
+        """Drop every reservation."""
+        self._slots.clear()
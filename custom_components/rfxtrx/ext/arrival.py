@@ -0,0 +1,76 @@
+"""Scheduling of cover operations to finish at a given time."""
+import datetime
+import logging
+import time
+from homeassistant.core import callback
+from homeassistant.util import dt as dt_util
+from .. import DOMAIN
+from .const import DATA_ARRIVALS
+
+_LOGGER = logging.getLogger(__name__)
+
+# Shortest time between commands of different covers sharing a transceiver
+ARRIVAL_GAP_SEC = 0.5
+
+
+def next_arrival(value):
+    """Return the timestamp of an arrival given as a time of day or a date and time."""
+    if isinstance(value, datetime.time):
+        # Combined naive and localised after, so the offset is the one in force on the arrival day
+        now = dt_util.now()
+        arrival = datetime.datetime.combine(now.date(), value)
+        if dt_util.DEFAULT_TIME_ZONE.localize(arrival) <= now:
+            arrival += datetime.timedelta(days=1)
+        value = arrival
+    if value.tzinfo is None:
+        value = dt_util.DEFAULT_TIME_ZONE.localize(value)
+    return dt_util.as_utc(value).timestamp()
+
+
+# Covers scheduled to arrive at the same time would all start their commands together and swamp the
+# transceiver, with some blinds arriving late while their commands wait in the queue. Each cover
+# reserves the times its planned commands will be sent, and a cover that would clash with another on
+# the same transceiver starts a little earlier instead, so every blind still arrives on time.
+class ArrivalScheduler:
+    """Staggers the start of scheduled operations on each transceiver."""
+
+    def __init__(self):
+        self._reserved = {}
+        self._owners = {}
+
+    @callback
+    def reserve(self, transmitter, owner, arrival, duration, offsets):
+        """Reserve the latest start that arrives in time without clashing, and return it."""
+        self.release(owner)
+        now = time.time()
+        reserved = self._reserved.setdefault(transmitter, {})
+        for other in [other for other, times in reserved.items() if max(times) < now]:
+            del reserved[other]
+            del self._owners[other]
+        taken = sorted(sent for times in reserved.values() for sent in times)
+
+        start = arrival - duration
+        while True:
+            clash = next(((sent, offset) for sent in taken for offset in offsets
+                          if abs(start + offset - sent) < ARRIVAL_GAP_SEC), None)
+            if clash is None:
+                break
+            start = clash[0] - ARRIVAL_GAP_SEC - clash[1]
+
+        reserved[owner] = [start + offset for offset in offsets] or [start]
+        self._owners[owner] = transmitter
+        return start
+
+    @callback
+    def release(self, owner):
+        """Give up the times reserved for a cover."""
+        transmitter = self._owners.pop(owner, None)
+        if transmitter is not None:
+            del self._reserved[transmitter][owner]
+
+
+def async_setup_arrivals(hass):
+    """Create the arrival scheduler for the covers."""
+    scheduler = ArrivalScheduler()
+    hass.data[DOMAIN][DATA_ARRIVALS] = scheduler
+    return scheduler
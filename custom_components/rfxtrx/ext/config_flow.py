@@ -1,6 +1,16 @@
+import csv
+import io
 import voluptuous as vol
 import logging
+import yaml
 from homeassistant.components.rfxtrx.cover import supported as cover_supported
+from homeassistant.components.rfxtrx.const import (
+    CONF_SIGNAL_REPETITIONS,
+    CONF_VENETIAN_BLIND_MODE,
+    CONST_VENETIAN_BLIND_MODE_EU,
+    CONST_VENETIAN_BLIND_MODE_US
+)
+from homeassistant.const import CONF_DEVICE_ID
 from .const import (
     DEF_CLOSE_SECONDS,
     DEF_OPEN_SECONDS,
@@ -10,6 +20,12 @@ from .const import (
     DEF_SYNC_MID,
     DEF_TILT_POS1_MS,
     DEF_TILT_POS2_MS,
+    DEF_SEGMENT_MS,
+    DEF_MAX_PENDING,
+    DEF_MAX_REPETITIONS,
+    DEF_MIN_REPETITIONS,
+    DEF_SHED_POLICY,
+    DEF_TRANSCEIVER,
     CONF_CLOSE_SECONDS,
     CONF_OPEN_SECONDS,
     CONF_SYNC_SECONDS,
@@ -18,13 +34,28 @@ from .const import (
     CONF_SYNC_MID,
     CONF_TILT_POS1_MS,
     CONF_TILT_POS2_MS,
+    CONF_SEGMENT_MS,
+    CONF_MAX_PENDING,
+    CONF_MAX_REPETITIONS,
+    CONF_MIN_REPETITIONS,
+    CONF_SHED_POLICY,
+    CONF_TRANSCEIVER,
+    CONST_SHED_POLICY_REJECT,
+    CONST_SHED_POLICY_SUPERSEDE,
     DEVICE_PACKET_TYPE_RFY,
     DEVICE_PACKET_TYPE_BLINDS1,
+    DEVICE_PACKET_SUBTYPE_BLINDST18,
     DEVICE_PACKET_SUBTYPE_BLINDST19
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+DRIVER_SOMFY_VENETIAN = "somfy_venetian"
+DRIVER_LOUVOLITE_VOGUE = "louvolite_vogue"
+DRIVER_TIMED_ROLLER = "timed_roller"
+
+BULK_KEY_EVENT_CODE = "event_code"
+
 
 def update_device_options(device, user_input):
     device[CONF_SUPPORTS_MID] = user_input.get(
@@ -41,67 +72,235 @@ def update_device_options(device, user_input):
         CONF_TILT_POS1_MS, DEF_TILT_POS1_MS)
     device[CONF_TILT_POS2_MS] = user_input.get(
         CONF_TILT_POS2_MS, DEF_TILT_POS2_MS)
+    device[CONF_SEGMENT_MS] = user_input.get(
+        CONF_SEGMENT_MS, DEF_SEGMENT_MS)
+    device[CONF_MAX_PENDING] = user_input.get(
+        CONF_MAX_PENDING, DEF_MAX_PENDING)
+    device[CONF_SHED_POLICY] = user_input.get(
+        CONF_SHED_POLICY, DEF_SHED_POLICY)
+    device[CONF_TRANSCEIVER] = user_input.get(
+        CONF_TRANSCEIVER, DEF_TRANSCEIVER)
+    device[CONF_MIN_REPETITIONS] = user_input.get(
+        CONF_MIN_REPETITIONS, DEF_MIN_REPETITIONS)
+    device[CONF_MAX_REPETITIONS] = user_input.get(
+        CONF_MAX_REPETITIONS, DEF_MAX_REPETITIONS)
+
+
+def _command_queue_schema(device_data):
+    return {
+        vol.Optional(
+            CONF_MAX_PENDING,
+            default=device_data.get(
+                CONF_MAX_PENDING, DEF_MAX_PENDING),
+        ): int,
+        vol.Optional(
+            CONF_SHED_POLICY,
+            default=device_data.get(
+                CONF_SHED_POLICY, DEF_SHED_POLICY),
+        ): vol.In(
+            [
+                CONST_SHED_POLICY_SUPERSEDE,
+                CONST_SHED_POLICY_REJECT
+            ]
+        ),
+        vol.Optional(
+            CONF_TRANSCEIVER,
+            default=device_data.get(
+                CONF_TRANSCEIVER, DEF_TRANSCEIVER),
+        ): str,
+        vol.Optional(
+            CONF_MIN_REPETITIONS,
+            default=device_data.get(
+                CONF_MIN_REPETITIONS, DEF_MIN_REPETITIONS),
+        ): int,
+        vol.Optional(
+            CONF_MAX_REPETITIONS,
+            default=device_data.get(
+                CONF_MAX_REPETITIONS, DEF_MAX_REPETITIONS),
+        ): int,
+    }
 
 
 def update_data_schema(data_schema, device_object, device_data):
-    if (cover_supported(device_object)):
-        if device_object.device.packettype == DEVICE_PACKET_TYPE_RFY:
-            # Add Somfy RFY venetian tilt options
-            data_schema.update(
-                {
-                    # vol.Optional(
-                    #     CONF_SUPPORTS_MID,
-                    #     default=device_data.get(
-                    #         CONF_SUPPORTS_MID, DEF_SUPPORTS_MID)
-                    # ): bool,
-                    # vol.Optional(
-                    #     CONF_SYNC_MID,
-                    #     default=device_data.get(CONF_SYNC_MID, DEF_SYNC_MID),
-                    # ): bool,
-                    # vol.Optional(
-                    #     CONF_STEPS_MID,
-                    #     default=device_data.get(CONF_STEPS_MID, DEF_STEPS_MID),
-                    # ): int,
-                    vol.Optional(
-                        CONF_OPEN_SECONDS,
-                        default=device_data.get(
-                            CONF_OPEN_SECONDS, DEF_OPEN_SECONDS),
-                    ): int,
-                    vol.Optional(
-                        CONF_CLOSE_SECONDS,
-                        default=device_data.get(
-                            CONF_CLOSE_SECONDS, DEF_CLOSE_SECONDS),
-                    ): int,
-                    vol.Optional(
-                        CONF_SYNC_SECONDS,
-                        default=device_data.get(
-                            CONF_SYNC_SECONDS, DEF_SYNC_SECONDS),
-                    ): int,
-                    vol.Optional(
-                        CONF_TILT_POS1_MS,
-                        default=device_data.get(
-                            CONF_TILT_POS1_MS, DEF_TILT_POS1_MS),
-                    ): int,
-                    vol.Optional(
-                        CONF_TILT_POS2_MS,
-                        default=device_data.get(
-                            CONF_TILT_POS2_MS, DEF_TILT_POS2_MS),
-                    ): int,
-                }
-            )
-        elif device_object.device.packettype == DEVICE_PACKET_TYPE_BLINDS1 and device_object.device.subtype == DEVICE_PACKET_SUBTYPE_BLINDST19:
-            # Add Lovolite Vogue vertical tilt options
-            data_schema.update(
-                {
-                    vol.Optional(
-                        CONF_OPEN_SECONDS,
-                        default=device_data.get(
-                            CONF_OPEN_SECONDS, DEF_OPEN_SECONDS),
-                    ): int,
-                    vol.Optional(
-                        CONF_CLOSE_SECONDS,
-                        default=device_data.get(
-                            CONF_CLOSE_SECONDS, DEF_CLOSE_SECONDS),
-                    ): int
-                }
-            )
+    driver = device_driver(device_object, device_data)
+    if driver == DRIVER_SOMFY_VENETIAN:
+        # Add Somfy RFY venetian tilt options
+        data_schema.update(
+            {
+                # vol.Optional(
+                #     CONF_SUPPORTS_MID,
+                #     default=device_data.get(
+                #         CONF_SUPPORTS_MID, DEF_SUPPORTS_MID)
+                # ): bool,
+                # vol.Optional(
+                #     CONF_SYNC_MID,
+                #     default=device_data.get(CONF_SYNC_MID, DEF_SYNC_MID),
+                # ): bool,
+                # vol.Optional(
+                #     CONF_STEPS_MID,
+                #     default=device_data.get(CONF_STEPS_MID, DEF_STEPS_MID),
+                # ): int,
+                vol.Optional(
+                    CONF_OPEN_SECONDS,
+                    default=device_data.get(
+                        CONF_OPEN_SECONDS, DEF_OPEN_SECONDS),
+                ): int,
+                vol.Optional(
+                    CONF_CLOSE_SECONDS,
+                    default=device_data.get(
+                        CONF_CLOSE_SECONDS, DEF_CLOSE_SECONDS),
+                ): int,
+                vol.Optional(
+                    CONF_SYNC_SECONDS,
+                    default=device_data.get(
+                        CONF_SYNC_SECONDS, DEF_SYNC_SECONDS),
+                ): int,
+                vol.Optional(
+                    CONF_TILT_POS1_MS,
+                    default=device_data.get(
+                        CONF_TILT_POS1_MS, DEF_TILT_POS1_MS),
+                ): int,
+                vol.Optional(
+                    CONF_TILT_POS2_MS,
+                    default=device_data.get(
+                        CONF_TILT_POS2_MS, DEF_TILT_POS2_MS),
+                ): int,
+            }
+        )
+        data_schema.update(_command_queue_schema(device_data))
+    elif driver == DRIVER_LOUVOLITE_VOGUE:
+        # Add Lovolite Vogue vertical tilt options
+        data_schema.update(
+            {
+                vol.Optional(
+                    CONF_OPEN_SECONDS,
+                    default=device_data.get(
+                        CONF_OPEN_SECONDS, DEF_OPEN_SECONDS),
+                ): int,
+                vol.Optional(
+                    CONF_CLOSE_SECONDS,
+                    default=device_data.get(
+                        CONF_CLOSE_SECONDS, DEF_CLOSE_SECONDS),
+                ): int,
+                vol.Optional(
+                    CONF_SEGMENT_MS,
+                    default=device_data.get(
+                        CONF_SEGMENT_MS, DEF_SEGMENT_MS),
+                ): int
+            }
+        )
+        data_schema.update(_command_queue_schema(device_data))
+    elif driver == DRIVER_TIMED_ROLLER:
+        # Add roller travel time options
+        data_schema.update(
+            {
+                vol.Optional(
+                    CONF_OPEN_SECONDS,
+                    default=device_data.get(
+                        CONF_OPEN_SECONDS, DEF_OPEN_SECONDS),
+                ): int,
+                vol.Optional(
+                    CONF_CLOSE_SECONDS,
+                    default=device_data.get(
+                        CONF_CLOSE_SECONDS, DEF_CLOSE_SECONDS),
+                ): int
+            }
+        )
+        data_schema.update(_command_queue_schema(device_data))
+
+
+def device_driver(device_object, device_data=None):
+    """Return the name of the stateful driver for a device, or None if it has none."""
+    if device_object is None or not cover_supported(device_object):
+        return None
+    if device_object.device.packettype == DEVICE_PACKET_TYPE_RFY:
+        # RFY blinds in standard mode are rollers with no tilt
+        venetian_blind_mode = (device_data or {}).get(CONF_VENETIAN_BLIND_MODE)
+        if venetian_blind_mode in (CONST_VENETIAN_BLIND_MODE_US, CONST_VENETIAN_BLIND_MODE_EU):
+            return DRIVER_SOMFY_VENETIAN
+        return DRIVER_TIMED_ROLLER
+    if device_object.device.packettype == DEVICE_PACKET_TYPE_BLINDS1 and device_object.device.subtype == DEVICE_PACKET_SUBTYPE_BLINDST19:
+        return DRIVER_LOUVOLITE_VOGUE
+    if device_object.device.packettype == DEVICE_PACKET_TYPE_BLINDS1 and device_object.device.subtype <= DEVICE_PACKET_SUBTYPE_BLINDST18:
+        return DRIVER_TIMED_ROLLER
+    return None
+
+
+# Options for editing many devices at once have no defaults, so a field left blank keeps each device's
+# own value rather than overwriting them all with one device's value.
+
+def bulk_options_schema(device_object, device_data):
+    """Return the schema of the options that can be set on many devices of one driver."""
+    data_schema = {}
+    update_data_schema(data_schema, device_object, device_data)
+    bulk_schema = {vol.Optional(CONF_SIGNAL_REPETITIONS): int}
+    # Keys are rebuilt without the defaults taken from the device
+    bulk_schema.update(
+        {vol.Optional(str(key)): validator for key, validator in data_schema.items()})
+    return bulk_schema
+
+
+def apply_bulk_options(device_data, options):
+    """Return a copy of device data with the given options applied and all others kept."""
+    device = dict(device_data)
+    merged = dict(device_data)
+    merged.update(options)
+    update_device_options(device, merged)
+    if CONF_SIGNAL_REPETITIONS in options:
+        device[CONF_SIGNAL_REPETITIONS] = options[CONF_SIGNAL_REPETITIONS]
+    return device
+
+
+def _coerce(value):
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            return value.strip()
+    return value
+
+
+def _read_bulk_import(text):
+    try:
+        data = yaml.safe_load(text)
+    except yaml.YAMLError:
+        data = None
+
+    if isinstance(data, dict):
+        rows = []
+        for key, options in data.items():
+            if options is not None and not isinstance(options, dict):
+                raise vol.Invalid("Options for " + str(key) + " are not a mapping")
+            rows.append((str(key), options or {}))
+        return rows
+
+    reader = csv.DictReader(io.StringIO(text.strip()))
+    if not reader.fieldnames or reader.fieldnames[0] not in (BULK_KEY_EVENT_CODE, CONF_DEVICE_ID):
+        raise vol.Invalid("CSV must start with an event_code or device_id column")
+    key = reader.fieldnames[0]
+    return [(row.pop(key), row) for row in reader]
+
+
+def parse_bulk_import(text, device_objects, devices):
+    """Parse YAML or CSV device options into updated device data keyed by event code.
+
+    YAML maps each device to its options. CSV has a header row naming the options, with the device in
+    the first column. Devices are named by event code or by device id, for example 19_13_0a1b2c.
+    """
+    lookup = {}
+    for event_code in device_objects:
+        lookup[event_code] = event_code
+        device_id = devices[event_code].get(CONF_DEVICE_ID)
+        if device_id:
+            lookup["_".join(device_id)] = event_code
+
+    updates = {}
+    for key, options in _read_bulk_import(text):
+        event_code = lookup.get(key.strip())
+        if event_code is None:
+            raise vol.Invalid("Unknown device " + key)
+        options = vol.Schema(bulk_options_schema(device_objects[event_code], devices[event_code]))(
+            {name: _coerce(value) for name, value in options.items() if value not in (None, "")})
+        updates[event_code] = apply_bulk_options(
+            updates.get(event_code, devices[event_code]), options)
+    return updates
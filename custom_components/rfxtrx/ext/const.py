@@ -9,6 +9,25 @@ CONF_SYNC_MID = "midpoint_sync"
 CONF_TILT_POS1_MS = "tilt1_ms"
 CONF_TILT_POS2_MS = "tilt2_ms"
 
+CONF_SEGMENT_MS = "segment_ms"
+
+CONF_MAX_PENDING = "max_pending_commands"
+CONF_SHED_POLICY = "shed_policy"
+
+CONF_MIN_REPETITIONS = "min_signal_repetitions"
+CONF_MAX_REPETITIONS = "max_signal_repetitions"
+
+CONST_SHED_POLICY_SUPERSEDE = "supersede"
+CONST_SHED_POLICY_REJECT = "reject"
+
+CONF_TRANSCEIVER = "transceiver"
+
+CONF_COVER_GROUPS = "cover_groups"
+CONF_DISCOVER_COVERS = "discover_covers"
+CONF_DISCOVERY_SIGHTINGS = "discovery_sightings"
+
+CONST_TRANSCEIVER_AUTO = "auto"
+
 DEF_CLOSE_SECONDS = 30
 DEF_OPEN_SECONDS = 30
 DEF_SYNC_SECONDS = 2
@@ -19,14 +38,92 @@ DEF_SYNC_MID = False
 DEF_TILT_POS1_MS = 1750
 DEF_TILT_POS2_MS = 1750
 
+DEF_SEGMENT_MS = 0
+
+DEF_MAX_PENDING = 2
+DEF_SHED_POLICY = CONST_SHED_POLICY_SUPERSEDE
+
+DEF_TRANSCEIVER = CONST_TRANSCEIVER_AUTO
+
+# Adaptive repetitions are off unless a maximum is set
+DEF_MIN_REPETITIONS = 0
+DEF_MAX_REPETITIONS = 0
+
+DEF_DISCOVER_COVERS = False
+DEF_DISCOVERY_SIGHTINGS = 3
+
 DEVICE_PACKET_TYPE_BLINDS1 = 0x19
+DEVICE_PACKET_SUBTYPE_BLINDST18 = 0x12
 DEVICE_PACKET_SUBTYPE_BLINDST19 = 0x13
 DEVICE_PACKET_TYPE_RFY = 0x1a
 
+# Estimated time on air of one packet of each type, used to work out when a frame reached the motor
+AIRTIME_SEC = {
+    DEVICE_PACKET_TYPE_BLINDS1: 0.09,
+    DEVICE_PACKET_TYPE_RFY: 0.16
+}
+DEF_AIRTIME_SEC = 0.1
+
 DEVICE_TYPE_VOGUE_VERTICAL = "VogueVert"
 
 SVC_UPDATE_POSITION = "update_cover_position"
 SVC_INCREASE_TILT = "increase_cover_tilt"
 SVC_DECREASE_TILT = "decrease_cover_tilt"
+SVC_SNAPSHOT_STATE = "snapshot_cover_state"
+SVC_RESTORE_STATE = "restore_cover_state"
+SVC_DUMP_FLIGHT_RECORDER = "dump_flight_recorder"
+SVC_ENABLE_SUN_TRACKING = "enable_sun_tracking"
+SVC_DISABLE_SUN_TRACKING = "disable_sun_tracking"
+SVC_PROFILE = "profile_covers"
+SVC_MOVE_COVER = "move_cover"
+SVC_WAIT_FOR_MOTION = "wait_for_cover_motion"
+SVC_SET_POSITION_AND_TILT = "set_cover_position_and_tilt"
+SVC_EMERGENCY_RETRACT = "emergency_retract"
+SVC_SCHEDULE_ARRIVAL = "schedule_cover_arrival"
+SVC_REPORT_AIRTIME = "report_airtime"
 
 ATTR_AUTO_REPEAT = "repeat_automatically"
+ATTR_SNAPSHOT = "snapshot"
+ATTR_FACADE_AZIMUTH = "facade_azimuth"
+ATTR_HYSTERESIS = "hysteresis"
+ATTR_SLAT_RATIO = "slat_ratio"
+ATTR_DURATION = "duration"
+ATTR_OPERATION = "operation"
+ATTR_WAIT_FOR_COMPLETION = "wait_for_completion"
+ATTR_DRY_RUN = "dry_run"
+ATTR_TIMEOUT = "timeout"
+ATTR_MOTION_ETA = "motion_eta"
+ATTR_BROADCAST_ENTITY_ID = "broadcast_entity_id"
+ATTR_ARRIVE_AT = "arrive_at"
+
+DEF_SNAPSHOT = "default"
+DEF_SUN_HYSTERESIS = 0.25
+DEF_SLAT_RATIO = 1.0
+DEF_PROFILE_SECONDS = 60
+DEF_MOTION_TIMEOUT = 120
+
+DATA_COVER_SNAPSHOTS = "cover_snapshots"
+DATA_ROUTER = "cover_router"
+DATA_JOURNAL = "cover_journal"
+DATA_SUN_TRACKER = "cover_sun_tracker"
+DATA_MOTION_STREAM = "cover_motion_stream"
+DATA_COMPLETIONS = "cover_completions"
+DATA_EMERGENCY = "cover_emergency"
+DATA_ARRIVALS = "cover_arrivals"
+DATA_LINK_QUALITY = "cover_link_quality"
+
+SIGNAL_TRANSMITTER_STATE = "rfxtrx_transmitter_state"
+SIGNAL_TRANSCEIVER_EVENT = "rfxtrx_transceiver_event"
+
+EVENT_FLIGHT_RECORDER = "rfxtrx_flight_recorder"
+EVENT_MOTION_COMPLETE = "rfxtrx_cover_motion_complete"
+EVENT_MOTION_PLAN = "rfxtrx_cover_motion_plan"
+EVENT_EMERGENCY_RETRACT = "rfxtrx_emergency_retract"
+EVENT_AIRTIME_REPORT = "rfxtrx_airtime_report"
+
+WS_SUBSCRIBE_COVER_MOTION = "rfxtrx/subscribe_cover_motion"
+
+DEF_MOTION_INTERVAL_MS = 250
+
+# Position and tilt requests arriving within this long of each other are combined into one operation
+COMBINE_WINDOW_SEC = 0.3
@@ -4,6 +4,7 @@ from homeassistant.components.rfxtrx.cover import (
     CONF_DEVICES,
     supported
 )
+from homeassistant.components.rfxtrx.const import CONF_AUTOMATIC_ADD
 from homeassistant.components.rfxtrx import (
     CONF_DATA_BITS,
     get_device_id,
@@ -13,24 +14,60 @@ from . import (
     create_cover_entity,
     async_define_sync_services
 )
+from .abs_tilting_cover import AbstractTiltingCover
+from .arrival import async_setup_arrivals
+from .const import (
+    CONF_COVER_GROUPS,
+    CONF_DISCOVER_COVERS,
+    CONF_DISCOVERY_SIGHTINGS,
+    DEF_DISCOVER_COVERS,
+    DEF_DISCOVERY_SIGHTINGS
+)
+from .cover_group import CoverGroup
+from .discovery import async_setup_discovery
+from .emergency import async_setup_emergency
+from .journal import async_setup_journal
+from .link_quality import async_setup_link_quality
+from .motion_plan import async_setup_completions
+from .motion_stream import async_setup_motion_stream
+from .profiler import async_setup_profiler
+from .router import async_setup_router
+from .sun_tracker import async_setup_sun_tracker
 
 _LOGGER = logging.getLogger(__name__)
 
 
+async def async_setup_cover_support(hass, devices):
+    """Set up the routing, journal, trackers and services shared by the covers."""
+    await async_setup_router(hass, devices)
+    await async_setup_journal(hass)
+    async_setup_sun_tracker(hass)
+    async_setup_motion_stream(hass)
+    async_setup_completions(hass)
+    async_setup_emergency(hass)
+    async_setup_arrivals(hass)
+    async_setup_link_quality(hass)
+    async_setup_profiler(hass)
+
+
 async def async_setup_entry(
     hass,
     config_entry,
     async_add_entities,
 ):
     """Set up config entry."""
-    _LOGGER.info("Called overridden async_setup_entry")
+    _LOGGER.debug("Called overridden async_setup_entry")
 
     await async_define_sync_services()
 
     discovery_info = config_entry.data
+
+    await async_setup_cover_support(hass, discovery_info[CONF_DEVICES])
+
     device_ids = set()
 
     entities = []
+    covers = {}
     for packet_id, entity_info in discovery_info[CONF_DEVICES].items():
         event = get_rfx_object(packet_id)
         if event is None:
@@ -48,5 +85,23 @@ async def async_setup_entry(
 
         entity = create_cover_entity(event.device, device_id, entity_info)
         entities.append(entity)
+        if isinstance(entity, AbstractTiltingCover):
+            covers[packet_id] = entity
+
+    for name, event_codes in discovery_info.get(CONF_COVER_GROUPS, {}).items():
+        members = [covers[event_code] for event_code in event_codes if event_code in covers]
+        if members:
+            entities.append(CoverGroup(name, members))
 
     async_add_entities(entities)
+
+    if not discovery_info.get(CONF_DISCOVER_COVERS, DEF_DISCOVER_COVERS):
+        return
+    if discovery_info.get(CONF_AUTOMATIC_ADD):
+        # An entry written before the options were kept exclusive; automatic add already adds
+        # every cover on its first sighting, so counting sightings would change nothing
+        _LOGGER.warning("Cover discovery is off while automatic add is on; "
+                        "turn automatic add off in the integration options to use it")
+        return
+    async_setup_discovery(hass, config_entry, async_add_entities, device_ids,
+                          discovery_info.get(CONF_DISCOVERY_SIGHTINGS, DEF_DISCOVERY_SIGHTINGS))
@@ -0,0 +1,232 @@
+"""Group of tilting covers controlled and reported as one."""
+import asyncio
+import logging
+from homeassistant.components.cover import (
+    ATTR_POSITION,
+    ATTR_TILT_POSITION,
+    DEVICE_CLASS_BLIND,
+    SUPPORT_CLOSE,
+    SUPPORT_OPEN,
+    SUPPORT_OPEN_TILT,
+    SUPPORT_CLOSE_TILT,
+    SUPPORT_STOP_TILT,
+    SUPPORT_STOP,
+    SUPPORT_SET_POSITION,
+    SUPPORT_SET_TILT_POSITION,
+    CoverEntity
+)
+from homeassistant.core import callback
+from .const import (
+    ATTR_OPERATION,
+    COMBINE_WINDOW_SEC
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+ATTR_MEMBERS = "members"
+ATTR_OPEN_COUNT = "open_count"
+ATTR_CLOSED_COUNT = "closed_count"
+ATTR_MOVING = "moving"
+
+
+# What a member adds to the totals of its groups: one member, closed, opening, closing, position, one
+# member with tilt and tilt. Members without tilt, such as rollers, are left out of the tilt average.
+def member_contribution(cover):
+    """Return the contribution of a cover to the totals of its groups."""
+    tilt = cover.current_cover_tilt_position
+    return (1, int(cover.is_closed), int(cover.is_opening), int(cover.is_closing),
+            cover.current_cover_position or 0, int(tilt is not None), tilt or 0)
+
+
+NO_CONTRIBUTION = (0,) * 7
+
+
+# Home Assistant's cover group reads the state of every member each time one member changes. Here
+# each member hands the change in its contribution to its groups whenever it writes its state, so the
+# counts and averages are kept up to date in constant time whatever the size of the group. A burst of
+# changes from blinds moving together is written as one group state.
+#
+# Members that are unavailable or have been removed take their contribution back, so the counts and
+# averages only cover the members that report a state.
+#
+# Commands skip the members' service calls. Each member's operation is planned and all of them are
+# started together, so their commands reach the transmitter as one burst and share its timeline of
+# airtime. Position and tilt requests arriving together are combined by the group, as a member
+# combines them, and sent to the members as one position and tilt operation.
+class CoverGroup(CoverEntity):
+    """A group of tilting covers."""
+
+    def __init__(self, name, members):
+        self._name = name
+        self._members = members
+        self._counted = 0
+        self._closed = 0
+        self._opening = 0
+        self._closing = 0
+        self._positionSum = 0
+        self._tilted = 0
+        self._tiltSum = 0
+        self._writePending = False
+        self._pendingMove = None
+        for member in members:
+            member.join_group(self)
+
+    @callback
+    def member_changed(self, old, new):
+        """Apply the change in a member's contribution to the totals, None being no contribution."""
+        change = tuple(value - previous for value, previous in
+                       zip(new or NO_CONTRIBUTION, old or NO_CONTRIBUTION))
+        self._counted += change[0]
+        self._closed += change[1]
+        self._opening += change[2]
+        self._closing += change[3]
+        self._positionSum += change[4]
+        self._tilted += change[5]
+        self._tiltSum += change[6]
+
+        if self.hass is not None and not self._writePending:
+            self._writePending = True
+            self.hass.loop.call_soon(self._async_write_pending)
+
+    @callback
+    def _async_write_pending(self):
+        self._writePending = False
+        self.async_write_ha_state()
+
+    @property
+    def name(self):
+        """Return the name of the group."""
+        return self._name
+
+    @property
+    def unique_id(self):
+        """Return a unique id for the group."""
+        return "cover_group_" + self._name
+
+    @property
+    def should_poll(self):
+        """No polling, members report their changes."""
+        return False
+
+    @property
+    def device_class(self):
+        """Return the device class."""
+        return DEVICE_CLASS_BLIND
+
+    @property
+    def supported_features(self):
+        """Flag supported features."""
+        return (SUPPORT_CLOSE | SUPPORT_OPEN | SUPPORT_STOP | SUPPORT_OPEN_TILT | SUPPORT_CLOSE_TILT |
+                SUPPORT_STOP_TILT | SUPPORT_SET_TILT_POSITION | SUPPORT_SET_POSITION)
+
+    @property
+    def is_closed(self):
+        """Closed only when every member reporting a state is closed."""
+        return self._counted > 0 and self._closed == self._counted
+
+    @property
+    def is_opening(self):
+        """Return true if any member is opening."""
+        return self._opening > 0
+
+    @property
+    def is_closing(self):
+        """Return true if any member is closing."""
+        return self._closing > 0
+
+    @property
+    def current_cover_position(self):
+        """Return the average position of the members."""
+        return round(self._positionSum / self._counted) if self._counted else None
+
+    @property
+    def current_cover_tilt_position(self):
+        """Return the average tilt position of the members with tilt."""
+        return round(self._tiltSum / self._tilted) if self._tilted else None
+
+    @property
+    def device_state_attributes(self):
+        """Return the counts of open and closed members and whether any is moving."""
+        return {
+            ATTR_MEMBERS: len(self._members),
+            ATTR_OPEN_COUNT: self._counted - self._closed,
+            ATTR_CLOSED_COUNT: self._closed,
+            ATTR_MOVING: self._opening + self._closing > 0
+        }
+
+    # Only members supporting a feature are asked to use it, so rollers in a group of venetian blinds
+    # are left alone by tilt commands
+
+    def _supporting(self, feature):
+        return [member for member in self._members
+                if member.available and member.supported_features & feature]
+
+    async def _async_all(self, operation, feature, **kwargs):
+        await asyncio.gather(*(getattr(member, operation)(**kwargs)
+                               for member in self._supporting(feature)))
+
+    async def _async_batch(self, operation, feature, **kwargs):
+        """Plan and start a move operation on every member supporting it, as one batch."""
+        runs = [(member,) + member._move_operation({ATTR_OPERATION: operation, **kwargs})
+                for member in self._supporting(feature)]
+        await asyncio.gather(*(run(member, **args) for member, run, args in runs))
+
+    async def _async_combine_move(self, key, value):
+        if self._pendingMove is not None:
+            move, done = self._pendingMove
+            move[key] = value
+            await asyncio.shield(done)
+            return
+
+        move = {key: value}
+        done = self.hass.loop.create_future()
+        self._pendingMove = (move, done)
+        try:
+            await asyncio.sleep(COMBINE_WINDOW_SEC)
+            self._pendingMove = None
+            feature = SUPPORT_SET_POSITION if ATTR_POSITION in move else SUPPORT_SET_TILT_POSITION
+            await self._async_batch("set_cover_position_and_tilt", feature, **move)
+        except asyncio.CancelledError:
+            done.cancel()
+            raise
+        except Exception as err:
+            done.set_exception(err)
+            # Raised here and in any combined callers, so it is not left to be logged as unretrieved
+            done.exception()
+            raise
+        else:
+            done.set_result(None)
+        finally:
+            self._pendingMove = None
+
+    async def async_open_cover(self, **kwargs):
+        """Open every member."""
+        await self._async_batch("open_cover", SUPPORT_OPEN)
+
+    async def async_close_cover(self, **kwargs):
+        """Close every member."""
+        await self._async_batch("close_cover", SUPPORT_CLOSE)
+
+    async def async_stop_cover(self, **kwargs):
+        """Stop every member."""
+        await self._async_all("async_stop_cover", SUPPORT_STOP, **kwargs)
+
+    async def async_set_cover_position(self, **kwargs):
+        """Move every member to a position."""
+        await self._async_combine_move(ATTR_POSITION, kwargs[ATTR_POSITION])
+
+    async def async_open_cover_tilt(self, **kwargs):
+        """Open the tilt of every member."""
+        await self._async_batch("open_cover_tilt", SUPPORT_OPEN_TILT)
+
+    async def async_close_cover_tilt(self, **kwargs):
+        """Close the tilt of every member."""
+        await self._async_batch("close_cover_tilt", SUPPORT_CLOSE_TILT)
+
+    async def async_stop_cover_tilt(self, **kwargs):
+        """Stop the tilt of every member."""
+        await self._async_all("async_stop_cover_tilt", SUPPORT_STOP_TILT, **kwargs)
+
+    async def async_set_cover_tilt_position(self, **kwargs):
+        """Tilt every member to a position."""
+        await self._async_combine_move(ATTR_TILT_POSITION, kwargs[ATTR_TILT_POSITION])
@@ -0,0 +1,484 @@
+#!/usr/bin/env python3
+"""Standalone daemon that owns an RFXtrx transceiver.
+
+The daemon runs outside Home Assistant, so the timing of the frames it writes does not depend on how
+busy Home Assistant is. It offers two local sockets:
+
+- a raw port that behaves like an RFXtrx on the network. Point the rfxtrx integration at it as a
+  network device. Any number of clients can connect, and each sees every packet the transceiver
+  receives.
+- a control port taking one JSON object per line. Covers use it to send timed sequences of frames,
+  which the daemon writes at their offsets from when the first frame went on air, on its own clock.
+
+Only the standard library, pyserial and airtime.py and const.py beside this file are needed:
+
+    python3 daemon.py --device /dev/ttyUSB0
+
+Control requests are {"id": 1, "op": "sequence", "device": "...", "frames": [["0c1a00...", 0.0],
+["0c1a00...", 1.75]], "max_pending": 2, "shed_policy": "supersede", "priority": false},
+{"id": 2, "op": "flush", "device": "..."} and {"id": 3, "op": "status"}. Each request gets one reply,
+{"id": 1, "ok": true} or {"id": 1, "ok": false, "error": "shed" | "saturated" | "stale" | "failed",
+"message": "..."}, sent once the last frame has been written. Priority sequences skip the limits and
+are written ahead of anything else that is due. A flush drops everything waiting for the device and
+is answered once it has.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import socket
+import threading
+import time
+import serial
+try:
+    from .airtime import (
+        AirtimeTimeline,
+        airtime
+    )
+except ImportError:
+    # Run as a script, outside the package
+    from airtime import (
+        AirtimeTimeline,
+        airtime
+    )
+
+_LOGGER = logging.getLogger("rfxtrx_daemon")
+
+DEF_BIND = "127.0.0.1"
+DEF_RAW_PORT = 10001
+DEF_CONTROL_PORT = 10002
+
+# Most sequences that may wait to be written before new ones are refused
+TRANSMIT_QUEUE_SIZE = 64
+
+# Frames that could not be written within this long of their due time are dropped
+STALE_FRAME_SEC = 30
+
+ERROR_SHED = "shed"
+ERROR_SATURATED = "saturated"
+ERROR_STALE = "stale"
+ERROR_FAILED = "failed"
+
+SHED_POLICY_SUPERSEDE = "supersede"
+
+PACKET_TYPE_INTERFACE_CONTROL = 0x00
+CMD_RESET = 0x00
+CMD_STATUS = 0x02
+CMD_START = 0x07
+
+PACKET_RESET = bytes([0x0D, 0x00, 0x00, 0x00, CMD_RESET] + [0x00] * 9)
+PACKET_STATUS = bytes([0x0D, 0x00, 0x00, 0x01, CMD_STATUS] + [0x00] * 9)
+PACKET_START = bytes([0x0D, 0x00, 0x00, 0x03, CMD_START] + [0x00] * 9)
+
+
+class SerialLink:
+    """Blocking link to a transceiver on a serial port."""
+
+    def __init__(self, device):
+        self._serial = serial.Serial(device, 38400, timeout=1)
+
+    def read(self, size):
+        return self._serial.read(size)
+
+    def write(self, data):
+        self._serial.write(data)
+
+    def flush_input(self):
+        self._serial.reset_input_buffer()
+
+    def close(self):
+        self._serial.close()
+
+
+class SocketLink:
+    """Blocking link to a transceiver on the network."""
+
+    def __init__(self, host, port):
+        self._socket = socket.create_connection((host, port))
+        self._socket.settimeout(1)
+
+    def read(self, size):
+        try:
+            return self._socket.recv(size)
+        except socket.timeout:
+            return b""
+
+    def write(self, data):
+        self._socket.sendall(data)
+
+    def flush_input(self):
+        pass
+
+    def close(self):
+        self._socket.close()
+
+
+def open_link(device):
+    """Open a serial device, or a host:port for a network transceiver."""
+    host, _, port = device.rpartition(":")
+    if host and port.isdigit():
+        return SocketLink(host, int(port))
+    return SerialLink(device)
+
+
+def read_packet(link):
+    """Read one length prefixed packet, or return None if nothing arrived."""
+    header = link.read(1)
+    if not header or header[0] == 0:
+        return None
+    packet = bytearray(header)
+    while len(packet) < header[0] + 1:
+        data = link.read(header[0] + 1 - len(packet))
+        if not data:
+            return None
+        packet.extend(data)
+    return bytes(packet)
+
+
+def split_packets(buffer):
+    """Remove and return the complete packets at the start of a buffer."""
+    packets = []
+    while buffer and len(buffer) >= buffer[0] + 1:
+        size = buffer[0] + 1
+        if buffer[0]:
+            packets.append(bytes(buffer[:size]))
+        del buffer[:size]
+    return packets
+
+
+# onAir stays None until the first frame of the sequence has been written, and start is when it was
+# expected on air when its airtime was reserved
+class _Sequence:
+    __slots__ = ("device", "frames", "reply", "priority", "onAir", "start", "remaining")
+
+    def __init__(self, device, frames, reply, priority=False):
+        self.device = device
+        self.frames = frames
+        self.reply = reply
+        self.priority = priority
+        self.onAir = None
+        self.start = None
+        self.remaining = len(frames)
+
+
+class _Frame:
+    __slots__ = ("sequence", "index", "data", "offset", "notBefore")
+
+    def __init__(self, sequence, index, data, offset, notBefore):
+        self.sequence = sequence
+        self.index = index
+        self.data = data
+        self.offset = offset
+        self.notBefore = notBefore
+
+
+# Frames are written as the integration's own transmitter writes them. A single writer task sleeps
+# until the next frame is due and writes everything that is due in one go. The first frame of a
+# sequence is due when the sequence's airtime was reserved, and the later frames are held until their
+# offset from when the first went on air, so a late start does not shorten the gaps the motor sees.
+# Sequences of several frames share an AirtimeTimeline, and single frames, including raw client
+# packets, are written in its gaps. Priority sequences skip the limits and the timeline. Each
+# sequence is answered once its last frame is out. Limits on waiting sequences per device and overall
+# match the transmitter too.
+class RfxtrxDaemon:
+    """Owns the transceiver and serves the raw and control sockets."""
+
+    def __init__(self, link):
+        self._link = link
+        self._loop = None
+        self._pending = []
+        self._sequences = []
+        self._timeline = AirtimeTimeline()
+        self._busyUntil = 0
+        self._wakeup = None
+        self._rawClients = set()
+        self._statusResponse = None
+        self._startResponse = None
+        self._writeLock = threading.Lock()
+
+    def initialise(self):
+        """Reset the transceiver and keep its status and start responses for raw clients."""
+        self._link.write(PACKET_RESET)
+        time.sleep(0.3)
+        self._link.flush_input()
+        self._link.write(PACKET_STATUS)
+        self._statusResponse = self._read_response(CMD_STATUS)
+        self._link.write(PACKET_START)
+        self._startResponse = self._read_response(CMD_START)
+
+    def _read_response(self, command):
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            packet = read_packet(self._link)
+            if packet is not None and len(packet) > 4 and packet[1] == 0x01 and packet[4] == command:
+                return packet
+        raise OSError("No response from RFXtrx to command " + hex(command))
+
+    async def async_run(self, bind, raw_port, control_port):
+        """Serve until cancelled."""
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        threading.Thread(target=self._receive, name="rfxtrx-receive", daemon=True).start()
+        raw = await asyncio.start_server(self._async_raw_client, bind, raw_port)
+        control = await asyncio.start_server(self._async_control_client, bind, control_port)
+        _LOGGER.info("Serving raw RFXtrx on %s:%s and control on %s:%s",
+                     bind, raw_port, bind, control_port)
+        async with raw, control:
+            await self._async_writer()
+
+    # Receiving
+
+    def _receive(self):
+        while True:
+            try:
+                packet = read_packet(self._link)
+            except OSError as err:
+                _LOGGER.error("Failed to read from RFXtrx: %s", err)
+                time.sleep(5)
+                continue
+            if packet is not None:
+                self._loop.call_soon_threadsafe(self._broadcast, packet)
+
+    def _broadcast(self, packet):
+        for writer in list(self._rawClients):
+            writer.write(packet)
+
+    # Raw clients
+
+    async def _async_raw_client(self, reader, writer):
+        self._rawClients.add(writer)
+        buffer = bytearray()
+        try:
+            while True:
+                data = await reader.read(256)
+                if not data:
+                    break
+                buffer.extend(data)
+                for packet in split_packets(buffer):
+                    self._raw_packet(packet, writer)
+        except ConnectionError:
+            pass
+        finally:
+            self._rawClients.discard(writer)
+            writer.close()
+
+    def _raw_packet(self, packet, writer):
+        # A client resetting or starting the transceiver would disturb the other clients, so those
+        # are answered from the responses kept when the daemon started it
+        if packet[1] == PACKET_TYPE_INTERFACE_CONTROL and len(packet) > 4:
+            if packet[4] == CMD_RESET:
+                return
+            if packet[4] in (CMD_STATUS, CMD_START):
+                response = bytearray(self._statusResponse if packet[4] == CMD_STATUS
+                                     else self._startResponse)
+                response[3] = packet[3]
+                writer.write(bytes(response))
+                return
+        self._schedule(_Sequence(None, [packet], None), [0])
+
+    # Control clients
+
+    async def _async_control_client(self, reader, writer):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    continue
+                self._control_request(request, writer)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    def _control_request(self, request, writer):
+        msg_id = request.get("id")
+
+        def reply(error=None, message=None):
+            response = {"id": msg_id, "ok": error is None}
+            if error is not None:
+                response["error"] = error
+                response["message"] = message
+            if not writer.is_closing():
+                writer.write((json.dumps(response) + "\n").encode())
+
+        if request.get("op") == "status":
+            reply()
+            return
+
+        device = request.get("device")
+        if request.get("op") == "flush":
+            for sequence in [sequence for sequence in self._sequences if sequence.device == device]:
+                self._shed(sequence, "preempted")
+            reply()
+            return
+
+        frames = [(bytes.fromhex(data), float(offset)) for data, offset in request.get("frames", [])]
+        if not frames:
+            reply()
+            return
+
+        priority = bool(request.get("priority"))
+        if not priority:
+            waiting = [sequence for sequence in self._sequences
+                       if sequence.device == device and sequence.onAir is None]
+            if len(waiting) >= request.get("max_pending", 2):
+                if request.get("shed_policy") != SHED_POLICY_SUPERSEDE:
+                    reply(ERROR_SATURATED, "Too many commands waiting for device " + str(device))
+                    return
+                self._shed(waiting[0], "superseded by a newer command")
+
+            if len(self._sequences) >= TRANSMIT_QUEUE_SIZE:
+                reply(ERROR_SATURATED, "RFXtrx transmit queue is full")
+                return
+
+        sequence = _Sequence(device, [data for data, _ in frames], reply, priority)
+        self._sequences.append(sequence)
+        self._schedule(sequence, [offset for _, offset in frames])
+
+    def _schedule(self, sequence, offsets):
+        now = self._loop.time()
+        spans = [(offset - offsets[0], airtime(data)) for data, offset in zip(sequence.frames, offsets)]
+        sequence.start = now
+        if len(spans) > 1 and not sequence.priority:
+            # Leave room for the single frames already waiting
+            earliest = max(now, self._busyUntil) + sum(airtime(frame.data) for frame in self._pending
+                                                        if len(frame.sequence.frames) == 1)
+            sequence.start = self._timeline.reserve(sequence, spans, earliest, now)
+        for index, (data, (offset, _)) in enumerate(zip(sequence.frames, spans)):
+            self._pending.append(_Frame(sequence, index, data, offset, sequence.start))
+        self._wakeup.set()
+
+    def _ready(self, frame):
+        """Return when a frame may be written, or None while it waits for its sequence to start."""
+        if frame.index == 0:
+            return frame.notBefore
+        if frame.sequence.onAir is None:
+            return None
+        return frame.sequence.onAir + frame.offset
+
+    def _shed(self, sequence, reason):
+        self._drop(sequence)
+        sequence.reply(ERROR_SHED, "Command for device " + str(sequence.device) + " " + reason)
+
+    def _drop(self, sequence):
+        """Remove what is left of a sequence from the queue and the timeline."""
+        if sequence in self._sequences:
+            self._sequences.remove(sequence)
+        self._pending = [frame for frame in self._pending if frame.sequence is not sequence]
+        self._timeline.release(sequence)
+
+    # Writing
+
+    async def _async_writer(self):
+        while True:
+            await self._async_wait()
+
+            now = self._loop.time()
+            stale = []
+            for frame in self._pending:
+                ready = self._ready(frame)
+                if ready is not None and now - ready > STALE_FRAME_SEC and frame.sequence not in stale:
+                    stale.append(frame.sequence)
+            # Sequences with a frame too late to be any use fail, and the rest of their frames are dropped
+            for sequence in stale:
+                self._drop(sequence)
+                if sequence.reply is not None:
+                    sequence.reply(ERROR_STALE, "Command for device " + str(sequence.device) +
+                                   " was not sent within " + str(STALE_FRAME_SEC) + " seconds")
+
+            # Priority frames go first in the write
+            batch = [frame for frame in self._pending if frame.sequence.priority and
+                     self._ready(frame) is not None and self._ready(frame) <= now]
+            cursor = max(now, self._busyUntil) + sum(airtime(frame.data) for frame in batch)
+            held = []
+            for frame in self._pending:
+                if frame in batch:
+                    continue
+                ready = self._ready(frame)
+                if ready is None or ready > now:
+                    held.append(frame)
+                    continue
+                # A single frame that would still be on air when a reserved frame is due waits for it
+                if len(frame.sequence.frames) == 1 and not frame.sequence.priority:
+                    end = self._timeline.clash(cursor, airtime(frame.data))
+                    if end is not None:
+                        frame.notBefore = end
+                        held.append(frame)
+                        continue
+                batch.append(frame)
+                cursor += airtime(frame.data)
+            self._pending = held
+            if not batch:
+                continue
+
+            data = b"".join(frame.data for frame in batch)
+            try:
+                await self._loop.run_in_executor(None, self._write, data)
+            except OSError as err:
+                _LOGGER.error("Failed to write to RFXtrx: %s", err)
+                for frame in batch:
+                    sequence = frame.sequence
+                    if sequence in self._sequences:
+                        self._drop(sequence)
+                        sequence.reply(ERROR_FAILED, "Failed to write to RFXtrx: " + str(err))
+                continue
+
+            onAir = max(self._loop.time(), self._busyUntil)
+            for frame in batch:
+                sequence = frame.sequence
+                if sequence.onAir is None:
+                    sequence.onAir = onAir
+                    self._timeline.shift(sequence, onAir - sequence.start)
+                sequence.remaining -= 1
+                # Sequences shed or flushed while the write was under way have already been answered
+                if sequence.remaining == 0 and (sequence.reply is None or sequence in self._sequences):
+                    self._drop(sequence)
+                    if sequence.reply is not None:
+                        sequence.reply()
+                onAir += airtime(frame.data)
+            self._busyUntil = onAir
+
+    # Waits to be woken by a new frame, or until the next held frame is due
+    async def _async_wait(self):
+        due = [ready for ready in map(self._ready, self._pending) if ready is not None]
+        if not due:
+            await self._wakeup.wait()
+        else:
+            delay = min(due) - self._loop.time()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+        self._wakeup.clear()
+
+    def _write(self, data):
+        with self._writeLock:
+            self._link.write(data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RFXtrx transceiver daemon")
+    parser.add_argument("--device", required=True,
+                        help="Serial device, or host:port of a network RFXtrx")
+    parser.add_argument("--bind", default=DEF_BIND)
+    parser.add_argument("--raw-port", type=int, default=DEF_RAW_PORT)
+    parser.add_argument("--control-port", type=int, default=DEF_CONTROL_PORT)
+    parser.add_argument("--debug", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.INFO)
+    daemon = RfxtrxDaemon(open_link(args.device))
+    daemon.initialise()
+    try:
+        asyncio.run(daemon.async_run(args.bind, args.raw_port, args.control_port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
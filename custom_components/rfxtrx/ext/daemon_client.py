@@ -0,0 +1,156 @@
+"""Transmitter that hands frames to the standalone RFXtrx daemon."""
+import asyncio
+import itertools
+import json
+import logging
+from homeassistant.exceptions import HomeAssistantError
+from .const import (
+    DEF_MAX_PENDING,
+    DEF_SHED_POLICY
+)
+from .transmitter import (
+    CommandShed,
+    RfxtrxTransmitter,
+    TransmitterSaturated
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Prefix of a transceiver address that names the control port of a daemon
+DAEMON_SCHEME = "daemon://"
+
+CONNECT_TIMEOUT_SEC = 10
+
+_ERRORS = {
+    "shed": CommandShed,
+    "saturated": TransmitterSaturated,
+    "stale": CommandShed,
+}
+
+
+# Stands in for a transmitter when the RFXtrx is owned by the daemon in daemon.py. Commands and timed
+# sequences are sent as single requests over the daemon's control port, and the daemon writes each
+# frame at its offset on its own clock, so the timing of a Somfy tilt does not depend on how busy
+# Home Assistant is. Queue limits and shedding are applied by the daemon and its errors are raised
+# here as the same exceptions the local transmitter raises.
+class DaemonTransmitter(RfxtrxTransmitter):
+    """Send frames through the RFXtrx daemon."""
+
+    def __init__(self, hass, host, port):
+        super().__init__(hass, None)
+        self._host = host
+        self._port = port
+        self._ids = itertools.count(1)
+        self._requests = {}
+        self._writer = None
+        self._readerTask = None
+        self._connectLock = asyncio.Lock()
+
+    async def async_send(self, key, repetitions, fun, *args,
+                         max_pending=DEF_MAX_PENDING, shed_policy=DEF_SHED_POLICY, priority=False):
+        """Have the daemon write a command and wait until it has been written."""
+        frame = self.encode(key, fun, *args)
+        await self.async_send_sequence(key[0], [(frame * repetitions, 0)],
+                                       max_pending=max_pending, shed_policy=shed_policy,
+                                       priority=priority)
+
+    async def async_send_sequence(self, device, frames,
+                                  max_pending=DEF_MAX_PENDING, shed_policy=DEF_SHED_POLICY,
+                                  priority=False):
+        """Have the daemon write frames at offsets in seconds from the start of the sequence."""
+        await self._async_request({
+            "op": "sequence",
+            "device": "_".join(device),
+            "frames": [[data.hex(), offset] for data, offset in frames],
+            "max_pending": max_pending,
+            "shed_policy": shed_policy,
+            "priority": priority,
+        })
+
+    def flush(self, device, reason="preempted"):
+        """Have the daemon drop everything queued for a device, without waiting for it."""
+        self._hass.async_create_task(self._async_flush(device, reason))
+
+    async def async_flush(self, device, reason="preempted"):
+        """Have the daemon drop everything queued for a device, returning once it has."""
+        await self._async_request({"op": "flush", "device": "_".join(device)})
+
+    async def _async_flush(self, device, reason):
+        try:
+            await self.async_flush(device, reason)
+        except HomeAssistantError as err:
+            _LOGGER.warning("Unable to flush commands for device %s: %s", device, err)
+
+    def async_stop(self):
+        """Close the connection and cancel anything still waiting."""
+        if self._readerTask is not None:
+            self._readerTask.cancel()
+        self._disconnect(None)
+        super().async_stop()
+
+    async def _async_request(self, request):
+        try:
+            await self._async_connect()
+        except (asyncio.TimeoutError, OSError) as err:
+            self._set_failed(True)
+            raise HomeAssistantError("Unable to reach RFXtrx daemon: " + str(err)) from err
+
+        msg_id = next(self._ids)
+        future = self._hass.loop.create_future()
+        self._requests[msg_id] = future
+        request["id"] = msg_id
+        self._writer.write((json.dumps(request) + "\n").encode())
+
+        response = await future
+        if not response.get("ok"):
+            error = _ERRORS.get(response.get("error"), HomeAssistantError)
+            if error is HomeAssistantError:
+                self._set_failed(True)
+            raise error(response.get("message", "RFXtrx daemon error"))
+        self._set_failed(False)
+
+    async def _async_connect(self):
+        async with self._connectLock:
+            if self._writer is not None:
+                return
+            reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection(self._host, self._port), CONNECT_TIMEOUT_SEC)
+            self._readerTask = self._hass.loop.create_task(self._async_read(reader))
+
+    async def _async_read(self, reader):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                response = json.loads(line)
+                future = self._requests.pop(response.get("id"), None)
+                if future is not None and not future.done():
+                    future.set_result(response)
+        except (OSError, ValueError) as err:
+            _LOGGER.error("Lost connection to RFXtrx daemon: %s", err)
+        self._readerTask = None
+        self._disconnect(HomeAssistantError("Lost connection to RFXtrx daemon"))
+
+    def _disconnect(self, error):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        requests, self._requests = self._requests, {}
+        for future in requests.values():
+            if future.done():
+                continue
+            if error is None:
+                future.cancel()
+            else:
+                future.set_exception(error)
+
+
+def parse_daemon_address(address):
+    """Return the host and port of a daemon address, or None for any other address."""
+    if not address or not address.startswith(DAEMON_SCHEME):
+        return None
+    host, _, port = address[len(DAEMON_SCHEME):].rpartition(":")
+    if not host or not port.isdigit():
+        return None
+    return host, int(port)
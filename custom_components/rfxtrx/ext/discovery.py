@@ -0,0 +1,109 @@
+"""Discovery of new covers from the packets the RFXtrx receives."""
+import collections
+import logging
+import time
+from homeassistant.components.rfxtrx import (
+    DEVICE_DATA_SCHEMA,
+    SIGNAL_EVENT
+)
+from homeassistant.components.rfxtrx.cover import supported
+from homeassistant.const import (
+    CONF_DEVICE_ID,
+    CONF_DEVICES
+)
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.event import async_call_later
+from .. import (
+    DATA_CLEANUP_CALLBACKS,
+    DOMAIN
+)
+from . import create_cover_entity
+
+_LOGGER = logging.getLogger(__name__)
+
+# Most unknown devices remembered at once, the least recently heard being forgotten first
+DISCOVERY_CANDIDATES = 256
+
+# Sightings further apart than this start the count again
+DISCOVERY_WINDOW_SEC = 300
+
+# How long promoted devices are collected before they are written to the config entry together
+DISCOVERY_BATCH_SEC = 10
+
+
+# With automatic add, every device heard for the first time is written to the config entry, which in
+# a street full of weather stations and remotes means a steady stream of entry writes for devices that
+# are not ours. Here unknown covers are only counted, in an index of limited size, and a cover is
+# promoted once it has been heard a number of times within a window. Promoted covers are written to
+# the entry in one update and added to the platform as new entities, so the covers already set up are
+# left alone and nothing is reloaded.
+class CoverDiscovery:
+    """Promotes covers that are heard repeatedly."""
+
+    def __init__(self, hass, config_entry, async_add_entities, device_ids, sightings):
+        self._hass = hass
+        self._entry = config_entry
+        self._addEntities = async_add_entities
+        self._deviceIds = device_ids
+        self._sightings = sightings
+        self._candidates = collections.OrderedDict()
+        self._promoted = {}
+        self._flushCancel = None
+
+    @callback
+    def async_handle_event(self, event, device_id):
+        """Count a sighting of a device and promote it once it has been heard often enough."""
+        if device_id in self._deviceIds or not supported(event):
+            return
+
+        now = time.monotonic()
+        count, first = self._candidates.pop(device_id, (0, now))
+        if now - first > DISCOVERY_WINDOW_SEC:
+            count, first = 0, now
+        count += 1
+
+        if count < self._sightings:
+            self._candidates[device_id] = (count, first)
+            if len(self._candidates) > DISCOVERY_CANDIDATES:
+                self._candidates.popitem(last=False)
+            return
+
+        _LOGGER.info("Discovered cover %s after %d sightings", device_id, count)
+        self._deviceIds.add(device_id)
+        self._promoted[event.data.hex()] = (event, device_id)
+        if self._flushCancel is None:
+            self._flushCancel = async_call_later(self._hass, DISCOVERY_BATCH_SEC, self._async_flush)
+
+    async def _async_flush(self, _now):
+        self._flushCancel = None
+        promoted, self._promoted = self._promoted, {}
+
+        data = dict(self._entry.data)
+        data[CONF_DEVICES] = dict(data[CONF_DEVICES])
+        entities = []
+        for event_code, (event, device_id) in promoted.items():
+            entity_info = DEVICE_DATA_SCHEMA({})
+            entity_info[CONF_DEVICE_ID] = device_id
+            data[CONF_DEVICES][event_code] = entity_info
+            entities.append(create_cover_entity(event.device, device_id, entity_info, event))
+        self._hass.config_entries.async_update_entry(entry=self._entry, data=data)
+        self._addEntities(entities)
+
+    @callback
+    def async_stop(self):
+        """Stop counting and drop what has not been written."""
+        if self._flushCancel is not None:
+            self._flushCancel()
+            self._flushCancel = None
+        self._promoted.clear()
+        self._candidates.clear()
+
+
+def async_setup_discovery(hass, config_entry, async_add_entities, device_ids, sightings):
+    """Start discovering covers from received packets."""
+    discovery = CoverDiscovery(hass, config_entry, async_add_entities, device_ids, sightings)
+    cleanups = hass.data[DOMAIN][DATA_CLEANUP_CALLBACKS]
+    cleanups.append(async_dispatcher_connect(hass, SIGNAL_EVENT, discovery.async_handle_event))
+    cleanups.append(discovery.async_stop)
+    return discovery
@@ -0,0 +1,89 @@
+"""Emergency retraction of the covers."""
+import asyncio
+import logging
+import time
+import voluptuous as vol
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import callback
+import homeassistant.helpers.config_validation as cv
+from .. import (
+    DATA_CLEANUP_CALLBACKS,
+    DOMAIN
+)
+from .const import (
+    ATTR_BROADCAST_ENTITY_ID,
+    DATA_EMERGENCY,
+    EVENT_EMERGENCY_RETRACT,
+    SVC_EMERGENCY_RETRACT
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+EMERGENCY_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTITY_ID): cv.entity_ids,
+        vol.Optional(ATTR_BROADCAST_ENTITY_ID, default=[]): cv.entity_ids
+    }
+)
+
+
+# Retracts every cover at once when wind or rain is on the way. Each cover drops whatever it is doing
+# and sends its open command ahead of anything else queued on its transceiver. RFY and Blinds1 have no
+# addressing that reaches every blind, but a remote channel paired with a whole group of blinds
+# does the same job, so covers listed as broadcast are sent first and the rest follow together. The
+# event reports how long after the call the last command went out, which is the worst case for the
+# blinds it reached.
+class EmergencyRetract:
+    """Knows every cover and retracts them on request."""
+
+    def __init__(self, hass):
+        self._hass = hass
+        self._covers = set()
+
+    @callback
+    def add(self, cover):
+        """Add a cover that can be retracted."""
+        self._covers.add(cover)
+
+    @callback
+    def discard(self, cover):
+        """Forget a cover that has been removed."""
+        self._covers.discard(cover)
+
+    async def async_retract(self, call):
+        """Retract the requested covers, or all of them."""
+        started = time.monotonic()
+        entity_ids = call.data.get(ATTR_ENTITY_ID)
+        broadcast_ids = set(call.data[ATTR_BROADCAST_ENTITY_ID])
+        covers = [cover for cover in self._covers
+                  if entity_ids is None or cover.entity_id in entity_ids
+                  or cover.entity_id in broadcast_ids]
+
+        sent = {}
+        broadcast = [cover for cover in covers if cover.entity_id in broadcast_ids]
+        for group in (broadcast, [cover for cover in covers if cover not in broadcast]):
+            if group:
+                results = await asyncio.gather(*(cover.async_emergency_retract() for cover in group))
+                sent.update(zip((cover.entity_id for cover in group), results))
+
+        failed = sorted(entity_id for entity_id, when in sent.items() if when is None)
+        last = max((when for when in sent.values() if when is not None), default=started)
+        self._hass.bus.async_fire(EVENT_EMERGENCY_RETRACT, {
+            "covers": len(sent),
+            "broadcast": sorted(entity_id for entity_id in sent if entity_id in broadcast_ids),
+            "failed": failed,
+            "last_frame_seconds": round(last - started, 3)
+        })
+        _LOGGER.warning("Emergency retract of %d covers, last command sent after %.3f seconds",
+                        len(sent), last - started)
+
+
+def async_setup_emergency(hass):
+    """Register the emergency retract service."""
+    emergency = EmergencyRetract(hass)
+    hass.data[DOMAIN][DATA_EMERGENCY] = emergency
+    hass.services.async_register(DOMAIN, SVC_EMERGENCY_RETRACT, emergency.async_retract,
+                                 EMERGENCY_SCHEMA)
+    hass.data[DOMAIN][DATA_CLEANUP_CALLBACKS].append(
+        lambda: hass.services.async_remove(DOMAIN, SVC_EMERGENCY_RETRACT))
+    return emergency
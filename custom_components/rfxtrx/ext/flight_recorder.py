@@ -0,0 +1,54 @@
+"""In-memory record of recent cover activity."""
+import array
+import time
+from homeassistant.util import dt as dt_util
+
+# Kinds of event kept by the recorder
+EVENT_SERVICE = "service"
+EVENT_COMMAND = "command"
+EVENT_STATE = "state"
+EVENT_WAIT = "wait"
+EVENT_IGNORED = "ignored"
+EVENT_FAILED = "failed"
+
+FLIGHT_RECORDER_SIZE = 64
+
+
+# Fixed size ring buffer of structured events. Recording an event stores the raw values in
+# preallocated slots and nothing is formatted until the events are read, so keeping the recorder
+# running costs next to nothing.
+class FlightRecorder:
+    """Ring buffer of recent events for a cover."""
+
+    __slots__ = ("_times", "_kinds", "_details", "_next", "_count")
+
+    def __init__(self, size=FLIGHT_RECORDER_SIZE):
+        self._times = array.array("d", bytes(8 * size))
+        self._kinds = [None] * size
+        self._details = [None] * size
+        self._next = 0
+        self._count = 0
+
+    def record(self, kind, *detail):
+        """Record an event."""
+        index = self._next
+        self._times[index] = time.time()
+        self._kinds[index] = kind
+        self._details[index] = detail
+        self._next = (index + 1) % len(self._kinds)
+        if self._count < len(self._kinds):
+            self._count += 1
+
+    def events(self):
+        """Return the recorded events, oldest first."""
+        size = len(self._kinds)
+        first = (self._next - self._count) % size
+        events = []
+        for offset in range(self._count):
+            index = (first + offset) % size
+            events.append({
+                "time": dt_util.utc_from_timestamp(self._times[index]).isoformat(),
+                "event": self._kinds[index],
+                "detail": [str(value) for value in self._details[index]],
+            })
+        return events
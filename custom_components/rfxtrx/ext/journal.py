@@ -0,0 +1,79 @@
+"""Journal of intended cover motions kept across restarts."""
+import logging
+from homeassistant.helpers.storage import Store
+from .. import DOMAIN
+from .const import DATA_JOURNAL
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_KEY = "rfxtrx_cover_journal"
+STORAGE_VERSION = 1
+
+# Seconds to gather journal records before writing them out together
+JOURNAL_SAVE_DELAY = 5
+
+# Positions within a journal record
+RECORD_STATE = 0
+RECORD_LIFT = 1
+RECORD_TILT = 2
+RECORD_TARGET_STATE = 3
+RECORD_TARGET_LIFT = 4
+RECORD_TARGET_TILT = 5
+RECORD_DEADLINE = 6
+
+
+# Each cover appends a record when it starts a motion, giving the state it will be in when the motion
+# completes and the wall clock time by which that will have happened, and another when it settles.
+# Records are gathered in memory and written through Home Assistant storage in batches, keeping only
+# the latest record for each cover.
+#
+# A motion record is [state, lift, tilt, target state, target lift, target tilt, deadline]
+# A settled record is [state, lift, tilt]
+class MotionJournal:
+    """Append-only journal of cover motions."""
+
+    def __init__(self, hass):
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._records = {}
+        self._appended = []
+
+    async def async_load(self):
+        """Load the journal written before the last restart."""
+        data = await self._store.async_load()
+        if data is not None:
+            self._records = data.get("covers", {})
+
+    def get(self, unique_id):
+        """Return the latest record for a cover."""
+        self._apply_appended()
+        return self._records.get(unique_id)
+
+    def append_motion(self, unique_id, state, lift, tilt, targetState, targetLift, targetTilt, deadline):
+        """Record a motion that will complete by the deadline."""
+        self._append(unique_id, [state, lift, tilt,
+                                 targetState, targetLift, targetTilt, deadline])
+
+    def append_settled(self, unique_id, state, lift, tilt):
+        """Record a cover that has stopped moving."""
+        self._append(unique_id, [state, lift, tilt])
+
+    def _append(self, unique_id, record):
+        self._appended.append((unique_id, record))
+        self._store.async_delay_save(self._data_to_save, JOURNAL_SAVE_DELAY)
+
+    def _apply_appended(self):
+        for unique_id, record in self._appended:
+            self._records[unique_id] = record
+        self._appended.clear()
+
+    def _data_to_save(self):
+        self._apply_appended()
+        return {"covers": self._records}
+
+
+async def async_setup_journal(hass):
+    """Load the motion journal for the covers."""
+    journal = MotionJournal(hass)
+    await journal.async_load()
+    hass.data[DOMAIN][DATA_JOURNAL] = journal
+    return journal
@@ -0,0 +1,130 @@
+"""Signal repetitions chosen from how well each device is heard."""
+import asyncio
+import logging
+import voluptuous as vol
+from homeassistant.components.cover import (
+    ATTR_POSITION,
+    ATTR_TILT_POSITION
+)
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import callback
+import homeassistant.helpers.config_validation as cv
+from .. import (
+    DATA_CLEANUP_CALLBACKS,
+    DOMAIN
+)
+from . import MOVE_OPERATIONS
+from .const import (
+    ATTR_OPERATION,
+    DATA_LINK_QUALITY,
+    DATA_ROUTER,
+    EVENT_AIRTIME_REPORT,
+    SVC_REPORT_AIRTIME
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Smoothed RSSI, on the RFXtrx scale of 0 to 15, at or above which the fewest repetitions are sent and
+# at or below which the most are sent
+RSSI_STRONG = 10
+RSSI_WEAK = 4
+
+# Weight given to each operation in the running mismatch rate of a device
+MISMATCH_SMOOTHING = 0.2
+
+# Each step of this size in the mismatch rate adds one repetition
+MISMATCH_STEP = 0.1
+
+AIRTIME_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTITY_ID): cv.entity_ids,
+        vol.Required(ATTR_OPERATION): vol.In(MOVE_OPERATIONS),
+        vol.Optional(ATTR_POSITION): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
+        vol.Optional(ATTR_TILT_POSITION): vol.All(vol.Coerce(int), vol.Range(min=0, max=100))
+    }
+)
+
+
+# Blinds close to the transceiver get by with one transmission of each frame, while distant ones need
+# several. The signal strength of each device's remote, as heard by the router, places the device
+# between its configured least and most repetitions. Corrections made with update_cover_position mean
+# the blind did not do what was tracked, most often because a frame was missed, so the running rate
+# of those corrections adds repetitions until the blind behaves again.
+class LinkQuality:
+    """Chooses the signal repetitions of each device."""
+
+    def __init__(self, hass):
+        self._hass = hass
+        self._mismatch = {}
+        self._covers = set()
+
+    @callback
+    def add(self, cover):
+        """Add a cover whose airtime can be reported."""
+        self._covers.add(cover)
+
+    @callback
+    def discard(self, cover):
+        """Forget a cover that has been removed."""
+        self._covers.discard(cover)
+
+    @callback
+    def operation(self, device_id):
+        """Record an operation that was carried out."""
+        rate = self._mismatch.get(device_id)
+        if rate is not None:
+            self._mismatch[device_id] = rate * (1 - MISMATCH_SMOOTHING)
+
+    @callback
+    def mismatch(self, device_id):
+        """Record that the tracked state of a device turned out to be wrong."""
+        rate = self._mismatch.get(device_id, 0.0)
+        self._mismatch[device_id] = rate + MISMATCH_SMOOTHING * (1 - rate)
+
+    def repetitions(self, device_id, configured, minimum, maximum):
+        """Return the number of times to send each frame to a device."""
+        if maximum <= 0:
+            return configured
+        minimum = max(minimum, 1)
+        maximum = max(maximum, minimum)
+
+        rssi = self._hass.data[DOMAIN][DATA_ROUTER].rssi(device_id)
+        if rssi is None:
+            repetitions = min(max(configured, minimum), maximum)
+        else:
+            weakness = min(max((RSSI_STRONG - rssi) / (RSSI_STRONG - RSSI_WEAK), 0), 1)
+            repetitions = minimum + round((maximum - minimum) * weakness)
+        repetitions += round(self._mismatch.get(device_id, 0.0) / MISMATCH_STEP)
+        return min(repetitions, maximum)
+
+    async def async_report_airtime(self, call):
+        """Report the airtime an operation would take with fixed and with adaptive repetitions."""
+        entity_ids = call.data.get(ATTR_ENTITY_ID)
+        covers = sorted((cover for cover in self._covers
+                         if entity_ids is None or cover.entity_id in entity_ids),
+                        key=lambda cover: cover.entity_id)
+        kwargs = {key: value for key, value in call.data.items() if key != ATTR_ENTITY_ID}
+        reports = await asyncio.gather(*(cover.async_airtime(**kwargs) for cover in covers))
+
+        before = sum(report["airtime_before"] for report in reports)
+        after = sum(report["airtime_after"] for report in reports)
+        self._hass.bus.async_fire(EVENT_AIRTIME_REPORT, {
+            "operation": call.data[ATTR_OPERATION],
+            "covers": reports,
+            "airtime_before": round(before, 3),
+            "airtime_after": round(after, 3)
+        })
+        _LOGGER.warning("%s on %d covers takes %.2f seconds on air with fixed repetitions and "
+                        "%.2f seconds with adaptive repetitions",
+                        call.data[ATTR_OPERATION], len(reports), before, after)
+
+
+def async_setup_link_quality(hass):
+    """Create the link quality tracker and register the airtime report service."""
+    link = LinkQuality(hass)
+    hass.data[DOMAIN][DATA_LINK_QUALITY] = link
+    hass.services.async_register(DOMAIN, SVC_REPORT_AIRTIME, link.async_report_airtime,
+                                 AIRTIME_SCHEMA)
+    hass.data[DOMAIN][DATA_CLEANUP_CALLBACKS].append(
+        lambda: hass.services.async_remove(DOMAIN, SVC_REPORT_AIRTIME))
+    return link
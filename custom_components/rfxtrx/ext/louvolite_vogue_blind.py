@@ -12,8 +12,20 @@ from homeassistant.const import (
 from .const import (
     CONF_CLOSE_SECONDS,
     CONF_OPEN_SECONDS,
+    CONF_MAX_PENDING,
+    CONF_MAX_REPETITIONS,
+    CONF_MIN_REPETITIONS,
+    CONF_SHED_POLICY,
+    CONF_TRANSCEIVER,
+    CONF_SEGMENT_MS,
     DEF_CLOSE_SECONDS,
+    DEF_MAX_PENDING,
+    DEF_MAX_REPETITIONS,
+    DEF_MIN_REPETITIONS,
+    DEF_SHED_POLICY,
+    DEF_TRANSCEIVER,
     DEF_OPEN_SECONDS,
+    DEF_SEGMENT_MS
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -26,9 +38,23 @@ CMD_VOGUE_45_DEGREES = 0x02
 CMD_VOGUE_90_DEGREES = 0x03
 CMD_VOGUE_135_DEGREES = 0x04
 
+# Steps 0 to 4 are the 0, 45, 90, 135 and 180 degree positions
+VOGUE_STEPS = 5
+
 # Event 0919130400A1DB010000
 
 
+def build_transition_matrix(segmentSecs):
+    """Build the from-step x to-step travel time table from the time taken by each 45 degree segment"""
+    matrix = []
+    for start in range(len(segmentSecs) + 1):
+        row = []
+        for end in range(len(segmentSecs) + 1):
+            row.append(sum(segmentSecs[min(start, end):max(start, end)]))
+        matrix.append(row)
+    return matrix
+
+
 class LouvoliteVogueBlind(AbstractTiltingCover):
     """Representation of a RFXtrx cover."""
 
@@ -37,6 +63,14 @@ class LouvoliteVogueBlind(AbstractTiltingCover):
 
         openSecs = entity_info.get(CONF_OPEN_SECONDS, DEF_OPEN_SECONDS)
         closeSecs = entity_info.get(CONF_CLOSE_SECONDS, DEF_CLOSE_SECONDS)
+        segmentSecs = entity_info.get(CONF_SEGMENT_MS, DEF_SEGMENT_MS) / 1000
+
+        # Without a configured segment time the two segments from 0 to 90 degrees share the open time
+        # and the two from 90 to 180 degrees share the close time
+        if segmentSecs > 0:
+            segments = [segmentSecs] * (VOGUE_STEPS - 1)
+        else:
+            segments = [openSecs / 2, openSecs / 2, closeSecs / 2, closeSecs / 2]
 
         super().__init__(device, device_id,
                          entity_info[CONF_SIGNAL_REPETITIONS], event,
@@ -48,13 +82,24 @@ class LouvoliteVogueBlind(AbstractTiltingCover):
                          min(openSecs, closeSecs),  # Open time
                          max(openSecs, closeSecs),  # Close time
                          max(openSecs, closeSecs),  # Sync time ms
-                         2000  # Ms for each step
+                         2000,  # Ms for each step
+                         entity_info.get(CONF_MAX_PENDING,
+                                         DEF_MAX_PENDING),  # Commands that may wait to be sent
+                         entity_info.get(CONF_SHED_POLICY,
+                                         DEF_SHED_POLICY),  # What to do when too many are waiting
+                         entity_info.get(CONF_TRANSCEIVER,
+                                         DEF_TRANSCEIVER),  # Transceiver used to send commands
+                         entity_info.get(CONF_MIN_REPETITIONS,
+                                         DEF_MIN_REPETITIONS),  # Fewest adaptive repetitions
+                         entity_info.get(CONF_MAX_REPETITIONS,
+                                         DEF_MAX_REPETITIONS)  # Most adaptive repetitions
                          )
-        _LOGGER.info("Create Louvolite Vogue tilting blind " + str(device_id))
+
+        self._transitionSecs = build_transition_matrix(segments)
+        _LOGGER.debug("Create Louvolite Vogue tilting blind %s", device_id)
 
     async def _async_tilt_blind_to_step(self, steps, target):
         """Callback to tilt the blind to some position"""
-        _LOGGER.info("LOUVOLITE TILTING BLIND")
         if target == 0:
             movement = STATE_CLOSING
             command = CMD_VOGUE_CLOSE_CCW
@@ -71,30 +116,37 @@ class LouvoliteVogueBlind(AbstractTiltingCover):
             movement = STATE_CLOSING
             command = CMD_VOGUE_CLOSE_CW
 
-        delay = self._blindOpenSecs if steps <= 2 else self._blindCloseSecs
+        delay = self._transition_secs(target)
 
         await self._set_state(movement, BLIND_POS_CLOSED, self._tilt_step)
-        await self._async_send(self._device.send_command, command)
+        await self._async_send_command(command)
         await self._wait_and_set_state(delay, movement, STATE_CLOSED, BLIND_POS_CLOSED, target)
         return target
 
     async def _async_do_close_blind(self):
         """Callback to close the blind"""
-        _LOGGER.info("LOUVOLITE CLOSING BLIND")
+        delay = self._transition_secs(0)
         await self._set_state(STATE_CLOSING, BLIND_POS_CLOSED, self._tilt_step)
-        await self._async_send(self._device.send_command, CMD_VOGUE_CLOSE_CCW)
-        return self._blindCloseSecs
+        await self._async_send_command(CMD_VOGUE_CLOSE_CCW)
+        return delay
 
     async def _async_do_open_blind(self):
         """Callback to open the blind"""
-        _LOGGER.info("LOUVOLITE OPENING BLIND")
+        delay = self._transition_secs(self._blindMidSteps)
         await self._set_state(STATE_OPENING, BLIND_POS_CLOSED, self._tilt_step)
-        await self._async_send(self._device.send_command, CMD_VOGUE_90_DEGREES)
-        return self._blindOpenSecs
+        await self._async_send_command(CMD_VOGUE_90_DEGREES)
+        return delay
 
     async def _async_do_tilt_blind_to_mid(self):
         """Callback to tilt the blind to mid"""
-        _LOGGER.info("LOUVOLITE TILTING BLIND TO MID")
+        delay = self._transition_secs(self._blindMidSteps)
         await self._set_state(STATE_OPENING, BLIND_POS_CLOSED, self._tilt_step)
-        await self._async_send(self._device.send_command, CMD_VOGUE_90_DEGREES)
-        return self._blindOpenSecs
+        await self._async_send_command(CMD_VOGUE_90_DEGREES)
+        return delay
+
+    def _transition_secs(self, target):
+        """Time to travel from the current step to the target step"""
+        # The step is only known while the blind is lowered. Otherwise allow for the furthest start point
+        if self._lift_position == BLIND_POS_CLOSED:
+            return self._transitionSecs[self._tilt_step][target]
+        return max(row[target] for row in self._transitionSecs)
@@ -0,0 +1,88 @@
+"""Planned cover operations and notification of their completion."""
+import logging
+from homeassistant.core import callback
+from .. import (
+    DATA_CLEANUP_CALLBACKS,
+    DOMAIN
+)
+from .const import (
+    DATA_COMPLETIONS,
+    EVENT_MOTION_COMPLETE
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Completions within this long of the first are reported in one event
+COMPLETION_BATCH_SEC = 0.25
+
+
+# Commands and waits collected while an operation is run without transmitting. The clock advances
+# by each wait rather than sleeping, so planning costs no more than the arithmetic of the operation.
+class MotionPlan:
+    """Commands an operation would send and the time it would take."""
+
+    __slots__ = ("clock", "commands")
+
+    def __init__(self):
+        self.clock = 0.0
+        self.commands = []
+
+    def command(self, cmd, offset=0):
+        """Add a command sent offset seconds from now."""
+        self.commands.append((round(self.clock + offset, 3), cmd))
+
+    def wait(self, delay):
+        """Advance the clock by a wait."""
+        if delay > 0:
+            self.clock += delay
+
+    @property
+    def duration(self):
+        """Seconds from the start of the operation until the blind has settled."""
+        return self.clock
+
+
+# Covers report each finished operation here. Blinds moved together tend to finish within moments of
+# each other, so completions are collected for a short time and fired as one event rather than one
+# event per blind.
+class CompletionNotifier:
+    """Batches the completions of cover operations into events."""
+
+    def __init__(self, hass):
+        self._hass = hass
+        self._completed = []
+        self._handle = None
+
+    @callback
+    def add(self, entity_id, operation, planned, actual, succeeded):
+        """Report a finished operation."""
+        self._completed.append({
+            "entity_id": entity_id,
+            "operation": operation,
+            "planned_seconds": round(planned, 2),
+            "actual_seconds": round(actual, 2),
+            "succeeded": succeeded
+        })
+        if self._handle is None:
+            self._handle = self._hass.loop.call_later(COMPLETION_BATCH_SEC, self._flush)
+
+    @callback
+    def _flush(self):
+        self._handle = None
+        completed, self._completed = self._completed, []
+        self._hass.bus.async_fire(EVENT_MOTION_COMPLETE, {"covers": completed})
+
+    @callback
+    def async_stop(self):
+        """Report anything still waiting."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._flush()
+
+
+def async_setup_completions(hass):
+    """Create the completion notifier for the covers."""
+    notifier = CompletionNotifier(hass)
+    hass.data[DOMAIN][DATA_COMPLETIONS] = notifier
+    hass.data[DOMAIN][DATA_CLEANUP_CALLBACKS].append(notifier.async_stop)
+    return notifier
@@ -0,0 +1,100 @@
+"""Websocket stream of the estimated positions of moving covers."""
+import logging
+import time
+from datetime import timedelta
+import voluptuous as vol
+from homeassistant.components import websocket_api
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_track_time_interval
+from .. import DOMAIN
+from .const import (
+    DATA_MOTION_STREAM,
+    DEF_MOTION_INTERVAL_MS,
+    WS_SUBSCRIBE_COVER_MOTION
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+MIN_MOTION_INTERVAL_MS = 50
+MAX_MOTION_INTERVAL_MS = 5000
+
+
+# Covers add themselves to the stream when they start a timed motion and remove themselves when it
+# ends, which costs a set operation each. Positions are only estimated on the timers of subscribers,
+# so with nobody subscribed nothing is computed. Estimates go straight to the subscribed websocket
+# connections and never to the state machine, so the recorder sees only the usual state changes.
+class MotionStream:
+    """Moving covers and the websocket subscriptions watching them."""
+
+    def __init__(self, hass):
+        self._hass = hass
+        self._moving = set()
+
+    def add(self, cover):
+        """Add a cover that has started moving."""
+        self._moving.add(cover)
+
+    def discard(self, cover):
+        """Remove a cover that has stopped moving."""
+        self._moving.discard(cover)
+
+    @callback
+    def async_subscribe(self, send, interval):
+        """Call send with the estimated positions of moving covers every interval seconds."""
+        reported = set()
+
+        @callback
+        def _async_tick(_now):
+            now = time.monotonic()
+            positions = {}
+            for cover in self._moving:
+                position, tilt = cover.estimated_motion(now)
+                positions[cover.entity_id] = {
+                    "current_position": position,
+                    "current_tilt_position": tilt,
+                    "moving": True
+                }
+
+            # A cover that stopped since the last message is reported once more so that the
+            # subscriber knows to stop animating it
+            for entity_id in reported - positions.keys():
+                positions[entity_id] = {"moving": False}
+
+            reported.clear()
+            reported.update(entity_id for entity_id, position in positions.items()
+                            if position["moving"])
+            if positions:
+                send(positions)
+
+        return async_track_time_interval(
+            self._hass, _async_tick, timedelta(seconds=interval))
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): WS_SUBSCRIBE_COVER_MOTION,
+        vol.Optional("interval", default=DEF_MOTION_INTERVAL_MS): vol.All(
+            vol.Coerce(int), vol.Range(min=MIN_MOTION_INTERVAL_MS, max=MAX_MOTION_INTERVAL_MS)
+        ),
+    }
+)
+@callback
+def websocket_subscribe_cover_motion(hass, connection, msg):
+    """Subscribe to the estimated positions of moving covers."""
+    msg_id = msg["id"]
+
+    @callback
+    def _send(positions):
+        connection.send_message(websocket_api.event_message(msg_id, {"covers": positions}))
+
+    connection.subscriptions[msg_id] = hass.data[DOMAIN][DATA_MOTION_STREAM].async_subscribe(
+        _send, msg["interval"] / 1000)
+    connection.send_result(msg_id)
+
+
+def async_setup_motion_stream(hass):
+    """Create the motion stream and register its websocket command."""
+    stream = MotionStream(hass)
+    hass.data[DOMAIN][DATA_MOTION_STREAM] = stream
+    websocket_api.async_register_command(hass, websocket_subscribe_cover_motion)
+    return stream
@@ -0,0 +1,110 @@
+"""On-demand profiling of the cover integration."""
+import asyncio
+import cProfile
+import io
+import logging
+import os
+import pstats
+import re
+import voluptuous as vol
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+from .. import (
+    DATA_CLEANUP_CALLBACKS,
+    DOMAIN
+)
+from .const import (
+    ATTR_DURATION,
+    DATA_ROUTER,
+    DEF_PROFILE_SECONDS,
+    SVC_PROFILE
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+MAX_PROFILE_SECONDS = 600
+
+# Only functions defined in files under this folder are reported
+COMPONENT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DURATION, default=DEF_PROFILE_SECONDS): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_PROFILE_SECONDS)
+        )
+    }
+)
+
+
+def _summarise(timings):
+    if not timings:
+        return "No frames were written by a local transmitter\n"
+    lines = ["%-16s %10s %10s %10s" % ("", "mean ms", "max ms", "total ms")]
+    for index, name in enumerate(("queue wait", "executor wait", "serial write")):
+        values = [timing[index] * 1000 for timing in timings]
+        lines.append("%-16s %10.2f %10.2f %10.2f" % (
+            name, sum(values) / len(values), max(values), sum(values)))
+    return "%d writes\n%s\n" % (len(timings), "\n".join(lines))
+
+
+def _write_report(profiler, timings, path):
+    report = io.StringIO()
+    report.write("Transmitter timings by transceiver\n\n")
+    for name, transceiver_timings in timings.items():
+        report.write("%s: %s\n" % (name, _summarise(transceiver_timings)))
+
+    report.write("\nEvent loop time in rfxtrx functions\n\n")
+    stats = pstats.Stats(profiler, stream=report)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE)
+    stats.print_stats(re.escape(COMPONENT_PATH))
+
+    with open(path + ".txt", "w") as file:
+        file.write(report.getvalue())
+    stats.dump_stats(path + ".prof")
+
+
+# Profiling costs nothing until the service is called. The profiler then runs on the event loop thread
+# for the requested time, while each transmitter records how long its writes waited in the queue, for
+# an executor thread and on the serial link. The report lists the timings and the loop time spent in
+# this integration's own functions. The full profile is kept alongside it for tools such as snakeviz.
+class CoverProfiler:
+    """Capture a profile of the integration on request."""
+
+    def __init__(self, hass):
+        self._hass = hass
+        self._running = False
+
+    async def async_profile(self, call):
+        """Profile for the requested number of seconds and write the report to the config folder."""
+        if self._running:
+            raise HomeAssistantError("A profile is already being captured")
+
+        self._running = True
+        transmitters = self._hass.data[DOMAIN][DATA_ROUTER].transmitters
+        profiler = cProfile.Profile()
+        try:
+            for transmitter in transmitters.values():
+                transmitter.timings = []
+            profiler.enable()
+            await asyncio.sleep(call.data[ATTR_DURATION])
+        finally:
+            profiler.disable()
+            timings = {}
+            for name, transmitter in transmitters.items():
+                timings[name] = transmitter.timings
+                transmitter.timings = None
+            self._running = False
+
+        path = self._hass.config.path(
+            "rfxtrx_profile_" + dt_util.now().strftime("%Y%m%d_%H%M%S"))
+        await self._hass.async_add_executor_job(_write_report, profiler, timings, path)
+        _LOGGER.warning("Wrote rfxtrx profile to %s.txt", path)
+
+
+def async_setup_profiler(hass):
+    """Register the profile service."""
+    profiler = CoverProfiler(hass)
+    hass.services.async_register(DOMAIN, SVC_PROFILE, profiler.async_profile, PROFILE_SCHEMA)
+    hass.data[DOMAIN][DATA_CLEANUP_CALLBACKS].append(
+        lambda: hass.services.async_remove(DOMAIN, SVC_PROFILE))
+    return profiler
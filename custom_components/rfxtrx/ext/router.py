@@ -0,0 +1,148 @@
+"""Routing of cover commands across several RFXtrx transceivers."""
+import asyncio
+import logging
+import RFXtrx as rfxtrxmod
+import async_timeout
+from .. import (
+    DATA_CLEANUP_CALLBACKS,
+    DATA_RFXOBJECT,
+    DOMAIN,
+    get_device_id
+)
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from .const import (
+    CONF_TRANSCEIVER,
+    CONST_TRANSCEIVER_AUTO,
+    DATA_ROUTER,
+    SIGNAL_TRANSCEIVER_EVENT
+)
+from .daemon_client import (
+    DaemonTransmitter,
+    parse_daemon_address
+)
+from .transmitter import RfxtrxTransmitter
+
+_LOGGER = logging.getLogger(__name__)
+
+# Name of the transceiver set up by the rfxtrx integration itself
+PRIMARY_TRANSCEIVER = "primary"
+
+# Weight given to each new RSSI reading in the running average for a device
+RSSI_SMOOTHING = 0.3
+
+CONNECT_TIMEOUT_SEC = 30
+
+
+def _connect_transceiver(address, event_callback):
+    """Connect to a transceiver given a serial device or host:port."""
+    host, _, port = address.rpartition(":")
+    if host and port.isdigit():
+        return rfxtrxmod.Connect((host, int(port)), event_callback,
+                                 transport_protocol=rfxtrxmod.PyNetworkTransport)
+    return rfxtrxmod.Connect(address, event_callback)
+
+
+# Each transceiver has its own transmitter, and so its own queue and writer task, so blinds in
+# different zones are commanded in parallel. A blind either names the transceiver it must use or is
+# routed to whichever transceiver hears its remote best. Signal strength is tracked from the frames
+# each transceiver receives for the blind's device id; until one has been heard the blind uses the
+# primary transceiver. A blind may also name the control port of an RFXtrx daemon, in which case
+# its commands are written by the daemon rather than from Home Assistant.
+class TransmitterRouter:
+    """Choose the transceiver used for each device."""
+
+    def __init__(self, hass):
+        self._hass = hass
+        self._transmitters = {}
+        self._rssi = {}
+
+    @property
+    def transmitters(self):
+        """Return the transmitters by transceiver name."""
+        return self._transmitters
+
+    def add_transport(self, name, transport):
+        """Add a transceiver reached through the given transport."""
+        transmitter = RfxtrxTransmitter(self._hass, transport)
+        self._transmitters[name] = transmitter
+        return transmitter
+
+    def observe(self, device_id, name, rssi):
+        """Record the signal strength of a frame heard for a device."""
+        readings = self._rssi.setdefault(device_id, {})
+        previous = readings.get(name)
+        if previous is None:
+            readings[name] = float(rssi)
+        else:
+            readings[name] = previous + RSSI_SMOOTHING * (rssi - previous)
+
+    def rssi(self, device_id):
+        """Return the best smoothed signal strength heard for a device, or None if it has not been heard."""
+        readings = self._rssi.get(device_id)
+        return max(readings.values()) if readings else None
+
+    def route(self, device_id, transceiver=CONST_TRANSCEIVER_AUTO):
+        """Return the transmitter to use for a device."""
+        if transceiver and transceiver != CONST_TRANSCEIVER_AUTO and transceiver in self._transmitters:
+            return self._transmitters[transceiver]
+
+        readings = self._rssi.get(device_id)
+        if readings:
+            best = max(readings, key=readings.get)
+            if best in self._transmitters:
+                return self._transmitters[best]
+
+        return self._transmitters[PRIMARY_TRANSCEIVER]
+
+    def async_stop(self):
+        """Stop all of the transmitters."""
+        for transmitter in self._transmitters.values():
+            transmitter.async_stop()
+
+    async def async_connect(self, address):
+        """Connect to an additional transceiver named by its address."""
+        daemon = parse_daemon_address(address)
+        if daemon is not None:
+            transmitter = DaemonTransmitter(self._hass, *daemon)
+            self._transmitters[address] = transmitter
+            return
+
+        def _event_callback(event):
+            self._hass.add_job(self._async_handle_receive, address, event)
+
+        try:
+            async with async_timeout.timeout(CONNECT_TIMEOUT_SEC):
+                connection = await self._hass.async_add_executor_job(
+                    _connect_transceiver, address, _event_callback)
+        except (asyncio.TimeoutError, OSError) as err:
+            _LOGGER.error("Unable to connect to RFXtrx at %s: %s", address, err)
+            return
+
+        self.add_transport(address, connection.transport)
+        self._hass.data[DOMAIN][DATA_CLEANUP_CALLBACKS].append(
+            lambda: self._hass.async_add_executor_job(connection.close_connection))
+
+    # Packets heard by the additional transceivers are passed to the covers with the name of the
+    # transceiver, so each cover records the signal under the transceiver that heard it
+    async def _async_handle_receive(self, name, event):
+        if not event.device.id_string:
+            return
+        async_dispatcher_send(self._hass, SIGNAL_TRANSCEIVER_EVENT, event,
+                              get_device_id(event.device), name)
+
+
+async def async_setup_router(hass, devices):
+    """Create the router with the primary and any additional transceivers named by devices."""
+    router = TransmitterRouter(hass)
+    router.add_transport(PRIMARY_TRANSCEIVER,
+                         hass.data[DOMAIN][DATA_RFXOBJECT].transport)
+    hass.data[DOMAIN][DATA_ROUTER] = router
+    hass.data[DOMAIN][DATA_CLEANUP_CALLBACKS].append(router.async_stop)
+
+    addresses = {
+        entity_info.get(CONF_TRANSCEIVER) for entity_info in devices.values()
+    } - {None, "", CONST_TRANSCEIVER_AUTO, PRIMARY_TRANSCEIVER}
+    for address in sorted(addresses):
+        await router.async_connect(address)
+
+    return router
@@ -1,6 +1,6 @@
 import logging
-import asyncio
 from homeassistant.const import (
+    STATE_CLOSED,
     STATE_OPENING,
     STATE_CLOSING
 )
@@ -17,12 +17,22 @@ from .abs_tilting_cover import (
 from .const import (
     CONF_CLOSE_SECONDS,
     CONF_OPEN_SECONDS,
+    CONF_MAX_PENDING,
+    CONF_MAX_REPETITIONS,
+    CONF_MIN_REPETITIONS,
+    CONF_SHED_POLICY,
+    CONF_TRANSCEIVER,
     CONF_STEPS_MID,
     CONF_SYNC_SECONDS,
     CONF_SYNC_MID,
     CONF_TILT_POS1_MS,
     CONF_TILT_POS2_MS,
     DEF_CLOSE_SECONDS,
+    DEF_MAX_PENDING,
+    DEF_MAX_REPETITIONS,
+    DEF_MIN_REPETITIONS,
+    DEF_SHED_POLICY,
+    DEF_TRANSCEIVER,
     DEF_OPEN_SECONDS, DEF_STEPS_MID,
     DEF_SYNC_SECONDS,
     DEF_TILT_POS1_MS,
@@ -41,6 +51,9 @@ CMD_SOMFY_DOWN05SEC = 0x10
 CMD_SOMFY_UP2SEC = 0x11
 CMD_SOMFY_DOWN2SEC = 0x12
 
+# RTS motors ignore a command that follows the previous one too closely
+SOMFY_MIN_COMMAND_GAP_SEC = 0.25
+
 # Event 071a000001010101 Office
 # Event 071a000001020101 Front
 # Event 071a000001030101 Back
@@ -56,6 +69,8 @@ CMD_SOMFY_DOWN2SEC = 0x12
 class SomfyVenetianBlind(AbstractTiltingCover):
     """Representation of a RFXtrx cover."""
 
+    MIN_COMMAND_GAP_SEC = SOMFY_MIN_COMMAND_GAP_SEC
+
     def __init__(self, device, device_id, entity_info, event=None):
         device.type_string = DEVICE_TYPE
         super().__init__(device, device_id,
@@ -72,7 +87,17 @@ class SomfyVenetianBlind(AbstractTiltingCover):
                                          DEF_CLOSE_SECONDS),  # Close time
                          entity_info.get(CONF_SYNC_SECONDS,
                                          DEF_SYNC_SECONDS),  # Sync time ms
-                         500  # Ms for each step
+                         500,  # Ms for each step
+                         entity_info.get(CONF_MAX_PENDING,
+                                         DEF_MAX_PENDING),  # Commands that may wait to be sent
+                         entity_info.get(CONF_SHED_POLICY,
+                                         DEF_SHED_POLICY),  # What to do when too many are waiting
+                         entity_info.get(CONF_TRANSCEIVER,
+                                         DEF_TRANSCEIVER),  # Transceiver used to send commands
+                         entity_info.get(CONF_MIN_REPETITIONS,
+                                         DEF_MIN_REPETITIONS),  # Fewest adaptive repetitions
+                         entity_info.get(CONF_MAX_REPETITIONS,
+                                         DEF_MAX_REPETITIONS)  # Most adaptive repetitions
                          )
 
         self._venetian_blind_mode = entity_info.get(CONF_VENETIAN_BLIND_MODE)
@@ -90,79 +115,90 @@ class SomfyVenetianBlind(AbstractTiltingCover):
             icon = "mdi:window-shutter"
         else:
             icon = "mdi:window-shutter-open"
-        _LOGGER.debug("Returned icon attribute = " + icon)
         return icon
 
     # Handle tilting a somfy blind. At present this is done by simulating a tilt using
     # an open or close followed by a delay. This needs to be replaced by a number of
-    # tilt operations when supported by RFXCOM
+    # tilt operations when supported by RFXCOM. When the blind must first go to the mid
+    # point, the mid, tilt and stop commands are sent as one pipelined sequence.
 
     async def _async_tilt_blind_to_step(self, steps, target):
         """Callback to tilt the blind to some position"""
-        _LOGGER.info("SOMFY VENETIAN TILTING BLIND")
         if target == 0:
             await self._async_set_cover_position(BLIND_POS_CLOSED)
 
         elif target == 1:
-            # If not already at mid point then move first
+            # If not already at mid point then move there first
             if steps != -1:
-                await self._async_tilt_blind_to_mid_step()
-
-            await self._async_somfy_blind_down()
-            await asyncio.sleep(self._tiltPos1Sec)
-            await self._async_send(self._device.send_command, CMD_SOMFY_STOP)
+                await self._async_tilt_from_mid(self._somfy_down_command(), self._tiltPos1Sec)
+            else:
+                await self._async_send_sequence([(self._somfy_down_command(), 0),
+                                                 (CMD_SOMFY_STOP, self._tiltPos1Sec)])
 
         elif target == 2:
             await self._async_tilt_blind_to_mid_step()
 
         elif target == 3:
-            # If not already at mid point then move first
+            # If not already at mid point then move there first
             if steps != 1:
-                await self._async_tilt_blind_to_mid_step()
-
-            await self._async_somfy_blind_up()
-            await asyncio.sleep(self._tiltPos2Sec)
-            await self._async_send(self._device.send_command, CMD_SOMFY_STOP)
+                await self._async_tilt_from_mid(self._somfy_up_command(), self._tiltPos2Sec)
+            else:
+                await self._async_send_sequence([(self._somfy_up_command(), 0),
+                                                 (CMD_SOMFY_STOP, self._tiltPos2Sec)])
 
         elif target == 4:
             await self._async_set_cover_position(BLIND_POS_CLOSED)
 
         return target
 
+    async def _async_tilt_from_mid(self, command, tiltSecs):
+        """Tilt a Somfy blind to the mid point and then on by a timed move, as one sequence"""
+        await self._set_state(STATE_OPENING, BLIND_POS_CLOSED, self._tilt_step)
+        await self._async_send_pipelined([(CMD_SOMFY_STOP, 0),
+                                          (command, self._blindSyncSecs),
+                                          (CMD_SOMFY_STOP, self._blindSyncSecs + tiltSecs)],
+                                         self._blindSyncSecs, STATE_OPENING,
+                                         STATE_CLOSED, BLIND_POS_CLOSED, self._blindMidSteps)
+
     async def _async_do_close_blind(self):
         """Callback to close a Somfy blind"""
-        _LOGGER.info("SOMFY VENETIAN CLOSING BLIND")
         await self._set_state(STATE_CLOSING, BLIND_POS_CLOSED, self._tilt_step)
         await self._async_somfy_blind_down()
 
     async def _async_do_open_blind(self):
         """Callback to open a Somfy blind"""
-        _LOGGER.info("SOMFY VENETIAN OPENING BLIND")
         await self._async_somfy_blind_up()
 
     async def _async_do_tilt_blind_to_mid(self):
         """Callback to tilt a Somfy blind to mid"""
-        _LOGGER.info("SOMFY VENETIAN TILTING BLIND TO MID")
         await self._set_state(STATE_OPENING, BLIND_POS_CLOSED, self._tilt_step)
-        await self._async_send(self._device.send_command, CMD_SOMFY_STOP)
+        await self._async_send_command(CMD_SOMFY_STOP)
         return self._blindSyncSecs
 
     async def _async_somfy_blind_down(self):
-        """Callback to move a Somfy venetian blind down - varies between regions"""
+        """Callback to move a Somfy venetian blind down"""
+        await self._async_send_command(self._somfy_down_command())
+
+    async def _async_somfy_blind_up(self):
+        """Callback to move a Somfy venetian blind up"""
+        await self._async_send_command(self._somfy_up_command())
+
+    def _somfy_down_command(self):
+        """Return the command to move a Somfy venetian blind down - varies between regions"""
         if self._venetian_blind_mode == CONST_VENETIAN_BLIND_MODE_US:
-            await self._async_send(self._device.send_command, CMD_SOMFY_DOWN05SEC)
+            return CMD_SOMFY_DOWN05SEC
         elif self._venetian_blind_mode == CONST_VENETIAN_BLIND_MODE_EU:
-            await self._async_send(self._device.send_command, CMD_SOMFY_DOWN2SEC)
+            return CMD_SOMFY_DOWN2SEC
         else:
             _LOGGER.warn("Unexpected DOWN command for a none-EU/US device")
-            await self._async_send(self._device.send_command, CMD_SOMFY_DOWN)
+            return CMD_SOMFY_DOWN
 
-    async def _async_somfy_blind_up(self):
-        """Callback to move a Somfy venetian blind up - varies between regions"""
+    def _somfy_up_command(self):
+        """Return the command to move a Somfy venetian blind up - varies between regions"""
         if self._venetian_blind_mode == CONST_VENETIAN_BLIND_MODE_US:
-            await self._async_send(self._device.send_command, CMD_SOMFY_UP05SEC)
+            return CMD_SOMFY_UP05SEC
         elif self._venetian_blind_mode == CONST_VENETIAN_BLIND_MODE_EU:
-            await self._async_send(self._device.send_command, CMD_SOMFY_UP2SEC)
+            return CMD_SOMFY_UP2SEC
         else:
             _LOGGER.warn("Unexpected UP command for a none-EU/US device")
-            await self._async_send(self._device.send_command, CMD_SOMFY_UP)
+            return CMD_SOMFY_UP
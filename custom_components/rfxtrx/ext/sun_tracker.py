@@ -0,0 +1,127 @@
+"""Sun tracking controller for the slats of tilting covers."""
+import logging
+from datetime import timedelta
+import numpy as np
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.util import dt as dt_util
+from .. import (
+    DATA_CLEANUP_CALLBACKS,
+    DOMAIN
+)
+from .const import (
+    DATA_SUN_TRACKER,
+    DEF_SLAT_RATIO,
+    DEF_SUN_HYSTERESIS
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+TRACKING_INTERVAL = timedelta(minutes=5)
+
+
+def solar_position(latitude, longitude, when):
+    """Return the solar azimuth (clockwise from north) and elevation in radians for a UTC time."""
+    when = dt_util.as_utc(when)
+    hours = when.hour + when.minute / 60 + when.second / 3600
+    gamma = 2 * np.pi / 365 * (when.timetuple().tm_yday - 1 + (hours - 12) / 24)
+
+    # NOAA approximations for the equation of time (minutes) and the solar declination (radians)
+    eqtime = 229.18 * (0.000075 + 0.001868 * np.cos(gamma) - 0.032077 * np.sin(gamma)
+                       - 0.014615 * np.cos(2 * gamma) - 0.040849 * np.sin(2 * gamma))
+    decl = (0.006918 - 0.399912 * np.cos(gamma) + 0.070257 * np.sin(gamma)
+            - 0.006758 * np.cos(2 * gamma) + 0.000907 * np.sin(2 * gamma)
+            - 0.002697 * np.cos(3 * gamma) + 0.00148 * np.sin(3 * gamma))
+
+    solar_minutes = hours * 60 + eqtime + 4 * longitude
+    hour_angle = np.radians(solar_minutes / 4 - 180)
+    lat = np.radians(latitude)
+
+    elevation = np.arcsin(np.sin(lat) * np.sin(decl) +
+                          np.cos(lat) * np.cos(decl) * np.cos(hour_angle))
+    azimuth = np.arctan2(np.sin(hour_angle),
+                         np.cos(hour_angle) * np.sin(lat) - np.tan(decl) * np.cos(lat)) + np.pi
+    return azimuth, elevation
+
+
+def slat_steps(azimuth, elevation, facades, ratios, midSteps):
+    """Return the fractional tilt step for each facade that just blocks direct sun."""
+    relative = azimuth - facades
+    facing = (np.cos(relative) > 0) & (elevation > 0)
+
+    # Profile angle is the elevation of the sun projected onto the plane normal to the facade. The slat
+    # angle that just cuts off direct light follows from the slat spacing to width ratio.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        profile = np.arctan(np.tan(elevation) / np.cos(relative))
+        cutoff = np.arcsin(np.clip(ratios * np.cos(profile), -1, 1)) - profile
+    cutoff = np.where(facing, np.clip(cutoff, 0, np.pi / 2), 0)
+
+    # Horizontal slats are the mid step. Turning them fully against the sun is step 0
+    return midSteps * (1 - cutoff / (np.pi / 2))
+
+
+# Keeps the slats of enrolled covers turned just far enough to block direct sun. Every few minutes the
+# sun position is worked out once and the slat angle for every enrolled facade is found in one pass
+# over arrays of the covers' facades, step tables and current steps. A cover is only commanded when
+# the ideal step has moved more than half a step plus its hysteresis band away from the step it is at,
+# so small changes in the sun never produce commands and covers do not hunt between two steps.
+#
+# Only covers that are lowered into the window are adjusted. A raised cover is left alone rather than
+# being lowered to set its tilt.
+class SunTracker:
+    """Drive the tilt of enrolled covers from the position of the sun."""
+
+    def __init__(self, hass):
+        self._hass = hass
+        self._covers = {}
+        self._cancel = None
+
+    def enable(self, cover, facade, hysteresis=DEF_SUN_HYSTERESIS, ratio=DEF_SLAT_RATIO):
+        """Enrol a cover whose window faces the given azimuth in degrees."""
+        self._covers[cover.entity_id] = (cover, np.radians(facade), hysteresis, ratio)
+        if self._cancel is None:
+            self._cancel = async_track_time_interval(
+                self._hass, self._async_track, TRACKING_INTERVAL)
+        self._hass.async_create_task(self._async_track(dt_util.utcnow()))
+
+    def disable(self, cover):
+        """Stop tracking the sun with a cover."""
+        self._covers.pop(cover.entity_id, None)
+        if not self._covers:
+            self.async_stop()
+
+    def async_stop(self):
+        """Stop the tracking timer."""
+        if self._cancel is not None:
+            self._cancel()
+            self._cancel = None
+
+    async def _async_track(self, now):
+        if not self._covers:
+            return
+
+        covers = [entry[0] for entry in self._covers.values()]
+        facades = np.fromiter((entry[1] for entry in self._covers.values()), float, len(covers))
+        bands = np.fromiter((entry[2] for entry in self._covers.values()), float, len(covers))
+        ratios = np.fromiter((entry[3] for entry in self._covers.values()), float, len(covers))
+        mids = np.fromiter((cover._blindMidSteps for cover in covers), float, len(covers))
+        maxes = np.fromiter((cover._blindMaxSteps for cover in covers), float, len(covers))
+        current = np.fromiter((cover._tilt_step for cover in covers), float, len(covers))
+        lowered = np.fromiter((cover._sun_trackable() for cover in covers), bool, len(covers))
+
+        azimuth, elevation = solar_position(
+            self._hass.config.latitude, self._hass.config.longitude, now)
+        ideal = slat_steps(azimuth, elevation, facades, ratios, mids)
+        target = np.clip(np.rint(ideal), 0, maxes)
+        change = lowered & (np.abs(ideal - current) > 0.5 + bands) & (target != current)
+
+        for index in np.flatnonzero(change):
+            self._hass.async_create_task(
+                covers[index]._async_track_sun_step(int(target[index])))
+
+
+def async_setup_sun_tracker(hass):
+    """Create the sun tracker for the covers."""
+    tracker = SunTracker(hass)
+    hass.data[DOMAIN][DATA_SUN_TRACKER] = tracker
+    hass.data[DOMAIN][DATA_CLEANUP_CALLBACKS].append(tracker.async_stop)
+    return tracker
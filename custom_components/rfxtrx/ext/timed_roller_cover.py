@@ -0,0 +1,213 @@
+import logging
+import time
+from homeassistant.components.cover import (
+    ATTR_TILT_POSITION,
+    SUPPORT_CLOSE,
+    SUPPORT_OPEN,
+    SUPPORT_STOP,
+    SUPPORT_SET_POSITION
+)
+from homeassistant.const import (
+    STATE_CLOSED,
+    STATE_CLOSING,
+    STATE_OPEN,
+    STATE_OPENING
+)
+from homeassistant.components.rfxtrx import CONF_SIGNAL_REPETITIONS
+from .abs_tilting_cover import (
+    AbstractTiltingCover,
+    BLIND_POS_CLOSED,
+    BLIND_POS_OPEN,
+    BLIND_POS_STOPPED,
+    planned_operation
+)
+from .flight_recorder import (
+    EVENT_IGNORED,
+    EVENT_SERVICE
+)
+from .somfy_venetian_blind import SOMFY_MIN_COMMAND_GAP_SEC
+from .const import (
+    CONF_CLOSE_SECONDS,
+    CONF_OPEN_SECONDS,
+    CONF_MAX_PENDING,
+    CONF_MAX_REPETITIONS,
+    CONF_MIN_REPETITIONS,
+    CONF_SHED_POLICY,
+    CONF_TRANSCEIVER,
+    DEF_CLOSE_SECONDS,
+    DEF_MAX_PENDING,
+    DEF_MAX_REPETITIONS,
+    DEF_MIN_REPETITIONS,
+    DEF_SHED_POLICY,
+    DEF_TRANSCEIVER,
+    DEF_OPEN_SECONDS,
+    DEVICE_PACKET_TYPE_BLINDS1,
+    DEVICE_PACKET_TYPE_RFY
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+DEVICE_TYPE = "Timed Roller"
+
+CMD_RFY_STOP = 0x00
+CMD_RFY_UP = 0x01
+CMD_RFY_DOWN = 0x03
+
+CMD_BLINDS1_OPEN = 0x00
+CMD_BLINDS1_CLOSE = 0x01
+CMD_BLINDS1_STOP = 0x02
+
+# Up, down and stop commands for each packet type
+ROLLER_COMMANDS = {
+    DEVICE_PACKET_TYPE_RFY: (CMD_RFY_UP, CMD_RFY_DOWN, CMD_RFY_STOP),
+    DEVICE_PACKET_TYPE_BLINDS1: (CMD_BLINDS1_OPEN, CMD_BLINDS1_CLOSE, CMD_BLINDS1_STOP)
+}
+
+
+# Roller shutters and blinds with no slats, driven as RFY in standard mode or as Blinds T0 to T18. The
+# motors only know up, down and stop, so a position part way is reached by running the motor for the
+# share of its full travel time and then stopping it, with the stop queued with the transmitter at its
+# offset from the start. The position is tracked from those timings. Moves to fully open or closed
+# leave the motor to stop itself at the end of its travel, which also corrects any drift in the
+# tracked position.
+class TimedRollerCover(AbstractTiltingCover):
+    """Representation of a RFXtrx roller positioned by timing."""
+
+    def __init__(self, device, device_id, entity_info, event=None):
+        device.type_string = DEVICE_TYPE
+        super().__init__(device, device_id,
+                         entity_info[CONF_SIGNAL_REPETITIONS], event,
+                         1,  # No slats, a single step stands in for them
+                         False,  # Does not support mid point
+                         True,  # Supports lift
+                         True,  # Lift on open
+                         False,  # Does not require sync on mid point
+                         entity_info.get(CONF_OPEN_SECONDS,
+                                         DEF_OPEN_SECONDS),  # Open time
+                         entity_info.get(CONF_CLOSE_SECONDS,
+                                         DEF_CLOSE_SECONDS),  # Close time
+                         0,  # Sync time ms
+                         0,  # Ms for each step
+                         entity_info.get(CONF_MAX_PENDING,
+                                         DEF_MAX_PENDING),  # Commands that may wait to be sent
+                         entity_info.get(CONF_SHED_POLICY,
+                                         DEF_SHED_POLICY),  # What to do when too many are waiting
+                         entity_info.get(CONF_TRANSCEIVER,
+                                         DEF_TRANSCEIVER),  # Transceiver used to send commands
+                         entity_info.get(CONF_MIN_REPETITIONS,
+                                         DEF_MIN_REPETITIONS),  # Fewest adaptive repetitions
+                         entity_info.get(CONF_MAX_REPETITIONS,
+                                         DEF_MAX_REPETITIONS)  # Most adaptive repetitions
+                         )
+
+        self._upCommand, self._downCommand, self._stopCommand = ROLLER_COMMANDS[device.packettype]
+        if device.packettype == DEVICE_PACKET_TYPE_RFY:
+            self.MIN_COMMAND_GAP_SEC = SOMFY_MIN_COMMAND_GAP_SEC
+        _LOGGER.debug("Create timed roller %s", device_id)
+
+    @property
+    def icon(self):
+        """Return the icon property."""
+        if self.is_opening or self.is_closing:
+            icon = "mdi:window-shutter-alert"
+        elif self.is_closed:
+            icon = "mdi:window-shutter"
+        else:
+            icon = "mdi:window-shutter-open"
+        return icon
+
+    @property
+    def supported_features(self):
+        """Flag supported features."""
+        return SUPPORT_CLOSE | SUPPORT_OPEN | SUPPORT_STOP | SUPPORT_SET_POSITION
+
+    # Rollers have no slats, so tilt requests are ignored rather than being turned into moves. A position
+    # given together with a tilt is still applied.
+
+    @planned_operation
+    async def async_open_cover_tilt(self, **kwargs):
+        """Rollers have no tilt."""
+        self._recorder.record(EVENT_IGNORED, "no tilt", "open_cover_tilt")
+
+    @planned_operation
+    async def async_close_cover_tilt(self, **kwargs):
+        """Rollers have no tilt."""
+        self._recorder.record(EVENT_IGNORED, "no tilt", "close_cover_tilt")
+
+    async def async_set_cover_tilt_position(self, **kwargs):
+        """Rollers have no tilt."""
+        self._recorder.record(EVENT_IGNORED, "no tilt", "set_cover_tilt_position")
+
+    @planned_operation
+    async def async_increase_cover_tilt(self, **kwargs):
+        """Rollers have no tilt."""
+        self._recorder.record(EVENT_IGNORED, "no tilt", "increase_cover_tilt")
+
+    @planned_operation
+    async def async_decrease_cover_tilt(self, **kwargs):
+        """Rollers have no tilt."""
+        self._recorder.record(EVENT_IGNORED, "no tilt", "decrease_cover_tilt")
+
+    @planned_operation
+    async def async_set_cover_position_and_tilt(self, **kwargs):
+        """Move the roller to a position, ignoring any tilt."""
+        kwargs.pop(ATTR_TILT_POSITION, None)
+        await AbstractTiltingCover.async_set_cover_position_and_tilt.__wrapped__(self, **kwargs)
+
+    # Stops the roller where it is, working out how far it got from the timing of the motion. The
+    # operation under way is cancelled so that the stop it queued is not sent a second time.
+
+    async def async_stop_cover(self, **kwargs):
+        """Stop the cover."""
+        self._recorder.record(EVENT_SERVICE, "stop_cover")
+
+        if self._state != STATE_OPENING and self._state != STATE_CLOSING:
+            self._recorder.record(EVENT_IGNORED, "blind is stationary")
+            return
+
+        if self._motion is None:
+            position = BLIND_POS_STOPPED
+        else:
+            position = self.estimated_motion(time.monotonic())[0]
+        await self._async_preempt()
+        await self._async_do_stop_blind()
+        await self._set_state(STATE_CLOSED if position <= BLIND_POS_CLOSED else STATE_OPEN, position, 0)
+
+    async def _async_set_cover_position(self, position):
+        """Move the roller to a position by running the motor for the time it takes to get there."""
+        if not self._blind_is_stationary():
+            return
+
+        current = self._lift_position
+        if position == current and BLIND_POS_CLOSED < position < BLIND_POS_OPEN:
+            self._recorder.record(EVENT_IGNORED, "already at position")
+            return
+
+        if position > current or position == BLIND_POS_OPEN:
+            movement = STATE_OPENING
+            command = self._upCommand
+            delay = (position - current) / BLIND_POS_OPEN * self._blindOpenSecs
+        else:
+            movement = STATE_CLOSING
+            command = self._downCommand
+            delay = (current - position) / BLIND_POS_OPEN * self._blindCloseSecs
+        newState = STATE_CLOSED if position == BLIND_POS_CLOSED else STATE_OPEN
+
+        await self._set_state(movement, current, 0)
+        if position in (BLIND_POS_OPEN, BLIND_POS_CLOSED):
+            await self._async_send_command(command)
+            await self._wait_and_set_state(delay, movement, newState, position, 0)
+        else:
+            await self._async_send_pipelined([(command, 0), (self._stopCommand, delay)],
+                                             delay, movement, newState, position, 0)
+
+    async def _async_do_stop_blind(self):
+        """Callback to stop the blind"""
+        await self._async_send_command(self._stopCommand)
+
+    def _reported_position(self, lift, tilt_step):
+        return lift
+
+    def _reported_tilt(self, state, tilt_step):
+        # Rollers have no tilt
+        return None
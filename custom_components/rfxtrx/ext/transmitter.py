@@ -0,0 +1,376 @@
+"""Transmit queue for RFXtrx commands."""
+import asyncio
+import collections
+import logging
+import time
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_call_later
+from .airtime import (
+    AirtimeTimeline,
+    airtime
+)
+from .const import (
+    CONST_SHED_POLICY_SUPERSEDE,
+    DEF_MAX_PENDING,
+    DEF_SHED_POLICY,
+    SIGNAL_TRANSMITTER_STATE
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Most frames that may wait for the transceiver before new commands are refused
+TRANSMIT_QUEUE_SIZE = 64
+
+# Frames that have waited longer than this are no longer relevant and are dropped
+STALE_FRAME_SEC = 30
+
+# How long the transmitter reports itself unavailable after a failed write
+FAILED_RETRY_SEC = 30
+
+
+class TransmitterSaturated(HomeAssistantError):
+    """Error to indicate the transmit queue cannot take more commands."""
+
+
+class CommandShed(HomeAssistantError):
+    """Error to indicate a queued command was dropped before it was sent."""
+
+
+# Stands in for the transport while a device builds a packet so that the encoded bytes can be kept
+class _FrameCapture:
+    def __init__(self):
+        self.data = None
+
+    def send(self, data):
+        self.data = bytes(data)
+
+
+class _QueuedFrame:
+    __slots__ = ("device", "data", "future", "queued", "sequence", "offset", "notBefore")
+
+    def __init__(self, device, data, future, sequence=None, offset=0):
+        self.device = device
+        self.data = data
+        self.future = future
+        self.queued = time.monotonic()
+        self.sequence = sequence
+        self.offset = offset
+        self.notBefore = self.queued
+
+
+# Frames of a sequence are queued together. The first is written as soon as the writer gets to it and
+# the rest are held until their offset from the time the first went on air. onAir stays None until
+# then, and until it is set the sequence can still be shed as a whole. start is when the first frame
+# was expected on air when the sequence's airtime was reserved.
+class _Sequence:
+    __slots__ = ("first", "future", "onAir", "remaining", "start")
+
+    def __init__(self, future, remaining):
+        self.first = None
+        self.future = future
+        self.onAir = None
+        self.remaining = remaining
+        self.start = None
+
+
+# A single writer task owns the transport. Commands are encoded once per (device, command) and each
+# frame is written with all of its repetitions in one go. Frames that queue up while a write is in
+# progress are written together, so a burst of commands costs one executor hop rather than one per
+# repetition of every command.
+#
+# The queue is bounded both overall and per device. When a device is over its budget the oldest of
+# its queued frames is either superseded by the new one or the new one is refused, depending on the
+# device's shed policy. Frames that have waited too long are dropped rather than sent late.
+#
+# A sequence is queued in one go rather than frame by frame as its offsets come round. Later frames
+# are timed from when the first went on air, estimated from the end of its write plus the airtime of
+# the frames written ahead of it, so queueing and executor delays before the first frame do not
+# shorten the gaps the motor sees. A sequence counts as one command against the device's budget.
+#
+# Sequences from several blinds share one AirtimeTimeline. When a sequence is queued the airtime
+# of each of its frames is reserved at its offset, and the whole sequence is moved later until none of
+# its frames overlaps a frame reserved by another, so the STOP of one Somfy tilt is not held up on air
+# behind the DOWN of the next and every blind stops after the time it was given. Single commands are
+# written in the gaps, waiting for the end of a reserved frame rather than delaying it.
+#
+# Priority frames skip the limits and go ahead of everything else in the next write. flush drops all
+# that is queued for a device, including what is left of a sequence that has started.
+#
+# While the profiler is running, timings collects the queue wait, executor wait and write time of each
+# write. Otherwise it is None and nothing is measured.
+class RfxtrxTransmitter:
+    """Queue and write RFXtrx frames from a single task."""
+
+    def __init__(self, hass, transport):
+        self._hass = hass
+        self.transport = transport
+        self._frames = {}
+        self._pending = collections.deque()
+        self._urgent = collections.deque()
+        self._wakeup = asyncio.Event()
+        self._task = None
+        self._timeline = AirtimeTimeline()
+        self._busyUntil = 0
+        self._saturated = False
+        self._failed = False
+        self._retryCancel = None
+        self.timings = None
+
+    @property
+    def available(self):
+        """Return true if the transmitter can currently accept commands."""
+        return not (self._saturated or self._failed)
+
+    def encode(self, key, fun, *args):
+        """Return the bytes for a command, building them on first use."""
+        frame = self._frames.get(key)
+        if frame is None:
+            capture = _FrameCapture()
+            fun(capture, *args)
+            frame = capture.data
+            self._frames[key] = frame
+        return frame
+
+    async def async_send(self, key, repetitions, fun, *args,
+                         max_pending=DEF_MAX_PENDING, shed_policy=DEF_SHED_POLICY, priority=False):
+        """Queue a command and wait until it has been written."""
+        frame = self.encode(key, fun, *args)
+        await self._async_queue(key[0], frame * repetitions, max_pending, shed_policy, priority)
+
+    async def async_send_sequence(self, device, frames,
+                                  max_pending=DEF_MAX_PENDING, shed_policy=DEF_SHED_POLICY):
+        """Write frames at offsets in seconds from when the first goes on air."""
+        if not frames:
+            return
+        self._admit(device, len(frames), max_pending, shed_policy)
+
+        sequence = _Sequence(self._hass.loop.create_future(), len(frames))
+        origin = frames[0][1]
+        sequence.start = self._reserve(sequence, [(offset - origin, airtime(data))
+                                                  for data, offset in frames])
+        for data, offset in frames:
+            frame = _QueuedFrame(device, data, sequence.future, sequence, offset - origin)
+            if sequence.first is None:
+                sequence.first = frame
+                frame.notBefore = sequence.start
+            self._pending.append(frame)
+        self._start_writer()
+
+        await sequence.future
+
+    async def _async_queue(self, device, data, max_pending, shed_policy, priority=False):
+        future = self._hass.loop.create_future()
+        if priority:
+            self._urgent.append(_QueuedFrame(device, data, future))
+        else:
+            self._admit(device, 1, max_pending, shed_policy)
+            self._pending.append(_QueuedFrame(device, data, future))
+        self._start_writer()
+
+        await future
+
+    def flush(self, device, reason="preempted"):
+        """Drop everything queued for a device."""
+        for frame in [frame for frame in self._pending if frame.device == device]:
+            if frame in self._pending:
+                self._shed(frame, reason)
+        self._set_saturated(len(self._pending) >= TRANSMIT_QUEUE_SIZE)
+
+    async def async_flush(self, device, reason="preempted"):
+        """Drop everything queued for a device, returning once it has been dropped."""
+        self.flush(device, reason)
+
+    def _reserve(self, sequence, spans):
+        """Reserve airtime for frames at offsets, returning the earliest start at which none overlaps."""
+        now = time.monotonic()
+        # Leave room for the single commands already waiting
+        earliest = max(now, self._busyUntil) + sum(airtime(frame.data) for frame in self._pending
+                                                    if frame.sequence is None)
+        return self._timeline.reserve(sequence, spans, earliest, now)
+
+    def _admit(self, device, size, max_pending, shed_policy):
+        queued = self._waiting_commands(device)
+        if len(queued) >= max_pending:
+            if shed_policy != CONST_SHED_POLICY_SUPERSEDE:
+                raise TransmitterSaturated(
+                    "Too many commands waiting for device " + str(device))
+            self._shed(queued[0], "superseded by a newer command")
+
+        if len(self._pending) + size > TRANSMIT_QUEUE_SIZE:
+            self._set_saturated(True)
+            raise TransmitterSaturated("RFXtrx transmit queue is full")
+
+    def _waiting_commands(self, device):
+        """Return the frames and sequences for a device that have not started going out."""
+        commands = []
+        for frame in self._pending:
+            if frame.device != device:
+                continue
+            if frame.sequence is None:
+                commands.append(frame)
+            elif frame is frame.sequence.first:
+                commands.append(frame)
+        return commands
+
+    def _start_writer(self):
+        self._wakeup.set()
+        if self._task is None:
+            self._task = self._hass.loop.create_task(self._async_writer())
+
+    def _ready(self, frame):
+        """Return when a frame may be written, or None while it waits for its sequence to start."""
+        sequence = frame.sequence
+        if sequence is None or frame is sequence.first:
+            return frame.notBefore
+        if sequence.onAir is None:
+            return None
+        return sequence.onAir + frame.offset
+
+    def async_stop(self):
+        """Stop the writer and cancel anything still queued."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+        if self._retryCancel is not None:
+            self._retryCancel()
+            self._retryCancel = None
+
+        for frame in list(self._urgent) + list(self._pending):
+            if not frame.future.done():
+                frame.future.cancel()
+        self._urgent.clear()
+        self._pending.clear()
+        self._timeline.clear()
+
+    def _shed(self, frame, reason):
+        self._drop(frame)
+        _LOGGER.info("Dropped command for device %s, %s", frame.device, reason)
+        if not frame.future.done():
+            frame.future.set_exception(
+                CommandShed("Command for device " + str(frame.device) + " " + reason))
+
+    def _drop(self, frame):
+        """Remove a frame from the queue, along with the rest of its sequence."""
+        if frame.sequence is None:
+            self._pending.remove(frame)
+        else:
+            self._pending = collections.deque(
+                queued for queued in self._pending if queued.sequence is not frame.sequence)
+            self._timeline.release(frame.sequence)
+
+    def _set_saturated(self, saturated):
+        if self._saturated != saturated:
+            self._saturated = saturated
+            async_dispatcher_send(self._hass, SIGNAL_TRANSMITTER_STATE)
+
+    def _set_failed(self, failed):
+        if self._retryCancel is not None:
+            self._retryCancel()
+            self._retryCancel = None
+
+        if failed:
+            self._retryCancel = async_call_later(
+                self._hass, FAILED_RETRY_SEC, self._async_retry)
+
+        if self._failed != failed:
+            self._failed = failed
+            async_dispatcher_send(self._hass, SIGNAL_TRANSMITTER_STATE)
+
+    async def _async_retry(self, _now):
+        self._retryCancel = None
+        self._set_failed(False)
+
+    async def _async_writer(self):
+        while True:
+            await self._async_wait()
+
+            now = time.monotonic()
+            for frame in [frame for frame in self._pending
+                          if self._ready(frame) is not None and now - self._ready(frame) > STALE_FRAME_SEC]:
+                if frame in self._pending:
+                    self._shed(frame, "was not sent within " +
+                               str(STALE_FRAME_SEC) + " seconds")
+
+            batch = list(self._urgent)
+            self._urgent.clear()
+            cursor = max(now, self._busyUntil) + sum(airtime(frame.data) for frame in batch)
+            held = collections.deque()
+            for frame in self._pending:
+                ready = self._ready(frame)
+                if ready is None or ready > now:
+                    held.append(frame)
+                    continue
+                # A single command that would still be on air when a reserved frame is due waits for it
+                if frame.sequence is None:
+                    end = self._timeline.clash(cursor, airtime(frame.data))
+                    if end is not None:
+                        frame.notBefore = end
+                        held.append(frame)
+                        continue
+                batch.append(frame)
+                cursor += airtime(frame.data)
+            self._pending = held
+            self._set_saturated(len(self._pending) >= TRANSMIT_QUEUE_SIZE)
+            if not batch:
+                continue
+
+            data = b"".join(frame.data for frame in batch)
+            try:
+                if self.timings is None:
+                    await self._hass.async_add_executor_job(self.transport.send, data)
+                else:
+                    submitted = time.monotonic()
+                    started, finished = await self._hass.async_add_executor_job(self._timed_send, data)
+                    self.timings.append((submitted - min(self._ready(frame) for frame in batch),
+                                         started - submitted, finished - started))
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.error("Failed to write to RFXtrx: %s", err)
+                self._set_failed(True)
+                for frame in batch:
+                    if frame.sequence is not None:
+                        self._drop(frame)
+                    if not frame.future.done():
+                        frame.future.set_exception(
+                            HomeAssistantError("Failed to write to RFXtrx: " + str(err)))
+            else:
+                self._set_failed(False)
+                onAir = max(time.monotonic(), self._busyUntil)
+                for frame in batch:
+                    sequence = frame.sequence
+                    if sequence is not None:
+                        if sequence.onAir is None:
+                            sequence.onAir = onAir
+                            self._timeline.shift(sequence, onAir - sequence.start)
+                        sequence.remaining -= 1
+                        if sequence.remaining == 0:
+                            self._timeline.release(sequence)
+                    if (sequence is None or sequence.remaining == 0) and not frame.future.done():
+                        frame.future.set_result(None)
+                    onAir += airtime(frame.data)
+                self._busyUntil = onAir
+
+    # Waits to be woken by a new frame, or until the next held frame of a sequence is due
+    async def _async_wait(self):
+        if not self._urgent:
+            due = [ready for ready in map(self._ready, self._pending) if ready is not None]
+            if not due:
+                await self._wakeup.wait()
+            else:
+                delay = min(due) - time.monotonic()
+                if delay > 0:
+                    waiter = self._hass.loop.create_task(self._wakeup.wait())
+                    sleeper = self._hass.loop.create_task(asyncio.sleep(delay))
+                    try:
+                        await asyncio.wait({waiter, sleeper}, return_when=asyncio.FIRST_COMPLETED)
+                    finally:
+                        waiter.cancel()
+                        sleeper.cancel()
+        self._wakeup.clear()
+
+    # Used in place of transport.send while the profiler is collecting timings
+    def _timed_send(self, data):
+        started = time.monotonic()
+        self.transport.send(data)
+        return started, time.monotonic()